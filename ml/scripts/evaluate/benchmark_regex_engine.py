@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmark for the regex prefilter engine.
+
+Compares RegexNerAdapter with and without prefilters, and the composite
+false-positive filter as a pattern loop vs a single merged alternation,
+on the adversarial test corpus. Also checks that both paths return the
+same detections.
+
+Usage:
+    PYTHONPATH=src python ml/scripts/evaluate/benchmark_regex_engine.py
+"""
+
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+
+# Add parent to path for imports
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from test_ner_predictor_adversarial_v2 import ADVERSARIAL_TESTS
+
+from contextsafe.infrastructure.nlp.composite_adapter import (
+    _FALSE_POSITIVE_ANY,
+    FALSE_POSITIVE_PATTERNS,
+)
+from contextsafe.infrastructure.nlp.regex_adapter import RegexNerAdapter
+
+
+REPEATS = 20
+
+
+def _key(detection):
+    return (
+        detection.category,
+        detection.value,
+        detection.span.start,
+        detection.span.end,
+        detection.confidence.value,
+    )
+
+
+async def _time_adapter(adapter: RegexNerAdapter, texts: list[str]) -> tuple[float, list]:
+    results = []
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        results = [await adapter.detect_entities(text) for text in texts]
+    elapsed = (time.perf_counter() - start) / REPEATS
+    return elapsed, [[_key(d) for d in dets] for dets in results]
+
+
+async def main() -> None:
+    texts = [test["text"] for test in ADVERSARIAL_TESTS]
+    document = "\n\n".join(texts)
+
+    full = RegexNerAdapter(use_prefilters=False)
+    fast = RegexNerAdapter()
+
+    print(f"Corpus: {len(texts)} texts, {sum(len(t) for t in texts)} chars")
+    print(f"Prefiltered patterns: {(await fast.get_model_info())['prefiltered_patterns']}")
+    print()
+
+    for label, corpus in [("per text", texts), ("whole document", [document])]:
+        t_full, r_full = await _time_adapter(full, corpus)
+        t_fast, r_fast = await _time_adapter(fast, corpus)
+        assert r_full == r_fast, f"Detections differ ({label})"
+        print(
+            f"RegexNerAdapter {label:>15}: {t_full * 1000:8.2f} ms -> {t_fast * 1000:8.2f} ms "
+            f"({t_full / t_fast:.1f}x)"
+        )
+
+    values = [d[1] for dets in r_full for d in dets] * 50
+
+    start = time.perf_counter()
+    loop_hits = [any(p.match(v) for p in FALSE_POSITIVE_PATTERNS) for v in values]
+    t_loop = time.perf_counter() - start
+
+    start = time.perf_counter()
+    merged_hits = [bool(_FALSE_POSITIVE_ANY.match(v)) for v in values]
+    t_merged = time.perf_counter() - start
+
+    assert loop_hits == merged_hits, "False-positive filter differs"
+    print(
+        f"False-positive filter ({len(values)} values): {t_loop * 1000:8.2f} ms -> "
+        f"{t_merged * 1000:8.2f} ms ({t_loop / t_merged:.1f}x)"
+    )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
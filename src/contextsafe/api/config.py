@@ -108,6 +108,25 @@ class Settings(BaseSettings):
     ner_model: str = "MMG/xlm-roberta-large-ner-spanish"
     ner_min_score: float = 0.85
     ner_device: int = -1  # -1 = CPU, 0+ = GPU index
+    ner_batch_size: int = 8  # Chunks per RoBERTa forward pass (1 = no batching)
+    ner_max_batch_size: int = 32  # Max chunks per forward pass across documents
+    ner_max_wait_ms: float = 10.0  # Max wait for other documents to join a batch
+    ner_chunking: str = "tokens"  # "tokens" (exact token windows) or "chars" (legacy)
+    ner_backend: str = "torch"  # "torch" (transformers) or "onnx" (onnxruntime CPU)
+    ner_onnx_dir: Path = Path("ml/models/legal_ner_v2_onnx")
+    ner_onnx_quantized: bool = True  # Load the int8 graph
+    ner_embedding_cache_size: int = 20000  # Entity embeddings kept in memory
+    ner_embedding_cache_path: Path | None = None  # SQLite store (None = memory only)
+    ner_detection_cache_mb: int = 64  # Cached NER results per text and config (0 = disabled)
+    ner_detection_cache_path: Path | None = None  # SQLite store (None = memory only)
+    ner_workers: int = 0  # NER worker processes, each with its own models (0 = in-process)
+    ner_torch_threads: int = 0  # torch intra-op threads per worker process (0 = torch default)
+
+    # ============================================
+    # Document processing queue
+    # ============================================
+    processing_workers: int = 2  # Documents through the pipeline at once
+    processing_max_queued: int = 500  # Queued documents before submissions get 429
 
     # ============================================
     # Observability
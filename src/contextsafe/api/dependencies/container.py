@@ -11,9 +11,11 @@ from __future__ import annotations
 
 from collections.abc import AsyncIterator
 from functools import lru_cache
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from contextsafe.application.compute_mode import ComputeMode
 from contextsafe.application.ports import (
     AnonymizationService,
     DetectionPreprocessor,
@@ -28,6 +30,10 @@ from contextsafe.application.ports import (
 from contextsafe.infrastructure.persistence import Database
 
 
+if TYPE_CHECKING:
+    from contextsafe.infrastructure.nlp import DetectionCache
+
+
 class Container:
     """
     Dependency injection container.
@@ -41,6 +47,8 @@ class Container:
         """Initialize the container."""
         self._database: Database | None = None
         self._ner_service: NerService | None = None
+        # Kept across NER service rebuilds (keys include the NER configuration)
+        self._detection_cache: DetectionCache | None = None
         self._anonymization_service: AnonymizationService | None = None
         self._event_publisher: EventPublisher | None = None
         self._text_extractor: TextExtractor | None = None
@@ -87,6 +95,13 @@ class Container:
 
     def reset_ner_service(self) -> None:
         """Reset NER service (e.g., after compute mode change). Reinitializes on next access."""
+        from contextsafe.infrastructure.nlp import CachedNerAdapter, ProcessPoolNerAdapter
+
+        service = self._ner_service
+        if isinstance(service, CachedNerAdapter):
+            service = service.inner
+        if isinstance(service, ProcessPoolNerAdapter):
+            service.shutdown()
         self._ner_service = None
 
     @property
@@ -96,55 +111,227 @@ class Container:
             self._ner_service = self._create_ner_service()
         return self._ner_service
 
-    @staticmethod
-    def _create_ner_service() -> NerService:
-        """Create comprehensive NER service with compute mode detection."""
+    def _create_ner_service(self) -> NerService:
+        """
+        Create the NER service: in-process, or in worker processes if NER_WORKERS > 0.
+
+        Wrapped in a detection result cache unless NER_DETECTION_CACHE_MB is 0.
+        """
+        from functools import partial
         from pathlib import Path
 
+        from contextsafe.api.config import get_settings
         from contextsafe.api.services.compute_state import get_effective_compute_mode
-        from contextsafe.application.compute_mode import ComputeMode
+        from contextsafe.infrastructure.nlp import (
+            CachedNerAdapter,
+            DetectionCache,
+            ProcessPoolNerAdapter,
+        )
+
+        settings = get_settings()
+        config = Container._composite_ner_config(get_effective_compute_mode())
+        if settings.ner_workers <= 0:
+            ner_service = Container._create_composite_ner_service(config)
+        else:
+            print(
+                f"[NER] Multi-process mode: {settings.ner_workers} workers, "
+                f"torch threads per worker: {settings.ner_torch_threads or 'default'}"
+            )
+            ner_service = ProcessPoolNerAdapter(
+                factory=partial(Container._create_composite_ner_service, config),
+                workers=settings.ner_workers,
+                torch_threads=settings.ner_torch_threads,
+            )
+
+        if settings.ner_detection_cache_mb <= 0:
+            return ner_service
+        if self._detection_cache is None:
+            cache_path = settings.ner_detection_cache_path
+            if cache_path is not None and not cache_path.is_absolute():
+                cache_path = Path(__file__).parent.parent.parent.parent / cache_path
+            self._detection_cache = DetectionCache(
+                max_bytes=settings.ner_detection_cache_mb * 1024 * 1024,
+                db_path=cache_path,
+            )
+        return CachedNerAdapter(
+            ner_service,
+            self._detection_cache,
+            Container._ner_fingerprint(config),
+        )
+
+    @staticmethod
+    def _composite_ner_config(compute_mode: ComputeMode) -> dict[str, Any]:
+        """
+        Values the composite NER service is built from.
+
+        Only values that change detections (adapters, models, thresholds,
+        validator); batching and cache sizes are read from settings at build
+        time. The detection cache fingerprint is derived from this config.
+        """
+        from pathlib import Path
+
+        from contextsafe.api.config import get_settings
+        from contextsafe.infrastructure.nlp.validators.entity_type_validator import (
+            DEFAULT_CENTROIDS_PATH,
+        )
+
+        settings = get_settings()
+        project_root = Path(__file__).parent.parent.parent.parent
+
+        onnx_dir = settings.ner_onnx_dir
+        if not onnx_dir.is_absolute():
+            onnx_dir = project_root / onnx_dir
+
+        if settings.ner_backend == "onnx" and onnx_dir.exists():
+            roberta = {
+                "backend": "onnx",
+                "model_dir": onnx_dir,
+                "quantized": settings.ner_onnx_quantized,
+                "min_score": 0.85,
+            }
+        else:
+            # Priority: local trained model v2 > HuggingFace fallback
+            local_model_path = project_root / "ml" / "models" / "legal_ner_v2"
+            local = local_model_path.exists()
+            roberta = {
+                "backend": "torch",
+                "model_name": (
+                    str(local_model_path) if local else "MMG/xlm-roberta-large-ner-spanish"
+                ),
+                "local_files_only": not local,
+                "min_score": 0.85,
+                "device": 0 if compute_mode == ComputeMode.GPU else -1,
+                "chunking": settings.ner_chunking,
+            }
+
+        return {
+            "roberta": roberta,
+            "spacy": {"model_name": "es_core_news_lg", "confidence_default": 0.85},
+            "regex": {},
+            "composite": {
+                "dedup_overlap_threshold": 0.8,
+                "tie_threshold": 0.3,
+                "enable_normalization": True,
+                "enable_type_validation": True,
+            },
+            "validator": {
+                "model_name": "intfloat/multilingual-e5-large",
+                "centroids_path": DEFAULT_CENTROIDS_PATH,
+                "reclassify_threshold": 0.75,
+                "margin_threshold": 0.10,
+                "hitl_margin": 0.05,
+                "context_window": 50,
+            },
+        }
+
+    @staticmethod
+    def _ner_fingerprint(config: dict[str, Any]) -> str:
+        """
+        Identify everything that changes NER results (detection cache key part).
+
+        The composite config plus when the model and centroid files last
+        changed, the installed spaCy model version and the code version.
+        """
+        import json
+        from importlib import metadata
+        from pathlib import Path
+
+        from contextsafe import __version__
+
+        def modified(path: Path) -> float | None:
+            if path.is_dir():
+                return max((f.stat().st_mtime for f in path.iterdir()), default=None)
+            return path.stat().st_mtime if path.exists() else None
+
+        roberta = config["roberta"]
+        model_path = Path(roberta.get("model_dir") or roberta["model_name"])
+        try:
+            spacy_model = metadata.version(config["spacy"]["model_name"])
+        except metadata.PackageNotFoundError:
+            spacy_model = None
+
+        payload = {
+            "version": __version__,
+            "config": config,
+            "files": {
+                "roberta": modified(model_path),
+                "centroids": modified(config["validator"]["centroids_path"]),
+            },
+            "spacy_model": spacy_model,
+        }
+        return json.dumps(payload, sort_keys=True, default=str)
+
+    @staticmethod
+    def _create_composite_ner_service(config: dict[str, Any]) -> NerService:
+        """
+        Create comprehensive NER service (also run inside NER worker processes).
+
+        Args:
+            config: Detection-relevant values (see _composite_ner_config)
+        """
+        from pathlib import Path
+
+        from contextsafe.api.config import get_settings
         from contextsafe.infrastructure.nlp import (
             CompositeNerAdapter,
+            OnnxNerAdapter,
             RegexNerAdapter,
             RobertaNerAdapter,
             SpacyNerAdapter,
         )
+        from contextsafe.infrastructure.nlp.validators import (
+            EmbeddingCache,
+            EntityTypeValidator,
+        )
 
-        compute_mode = get_effective_compute_mode()
-        device = 0 if compute_mode == ComputeMode.GPU else -1
-        device_name = "GPU" if device >= 0 else "CPU"
-
-        # Priority: local trained model v2 > HuggingFace fallback
+        settings = get_settings()
         project_root = Path(__file__).parent.parent.parent.parent
-        local_model_path = project_root / "ml" / "models" / "legal_ner_v2"
-
-        if local_model_path.exists():
-            model_name = str(local_model_path)
-            model_display = "legal_ner_v2 (local)"
-            use_local_only = False
+        batching = {
+            "batch_size": settings.ner_batch_size,
+            "max_batch_size": settings.ner_max_batch_size,
+            "max_wait_ms": settings.ner_max_wait_ms,
+        }
+
+        roberta = dict(config["roberta"])
+        if roberta.pop("backend") == "onnx":
+            roberta_ner = OnnxNerAdapter(**roberta, **batching)
+            precision = "int8" if roberta["quantized"] else "fp32"
+            model_display = f"{roberta['model_dir'].name} (ONNX {precision})"
+            device_name = "CPU"
         else:
-            model_name = "MMG/xlm-roberta-large-ner-spanish"
-            model_display = "XLM-RoBERTa-large (HuggingFace)"
-            use_local_only = True
-
-        roberta_ner = RobertaNerAdapter(
-            model_name=model_name,
-            min_score=0.85,
-            device=device,
-            local_files_only=use_local_only,
-        )
+            if settings.ner_backend == "onnx":
+                print(
+                    f"[NER] ONNX model not found at {settings.ner_onnx_dir}, "
+                    "using PyTorch backend"
+                )
+            roberta_ner = RobertaNerAdapter(**roberta, **batching)
+            model_display = (
+                "XLM-RoBERTa-large (HuggingFace)"
+                if roberta["local_files_only"]
+                else "legal_ner_v2 (local)"
+            )
+            device_name = "GPU" if roberta["device"] >= 0 else "CPU"
 
-        spacy_ner = SpacyNerAdapter(
-            model_name="es_core_news_lg",
-            confidence_default=0.85,
-        )
+        spacy_ner = SpacyNerAdapter(**config["spacy"])
 
-        regex_ner = RegexNerAdapter()
+        regex_ner = RegexNerAdapter(**config["regex"])
+
+        cache_path = settings.ner_embedding_cache_path
+        if cache_path is not None and not cache_path.is_absolute():
+            cache_path = project_root / cache_path
+        type_validator = EntityTypeValidator(
+            **config["validator"],
+            embedding_cache=EmbeddingCache(
+                max_entries=settings.ner_embedding_cache_size,
+                db_path=cache_path,
+            ),
+        )
 
         ner_service = CompositeNerAdapter(
             adapters=[roberta_ner, spacy_ner, regex_ner],
             spacy_adapter=spacy_ner,
-            tie_threshold=0.3,
+            type_validator=type_validator,
+            **config["composite"],
         )
         print(f"[NER] Using {model_display} + SpaCy + Regex on {device_name}")
         print("[NER] Intelligent merge enabled: anchors + weighted voting + risk tiebreaker")
@@ -159,8 +346,11 @@ class Container:
         """Get the anonymization service (lazy-initialized)."""
         if self._anonymization_service is None:
             from contextsafe.infrastructure.nlp import InMemoryAnonymizationAdapter
+            from contextsafe.infrastructure.persistence import SQLiteSyntheticStore
 
-            self._anonymization_service = InMemoryAnonymizationAdapter()
+            # Persist aliases and synthetic values when a database is configured
+            store = SQLiteSyntheticStore(self._database) if self._database else None
+            self._anonymization_service = InMemoryAnonymizationAdapter(synthetic_store=store)
         return self._anonymization_service
 
     @property
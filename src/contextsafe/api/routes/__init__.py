@@ -8,6 +8,7 @@ from contextsafe.api.routes.documents import router as documents_router
 from contextsafe.api.routes.export import router as export_router
 from contextsafe.api.routes.glossary import router as glossary_router
 from contextsafe.api.routes.health import router as health_router
+from contextsafe.api.routes.jobs import router as jobs_router
 from contextsafe.api.routes.projects import router as projects_router
 from contextsafe.api.routes.system import router as system_router
 
@@ -17,6 +18,7 @@ __all__ = [
     "export_router",
     "glossary_router",
     "health_router",
+    "jobs_router",
     "projects_router",
     "system_router",
 ]
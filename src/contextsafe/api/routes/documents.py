@@ -8,11 +8,10 @@ Traceability:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import re
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any
 from uuid import UUID, uuid4
 
 from fastapi import APIRouter, File, HTTPException, Query, Request, Response, UploadFile, status
@@ -28,21 +27,52 @@ from contextsafe.api.schemas.response_wrapper import (
     ApiResponse,
     PaginatedMeta,
 )
-from contextsafe.api.services.document_processor import (
-    process_document_real as _process_document_real,
-)
-from contextsafe.api.services.document_processor import (
-    processing_tasks as _processing_tasks,
+from contextsafe.api.services.document_regeneration import regenerate_documents
+from contextsafe.api.services.job_scheduler import (
+    JobPriority,
+    QueueFullError,
+    get_job_scheduler,
 )
 from contextsafe.api.session_manager import session_manager
 
 
+if TYPE_CHECKING:
+    from contextsafe.domain.document_processing.entities import BatchJob
+
+
 logger = logging.getLogger(__name__)
 
 
 router = APIRouter(prefix="/v1/documents", tags=["documents"])
 
 
+def _queue_full() -> HTTPException:
+    """429 response for submissions the job scheduler cannot take."""
+    return HTTPException(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        detail="Processing queue is full, try again later",
+        headers={"Retry-After": "30"},
+    )
+
+
+def _free_queue_slots() -> int:
+    """Documents the job scheduler queue can still take."""
+    stats = get_job_scheduler().stats()
+    return stats["max_queued"] - stats["queued"]
+
+
+def _submit(
+    session_id: str, project_id: str, document_ids: list[str], priority: JobPriority
+) -> BatchJob:
+    """Queue documents with the job scheduler (429 when the queue is full)."""
+    try:
+        return get_job_scheduler().submit(session_id, project_id, document_ids, priority)
+    except QueueFullError:
+        raise _queue_full() from None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e)) from e
+
+
 @router.post(
     "",
     response_model=ApiResponse[DocumentResponse],
@@ -280,6 +310,7 @@ async def get_anonymized(document_id: UUID, request: Request) -> ApiResponse[dic
         202: {"description": "Processing started (async - use WebSocket for progress)"},
         404: {"model": ErrorResponse, "description": "Document not found"},
         409: {"model": ErrorResponse, "description": "Already processing"},
+        429: {"model": ErrorResponse, "description": "Processing queue full"},
     },
 )
 async def process_document(
@@ -312,17 +343,14 @@ async def process_document(
             project_data["anonymization_level"] = level.upper()
             session_manager.update_project(session_id, project_id, project_data)
 
-    # CRITICAL: Update state to "ingesting" BEFORE creating task
-    # This ensures frontend polling sees the correct state immediately
-    session_manager.update_document(session_id, doc_id_str, state="ingesting")
-
-    # Start async processing with real NER detection
-    task = asyncio.create_task(_process_document_real(doc_id_str, project_id, session_id))
-    _processing_tasks[doc_id_str] = task
+    # Queue ahead of bulk jobs (the scheduler marks the document "ingesting"
+    # right away, so frontend polling sees the correct state immediately)
+    job = _submit(session_id, project_id, [doc_id_str], JobPriority.INTERACTIVE)
 
     return ApiResponse(
         data={
             "documentId": doc_id_str,
+            "jobId": str(job.id),
             "status": "processing_started",
             "state": "ingesting",
             "message": f"Document processing has been initiated with level {level or 'default'}",
@@ -337,6 +365,7 @@ async def process_document(
     responses={
         202: {"description": "Batch processing started (async)"},
         400: {"model": ErrorResponse, "description": "Invalid request"},
+        429: {"model": ErrorResponse, "description": "Processing queue full"},
     },
 )
 async def batch_process_documents(
@@ -346,13 +375,16 @@ async def batch_process_documents(
     """
     Start batch processing for multiple documents.
 
-    Processes all specified documents concurrently.
-    Use WebSocket connections per document to track individual progress.
+    Queues the documents as bulk jobs (one per project); the job scheduler
+    runs a bounded number of them at a time. Follow progress on one socket
+    per project (/ws/projects/{project_id}/progress) or per document, and
+    inspect the jobs under /v1/jobs.
     """
     session_id = get_session_id(request)
     started = []
     skipped = []
     not_found = []
+    by_project: dict[str, list[str]] = {}
 
     for doc_id in document_ids:
         doc = session_manager.get_document(session_id, doc_id)
@@ -364,14 +396,20 @@ async def batch_process_documents(
             skipped.append({"id": doc_id, "reason": "already_processing"})
             continue
 
-        # Start async processing
-        project_id = doc.project_id
-        task = asyncio.create_task(_process_document_real(doc_id, project_id, session_id))
-        _processing_tasks[doc_id] = task
+        by_project.setdefault(doc.project_id, []).append(doc_id)
         started.append(doc_id)
 
+    # All or nothing: do not queue part of the batch
+    if len(started) > _free_queue_slots():
+        raise _queue_full()
+    jobs = [
+        _submit(session_id, project_id, doc_ids, JobPriority.BULK)
+        for project_id, doc_ids in by_project.items()
+    ]
+
     return ApiResponse(
         data={
+            "jobs": [str(job.id) for job in jobs],
             "started": started,
             "skipped": skipped,
             "not_found": not_found,
@@ -388,6 +426,7 @@ async def batch_process_documents(
     responses={
         202: {"description": "All documents processing started (async)"},
         404: {"model": ErrorResponse, "description": "Project not found"},
+        429: {"model": ErrorResponse, "description": "Processing queue full"},
     },
 )
 async def process_all_project_documents(project_id: UUID, request: Request) -> ApiResponse[dict]:
@@ -413,16 +452,13 @@ async def process_all_project_documents(project_id: UUID, request: Request) -> A
     project_docs = session.get_project_documents(project_id_str)
     pending_docs = [doc for doc in project_docs.values() if doc.state in ["pending", "error"]]
 
-    started = []
-    for doc in pending_docs:
-        if doc.state not in ["ingesting", "detecting", "anonymizing"]:
-            task = asyncio.create_task(_process_document_real(doc.id, project_id_str, session_id))
-            _processing_tasks[doc.id] = task
-            started.append(doc.id)
+    started = [doc.id for doc in pending_docs]
+    job = _submit(session_id, project_id_str, started, JobPriority.BULK) if started else None
 
     return ApiResponse(
         data={
             "project_id": project_id_str,
+            "job_id": str(job.id) if job else None,
             "started": started,
             "total_started": len(started),
             "total_pending": len(pending_docs),
@@ -736,6 +772,8 @@ async def review_entity(
                         if old_alias in anon_text:
                             anon_text = anon_text.replace(old_alias, new_alias)
                             doc.anonymized["anonymized"] = anon_text
+                            # Edited in place: segment list no longer matches
+                            doc.anonymized.pop("segments", None)
 
             break
 
@@ -947,8 +985,6 @@ async def anonymize_selection(
 
     The text is added to the project glossary and the document is regenerated.
     """
-    import re
-
     session_id = get_session_id(request)
     doc_id_str = str(document_id)
 
@@ -1022,6 +1058,8 @@ async def anonymize_selection(
         # Update existing entry with new alias if provided (only for non-BASIC)
         if alias and not is_masking_level:
             existing["alias"] = alias
+            # Re-index the glossary by alias
+            session_manager.set_glossary(session_id, project_id, glossary)
         generated_alias = existing["alias"]
     else:
         # Generate alias based on anonymization level
@@ -1075,31 +1113,11 @@ async def anonymize_selection(
             },
         )
 
-    # Regenerate anonymized text for this document
-    anonymized_text = original_text
-
-    # Get updated glossary and sort by length (longest first)
+    # Regenerate anonymized text for this document with the updated glossary
+    # (stored in the session together with its segment list)
     glossary = session_manager.get_glossary(session_id, project_id)
-    sorted_glossary = sorted(
-        glossary,
-        key=lambda e: len(e.get("original_text", "")),
-        reverse=True,
-    )
-
-    for entry in sorted_glossary:
-        orig = entry.get("original_text", "")
-        entry_alias = entry.get("alias", "")
-        if orig and entry_alias:
-            # Case-insensitive replacement
-            pattern = re.compile(re.escape(orig), re.IGNORECASE)
-            anonymized_text = pattern.sub(entry_alias, anonymized_text)
-
-    # Update anonymized content in session
-    session_manager.update_document(
-        session_id,
-        doc_id_str,
-        anonymized={"original": original_text, "anonymized": anonymized_text},
-    )
+    regenerated = regenerate_documents(session_id, project_id, glossary, [doc_id_str])
+    anonymized_text = regenerated.get(doc_id_str, original_text)
 
     return ApiResponse(
         data={
@@ -10,7 +10,6 @@ Note: Glossary is always scoped to a specific project (BR-002).
 
 from __future__ import annotations
 
-import re
 from datetime import UTC
 from typing import Optional
 from uuid import UUID
@@ -22,6 +21,7 @@ from pydantic import BaseModel, Field
 from contextsafe.api.middleware.session import get_session_id
 from contextsafe.api.schemas import ErrorResponse
 from contextsafe.api.schemas.response_wrapper import ApiListResponse, ApiResponse, PaginatedMeta
+from contextsafe.api.services.document_regeneration import regenerate_documents
 from contextsafe.api.session_manager import session_manager
 
 
@@ -304,44 +304,14 @@ async def update_glossary(
         documents_updated = 0
 
         if changes_applied > 0 or deletions_applied > 0:
-            # Get session for document access
-            session = session_manager.get_session(session_id)
-            if session:
-                # Sort glossary entries by length (longest first) to avoid partial replacements
-                sorted_entries = sorted(
-                    glossary_entries,
-                    key=lambda e: len(e.get("original_text", "")),
-                    reverse=True,
-                )
-
-                # Find all documents for this project and regenerate them
-                project_docs = session.get_project_documents(project_id_str)
-                for doc_id, doc in project_docs.items():
-                    original_text = doc.content or ""
-                    if original_text:
-                        # Apply all glossary aliases to regenerate anonymized text
-                        new_anonymized = original_text
-                        for entry in sorted_entries:
-                            orig = entry.get("original_text", "")
-                            alias = entry.get("alias", "")
-                            if orig and alias:
-                                # Case-insensitive replacement
-                                pattern = re.compile(re.escape(orig), re.IGNORECASE)
-                                new_anonymized = pattern.sub(alias, new_anonymized)
-
-                        # Update anonymized content in session
-                        session_manager.update_document(
-                            session_id,
-                            doc_id,
-                            anonymized={"original": original_text, "anonymized": new_anonymized},
-                        )
-                        documents_updated += 1
-
-                        # Return the specific document if requested
-                        if request_body.document_id == doc_id:
-                            anonymized_text = new_anonymized
+            # Regenerate ALL documents in the project; documents regenerated
+            # before are patched (renames/deletions) instead of rescanned
+            regenerated = regenerate_documents(session_id, project_id_str, glossary_entries)
+            documents_updated = len(regenerated)
+            if request_body.document_id in regenerated:
+                anonymized_text = regenerated[request_body.document_id]
 
-                document_regenerated = documents_updated > 0
+            document_regenerated = documents_updated > 0
 
         return ApiResponse(
             data=UpdateGlossaryResponse(
@@ -529,33 +499,9 @@ async def correct_glossary_entries(
     document_regenerated = False
 
     if changes_applied > 0:
-        session = session_manager.get_session(session_id)
-        if session:
-            # Sort by length (longest first) for replacement
-            sorted_entries = sorted(
-                glossary_entries,
-                key=lambda e: len(e.get("original_text", "")),
-                reverse=True,
-            )
-
-            project_docs = session.get_project_documents(project_id_str)
-            for doc_id, doc in project_docs.items():
-                original_text = doc.content or ""
-                if original_text:
-                    new_anonymized = original_text
-                    for entry in sorted_entries:
-                        orig = entry.get("original_text", "")
-                        alias = entry.get("alias", "")
-                        if orig and alias:
-                            pattern = re.compile(re.escape(orig), re.IGNORECASE)
-                            new_anonymized = pattern.sub(alias, new_anonymized)
-
-                    session_manager.update_document(
-                        session_id,
-                        doc_id,
-                        anonymized={"original": original_text, "anonymized": new_anonymized},
-                    )
-                    document_regenerated = True
+        document_regenerated = bool(
+            regenerate_documents(session_id, project_id_str, glossary_entries)
+        )
 
     return ApiResponse(
         data=CorrectGlossaryResponse(
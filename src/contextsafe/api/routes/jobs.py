@@ -0,0 +1,88 @@
+"""
+Processing job routes.
+
+Inspect and control the document processing jobs queued by the
+documents routes (see services/job_scheduler.py).
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+from fastapi import APIRouter, HTTPException, Request, status
+
+from contextsafe.api.middleware.session import get_session_id
+from contextsafe.api.schemas import ErrorResponse
+from contextsafe.api.schemas.response_wrapper import ApiResponse
+from contextsafe.api.services.job_scheduler import DocumentJobScheduler, get_job_scheduler
+
+
+router = APIRouter(prefix="/v1/jobs", tags=["jobs"])
+
+
+def _session_job(request: Request, job_id: str) -> dict:
+    """A job of the caller's session as a dict (404 otherwise)."""
+    job = get_job_scheduler().get_job(job_id)
+    if job is None or job.metadata.get("session_id") != get_session_id(request):
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job {job_id} not found",
+        )
+    return job.to_dict()
+
+
+@router.get("", response_model=ApiResponse[dict])
+async def list_jobs(request: Request) -> ApiResponse[dict]:
+    """List the session's processing jobs and the queue state."""
+    scheduler = get_job_scheduler()
+    jobs = scheduler.list_jobs(get_session_id(request))
+    return ApiResponse(data={"jobs": [job.to_dict() for job in jobs], "queue": scheduler.stats()})
+
+
+@router.get(
+    "/{job_id}",
+    response_model=ApiResponse[dict],
+    responses={404: {"model": ErrorResponse, "description": "Job not found"}},
+)
+async def get_job(job_id: str, request: Request) -> ApiResponse[dict]:
+    """Get a processing job (status and progress counters)."""
+    return ApiResponse(data=_session_job(request, job_id))
+
+
+def _control(
+    request: Request, job_id: str, action: Callable[[DocumentJobScheduler, str], bool]
+) -> ApiResponse[dict]:
+    """Apply a scheduler action to a job of the caller's session."""
+    _session_job(request, job_id)
+    action(get_job_scheduler(), job_id)
+    return ApiResponse(data=_session_job(request, job_id))
+
+
+@router.post(
+    "/{job_id}/pause",
+    response_model=ApiResponse[dict],
+    responses={404: {"model": ErrorResponse, "description": "Job not found"}},
+)
+async def pause_job(job_id: str, request: Request) -> ApiResponse[dict]:
+    """Pause a job: its queued documents wait until it is resumed."""
+    return _control(request, job_id, DocumentJobScheduler.pause)
+
+
+@router.post(
+    "/{job_id}/resume",
+    response_model=ApiResponse[dict],
+    responses={404: {"model": ErrorResponse, "description": "Job not found"}},
+)
+async def resume_job(job_id: str, request: Request) -> ApiResponse[dict]:
+    """Resume a paused job."""
+    return _control(request, job_id, DocumentJobScheduler.resume)
+
+
+@router.post(
+    "/{job_id}/cancel",
+    response_model=ApiResponse[dict],
+    responses={404: {"model": ErrorResponse, "description": "Job not found"}},
+)
+async def cancel_job(job_id: str, request: Request) -> ApiResponse[dict]:
+    """Cancel a job: queued documents return to 'pending'."""
+    return _control(request, job_id, DocumentJobScheduler.cancel)
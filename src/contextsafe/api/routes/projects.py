@@ -143,7 +143,9 @@ async def update_project(
     },
 )
 async def delete_project(project_id: UUID, request: Request) -> Response:
-    """Delete a project."""
+    """Delete a project, including its stored alias glossary."""
+    from contextsafe.api.dependencies import get_anonymization_service
+
     session_id = get_session_id(request)
 
     if not session_manager.get_project(session_id, str(project_id)):
@@ -152,6 +154,8 @@ async def delete_project(project_id: UUID, request: Request) -> Response:
             detail=f"Project {project_id} not found",
         )
 
+    # The glossary maps original PII values to aliases: never keep it around
+    await get_anonymization_service().clear_project_glossary(str(project_id))
     session_manager.delete_project(session_id, str(project_id))
     return Response(status_code=status.HTTP_204_NO_CONTENT)
 
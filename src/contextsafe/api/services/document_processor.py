@@ -7,9 +7,10 @@ Handles NER detection, anonymization, and glossary updates.
 
 from __future__ import annotations
 
-import asyncio
 import logging
+from collections import Counter
 from datetime import datetime
+from typing import TYPE_CHECKING
 from uuid import UUID, uuid4
 
 from contextsafe.api.services.ner_registry import (
@@ -20,10 +21,11 @@ from contextsafe.api.session_manager import session_manager
 from contextsafe.api.websocket.progress_handler import progress_handler
 
 
-logger = logging.getLogger(__name__)
+if TYPE_CHECKING:
+    from contextsafe.application.ports import EntityReplacement
+
 
-# Processing tasks tracking
-processing_tasks: dict[str, asyncio.Task] = {}
+logger = logging.getLogger(__name__)
 
 
 async def process_document_real(document_id: str, project_id: str, session_id: str):
@@ -38,6 +40,7 @@ async def process_document_real(document_id: str, project_id: str, session_id: s
         return
 
     doc_uuid = UUID(document_id)
+    progress_handler.bind_document(doc_uuid, project_id)
 
     try:
         # Stage 1: Ingesting (0-10%)
@@ -238,52 +241,32 @@ async def process_document_real(document_id: str, project_id: str, session_id: s
             doc_uuid, "anonymizing", 0.9, current_entity="Actualizando glosario"
         )
 
-        # Get current glossary
-        current_glossary = session_manager.get_glossary(session_id, project_id)
-
         # Count occurrences of each alias from the ACTUAL replacements
         # (not pre-calculated entities, which may differ from MaskingStrategy output)
-        alias_counts: dict[str, int] = {}
-        alias_data: dict[str, dict] = {}
+        alias_counts: Counter[str] = Counter()
+        alias_data: dict[str, EntityReplacement] = {}
         for replacement in result.replacements:
             alias = replacement.alias  # The ACTUAL alias used in anonymized text
-            if alias not in alias_counts:
-                alias_counts[alias] = 0
-                alias_data[alias] = {
-                    "original_text": replacement.original_value,
-                    "alias": alias,
-                    "category": replacement.category,
-                    "confidence": replacement.confidence,
-                }
             alias_counts[alias] += 1
-
-        existing_aliases = {e["alias"] for e in current_glossary}
-        for alias, count in alias_counts.items():
-            if alias not in existing_aliases:
-                entity = alias_data[alias]
-                session_manager.add_glossary_entry(
-                    session_id,
-                    project_id,
-                    {
-                        "id": str(uuid4()),
-                        "original_text": entity["original_text"],
-                        "alias": entity["alias"],
-                        "category": entity["category"],
-                        "occurrences": count,
-                        "created_at": datetime.utcnow().isoformat(),
-                        # BASIC level: mark as not reversible (audit only)
-                        "reversible": not is_masking_level,
-                        "masking_level": anonymization_level,
-                    },
-                )
-                existing_aliases.add(alias)
-            else:
-                # Update occurrence count for existing entry
-                glossary = session_manager.get_glossary(session_id, project_id)
-                for entry in glossary:
-                    if entry["alias"] == alias:
-                        entry["occurrences"] = entry.get("occurrences", 0) + count
-                        break
+            alias_data.setdefault(alias, replacement)
+
+        def new_entry(alias: str, count: int) -> dict:
+            replacement = alias_data[alias]
+            return {
+                "id": str(uuid4()),
+                "original_text": replacement.original_value,
+                "alias": alias,
+                "category": replacement.category,
+                "occurrences": count,
+                "created_at": datetime.utcnow().isoformat(),
+                # BASIC level: mark as not reversible (audit only)
+                "reversible": not is_masking_level,
+                "masking_level": anonymization_level,
+            }
+
+        # One merge for the whole document: existing aliases bump their
+        # occurrences, new ones are appended
+        session_manager.merge_glossary_occurrences(session_id, project_id, alias_counts, new_entry)
 
         # Complete
         session_manager.update_document(
@@ -299,6 +282,3 @@ async def process_document_real(document_id: str, project_id: str, session_id: s
         safe_message = "Processing failed. Please try again."
         session_manager.update_document(session_id, document_id, state="error", error=safe_message)
         await progress_handler.send_error(doc_uuid, safe_message)
-    finally:
-        # Prevent memory leak: remove completed/failed task reference
-        processing_tasks.pop(document_id, None)
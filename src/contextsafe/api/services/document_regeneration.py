@@ -0,0 +1,192 @@
+"""
+Document regeneration after glossary edits.
+
+A regenerated document keeps, next to its anonymized text, a segment list
+over its original text: literal runs and alias references keyed by
+glossary entry id. Later edits patch that list instead of rescanning every
+document with every glossary entry:
+
+- alias renames only re-render the documents that reference the entry
+- deleting an entry re-exposes its own segments (rescanning just those
+  runs, so other glossary values inside them stay anonymized)
+- any other change (new entries, corrected original texts, merges) falls
+  back to a full rebuild from the original text
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from contextsafe.api.session_manager import DocumentWithTimer, session_manager
+from contextsafe.domain.anonymization.services.glossary_matcher import (
+    GlossaryMatcher,
+    get_glossary_matcher,
+)
+
+
+# (start, end, glossary entry id) over the original text; id None = literal run
+Segment = tuple[int, int, Optional[str]]
+
+
+def glossary_match_entries(entries: list[dict]) -> tuple[tuple[str, str], ...]:
+    """
+    (value, entry id) pairs matched during regeneration.
+
+    Includes the original texts merged into an entry, so merged duplicates
+    keep rendering with the surviving alias.
+    """
+    pairs: list[tuple[str, str]] = []
+    for entry in entries:
+        if not (entry.get("original_text") and entry.get("alias")):
+            continue
+        pairs.append((entry["original_text"], entry["id"]))
+        for merged in entry.get("merged_originals", []):
+            if merged:
+                pairs.append((merged, entry["id"]))
+    return tuple(pairs)
+
+
+def build_segments(
+    original: str, matcher: GlossaryMatcher[str], start: int = 0, end: int | None = None
+) -> list[Segment]:
+    """Scan original[start:end] into literal and alias segments."""
+    end = len(original) if end is None else end
+    segments: list[Segment] = []
+    position = start
+    for m_start, m_end, entry_id in matcher.finditer(original, start, end):
+        if m_start > position:
+            segments.append((position, m_start, None))
+        segments.append((m_start, m_end, entry_id))
+        position = m_end
+    if position < end:
+        segments.append((position, end, None))
+    return segments
+
+
+def render_segments(original: str, segments: list[Segment], aliases: dict[str, str]) -> str:
+    """Materialize the anonymized text for a segment list."""
+    return "".join(
+        original[start:end] if entry_id is None else aliases[entry_id]
+        for start, end, entry_id in segments
+    )
+
+
+def release_entries(
+    original: str,
+    segments: list[Segment],
+    removed: set[str],
+    matcher: GlossaryMatcher[str],
+) -> list[Segment]:
+    """
+    Turn the segments of removed entries back into text.
+
+    Each released run (joined with the literal text around it) is rescanned
+    with the current matcher; untouched runs are kept as they are.
+    """
+    result: list[Segment] = []
+    run_start: int | None = None
+    run_end = 0
+    released = False
+
+    def flush() -> None:
+        if run_start is None:
+            return
+        if released:
+            result.extend(build_segments(original, matcher, run_start, run_end))
+        else:
+            result.append((run_start, run_end, None))
+
+    for start, end, entry_id in segments:
+        if entry_id is None or entry_id in removed:
+            if run_start is None:
+                run_start, released = start, False
+            run_end = end
+            released = released or entry_id is not None
+        else:
+            flush()
+            run_start = None
+            result.append((start, end, entry_id))
+    flush()
+    return result
+
+
+def regenerate_documents(
+    session_id: str,
+    project_id: str,
+    glossary_entries: list[dict],
+    document_ids: Optional[list[str]] = None,
+) -> dict[str, str]:
+    """
+    Bring the anonymized text of project documents in line with the glossary.
+
+    Args:
+        session_id: Session owning the documents
+        project_id: Project whose documents are regenerated
+        glossary_entries: Current project glossary
+        document_ids: Restrict to these documents (default: all in project)
+
+    Returns:
+        Anonymized text of every document with content, by document id
+    """
+    session = session_manager.get_session(session_id)
+    if not session:
+        return {}
+
+    match_entries = glossary_match_entries(glossary_entries)
+    matcher = get_glossary_matcher(match_entries)
+    aliases = {entry["id"]: entry["alias"] for entry in glossary_entries if entry.get("alias")}
+
+    texts: dict[str, str] = {}
+    for doc_id, doc in session.get_project_documents(project_id).items():
+        if document_ids is not None and doc_id not in document_ids:
+            continue
+        original_text = doc.content or ""
+        if not original_text:
+            continue
+        texts[doc_id] = _regenerate_document(
+            session_id, doc_id, doc, original_text, match_entries, matcher, aliases
+        )
+    return texts
+
+
+def _regenerate_document(
+    session_id: str,
+    doc_id: str,
+    doc: DocumentWithTimer,
+    original_text: str,
+    match_entries: tuple[tuple[str, str], ...],
+    matcher: GlossaryMatcher[str],
+    aliases: dict[str, str],
+) -> str:
+    state = doc.anonymized if isinstance(doc.anonymized, dict) else {}
+    segments: Optional[list[Segment]] = state.get("segments")
+    previous: Optional[tuple[tuple[str, str], ...]] = state.get("match_entries")
+
+    if segments is None or previous is None or state.get("original") != original_text:
+        segments = build_segments(original_text, matcher)
+    elif previous != match_entries:
+        current_ids = {entry_id for _, entry_id in match_entries}
+        if tuple(e for e in previous if e[1] in current_ids) != match_entries:
+            # Entries were added or changed: matches may differ anywhere
+            segments = build_segments(original_text, matcher)
+        else:
+            removed = {entry_id for _, entry_id in previous} - current_ids
+            segments = release_entries(original_text, segments, removed, matcher)
+    elif all(aliases.get(eid) == alias for eid, alias in state.get("aliases", {}).items()):
+        # Same matches and aliases: nothing to patch
+        return state["anonymized"]
+
+    used_aliases = {eid: aliases[eid] for _, _, eid in segments if eid is not None}
+    anonymized = render_segments(original_text, segments, aliases)
+    session_manager.update_document(
+        session_id,
+        doc_id,
+        anonymized={
+            "original": original_text,
+            "anonymized": anonymized,
+            "segments": segments,
+            "match_entries": match_entries,
+            "aliases": used_aliases,
+        },
+    )
+    return anonymized
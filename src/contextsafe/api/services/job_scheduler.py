@@ -0,0 +1,341 @@
+"""
+Document processing job scheduler.
+
+Replaces one asyncio task per submitted document with a bounded queue
+served by a fixed pool of pipeline workers:
+
+- every submission becomes a BatchJob (one per project) whose documents
+  wait in the queue; a worker takes the next document, runs the pipeline
+  and records the outcome on the job
+- INTERACTIVE jobs (the single document a user asked for) are served
+  before BULK ones (batch and process-all requests)
+- within a priority, projects take turns one document at a time, so a
+  large project does not starve the others
+- paused jobs keep their queued documents until resumed; cancelling a job
+  drops them (documents already in the pipeline finish)
+- the queue holds at most ``max_queued`` documents: further submissions
+  are rejected with QueueFullError instead of piling up in memory
+
+Traceability:
+- Entity: BatchJob (BC-001 DocumentProcessing)
+- Used by: routes/documents.py (processing), routes/jobs.py (inspection)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict, deque
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from enum import IntEnum
+from typing import Any, Optional
+from uuid import UUID
+
+from contextsafe.api.session_manager import session_manager
+from contextsafe.api.websocket.progress_handler import progress_handler
+from contextsafe.domain.document_processing.entities import BatchJob, BatchJobStatus
+from contextsafe.domain.shared.value_objects import DocumentId, ProjectId
+
+
+logger = logging.getLogger(__name__)
+
+# Finished jobs kept for inspection (oldest are dropped first)
+MAX_FINISHED_JOBS = 100
+
+
+class JobPriority(IntEnum):
+    """Scheduling priority (lower is served first)."""
+
+    INTERACTIVE = 0
+    BULK = 1
+
+
+class QueueFullError(Exception):
+    """The scheduler queue cannot take the submitted documents."""
+
+
+@dataclass(slots=True)
+class _QueuedJob:
+    """A job and the documents it still has waiting in the queue."""
+
+    job: BatchJob
+    session_id: str
+    priority: JobPriority
+    pending: deque[str]
+
+
+class DocumentJobScheduler:
+    """
+    Bounded, prioritized queue of document processing jobs.
+
+    Workers are asyncio tasks started on the running loop at the first
+    submission; each runs one document pipeline at a time.
+    """
+
+    def __init__(
+        self,
+        process_fn: Callable[[str, str, str], Awaitable[None]],
+        workers: int = 2,
+        max_queued: int = 500,
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            process_fn: Pipeline coroutine (document_id, project_id, session_id)
+            workers: Documents processed concurrently
+            max_queued: Maximum documents waiting in the queue
+        """
+        self._process_fn = process_fn
+        self._worker_count = max(1, workers)
+        self._max_queued = max(1, max_queued)
+
+        # All known jobs by id, in submission order
+        self._jobs: OrderedDict[str, _QueuedJob] = OrderedDict()
+        # Per priority: project id -> its jobs with queued documents (project turn order)
+        self._queues: dict[JobPriority, OrderedDict[str, deque[_QueuedJob]]] = {
+            priority: OrderedDict() for priority in JobPriority
+        }
+        self._queued = 0
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._wakeup: asyncio.Event | None = None
+        self._workers: list[asyncio.Task] = []
+
+    @property
+    def queued(self) -> int:
+        """Documents waiting in the queue (paused jobs included)."""
+        return self._queued
+
+    def submit(
+        self,
+        session_id: str,
+        project_id: str,
+        document_ids: list[str],
+        priority: JobPriority = JobPriority.BULK,
+    ) -> BatchJob:
+        """
+        Queue documents of one project as a job.
+
+        Args:
+            session_id: Session owning the documents
+            project_id: Project of the documents
+            document_ids: Documents to process, in order
+            priority: Scheduling priority
+
+        Returns:
+            The created job (PENDING until a worker takes its first document)
+
+        Raises:
+            QueueFullError: If the documents do not fit in the queue
+            ValueError: If the ids are invalid or the list is empty
+        """
+        if self._queued + len(document_ids) > self._max_queued:
+            raise QueueFullError(
+                f"Processing queue is full ({self._queued}/{self._max_queued} documents)"
+            )
+
+        project = ProjectId.create(project_id)
+        documents = [DocumentId.create(doc_id) for doc_id in document_ids]
+        if project.is_err() or any(doc.is_err() for doc in documents):
+            raise ValueError("Invalid project or document id")
+        result = BatchJob.create(
+            project.unwrap(),
+            [doc.unwrap() for doc in documents],
+            metadata={"session_id": session_id, "priority": priority.name},
+        )
+        if result.is_err():
+            raise ValueError(str(result.unwrap_err()))
+        job = result.unwrap()
+
+        entry = _QueuedJob(job, session_id, priority, deque(document_ids))
+        self._jobs[str(job.id)] = entry
+        self._queues[priority].setdefault(project_id, deque()).append(entry)
+        self._queued += len(document_ids)
+        self._prune_finished()
+
+        for doc_id in document_ids:
+            session_manager.update_document(
+                session_id,
+                doc_id,
+                state="ingesting",
+                progress=0.0,
+                current_entity="En cola de procesamiento",
+            )
+            progress_handler.bind_document(UUID(doc_id), project_id)
+
+        self._ensure_workers()
+        self._wakeup.set()
+        logger.info(
+            f"Job {job.id} queued: {len(document_ids)} documents "
+            f"({priority.name}, {self._queued} waiting)"
+        )
+        return job
+
+    def get_job(self, job_id: str) -> Optional[BatchJob]:
+        """Get a job by id."""
+        entry = self._jobs.get(job_id)
+        return entry.job if entry else None
+
+    def list_jobs(self, session_id: Optional[str] = None) -> list[BatchJob]:
+        """Jobs in submission order, optionally only those of a session."""
+        return [
+            entry.job
+            for entry in self._jobs.values()
+            if session_id is None or entry.session_id == session_id
+        ]
+
+    def pause(self, job_id: str) -> bool:
+        """Stop dispatching a job's queued documents. Returns False if unknown."""
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            return False
+        if entry.job.status == BatchJobStatus.PENDING:
+            entry.job.start()
+        entry.job.pause()
+        return True
+
+    def resume(self, job_id: str) -> bool:
+        """Dispatch a paused job's documents again. Returns False if unknown."""
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            return False
+        entry.job.resume()
+        if self._wakeup is not None:
+            self._wakeup.set()
+        return True
+
+    def cancel(self, job_id: str) -> bool:
+        """
+        Cancel a job: its queued documents go back to 'pending'.
+
+        Documents already being processed finish. Returns False if unknown.
+        """
+        entry = self._jobs.get(job_id)
+        if entry is None:
+            return False
+        entry.job.cancel()
+        self._queued -= len(entry.pending)
+        for doc_id in entry.pending:
+            session_manager.update_document(
+                entry.session_id, doc_id, state="pending", progress=0.0, current_entity=""
+            )
+            progress_handler.forget_document(UUID(doc_id))
+        entry.pending.clear()
+        self._drop_from_queue(entry)
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """Get queue counters."""
+        return {
+            "workers": self._worker_count,
+            "max_queued": self._max_queued,
+            "queued": self._queued,
+            "active_jobs": sum(1 for entry in self._jobs.values() if entry.job.is_active),
+        }
+
+    async def close(self) -> None:
+        """Stop the workers (queued documents stay queued)."""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    def _ensure_workers(self) -> None:
+        """Start the workers on the running loop (restarting if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._wakeup = asyncio.Event()
+            self._workers = []
+
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self._worker_count:
+            name = f"document_worker_{len(self._workers)}"
+            self._workers.append(loop.create_task(self._run(), name=name))
+
+    async def _run(self) -> None:
+        """Worker loop: take the next document, run its pipeline, record the outcome."""
+        while True:
+            picked = self._next()
+            if picked is None:
+                self._wakeup.clear()
+                await self._wakeup.wait()
+                continue
+
+            entry, document_id = picked
+            if entry.job.status == BatchJobStatus.PENDING:
+                entry.job.start()
+            project_id = str(entry.job.project_id)
+            try:
+                await self._process_fn(document_id, project_id, entry.session_id)
+            except Exception:
+                # The pipeline reports its own errors; keep the worker alive
+                logger.exception(f"Job {entry.job.id}: document {document_id} crashed")
+
+            doc = session_manager.get_document(entry.session_id, document_id)
+            if doc is not None and doc.state == "completed":
+                entry.job.record_success()
+            else:
+                entry.job.record_failure(doc.error if doc and doc.error else "Processing failed")
+
+    def _next(self) -> Optional[tuple[_QueuedJob, str]]:
+        """
+        Pop the next document to process.
+
+        Highest priority first; within it, the first project (in turn order)
+        with a job that is not paused. That project then moves to the back.
+        """
+        for priority in JobPriority:
+            projects = self._queues[priority]
+            for project_id, jobs in projects.items():
+                entry = next((e for e in jobs if e.job.status != BatchJobStatus.PAUSED), None)
+                if entry is None:
+                    continue
+                document_id = entry.pending.popleft()
+                self._queued -= 1
+                if not entry.pending:
+                    self._drop_from_queue(entry)
+                elif project_id in projects:
+                    projects.move_to_end(project_id)
+                return entry, document_id
+        return None
+
+    def _drop_from_queue(self, entry: _QueuedJob) -> None:
+        """Remove a job with no queued documents from its project's turn."""
+        projects = self._queues[entry.priority]
+        project_id = str(entry.job.project_id)
+        jobs = projects.get(project_id)
+        if jobs is None or entry not in jobs:
+            return
+        jobs.remove(entry)
+        if jobs:
+            projects.move_to_end(project_id)
+        else:
+            del projects[project_id]
+
+    def _prune_finished(self) -> None:
+        """Forget the oldest finished jobs beyond MAX_FINISHED_JOBS."""
+        finished = [job_id for job_id, e in self._jobs.items() if e.job.is_completed]
+        for job_id in finished[: max(0, len(finished) - MAX_FINISHED_JOBS)]:
+            del self._jobs[job_id]
+
+
+_scheduler: DocumentJobScheduler | None = None
+
+
+def get_job_scheduler() -> DocumentJobScheduler:
+    """Get the process-wide scheduler (configured from settings on first use)."""
+    global _scheduler
+    if _scheduler is None:
+        from contextsafe.api.config import get_settings
+        from contextsafe.api.services.document_processor import process_document_real
+
+        settings = get_settings()
+        _scheduler = DocumentJobScheduler(
+            process_document_real,
+            workers=settings.processing_workers,
+            max_queued=settings.processing_max_queued,
+        )
+    return _scheduler
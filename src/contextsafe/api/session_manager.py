@@ -6,6 +6,7 @@ Sesión única local sin autenticación.
 """
 
 import uuid
+from collections.abc import Callable, Mapping
 from dataclasses import dataclass, field
 from datetime import UTC, datetime
 from typing import Any, Optional
@@ -45,6 +46,8 @@ class Session:
     documents: dict[str, DocumentWithTimer] = field(default_factory=dict)
     projects: dict[str, dict] = field(default_factory=dict)
     glossary: dict[str, list] = field(default_factory=dict)
+    # Por proyecto: alias -> primera entrada del glossary con ese alias
+    glossary_aliases: dict[str, dict[str, dict]] = field(default_factory=dict)
 
     @property
     def docs_count(self) -> int:
@@ -217,6 +220,7 @@ class SessionManager:
             for doc_id in docs_to_delete:
                 del session.documents[doc_id]
             session.glossary.pop(project_id, None)
+            session.glossary_aliases.pop(project_id, None)
             return True
         return False
 
@@ -234,6 +238,7 @@ class SessionManager:
         if not session:
             return False
         session.glossary[project_id] = entries
+        session.glossary_aliases[project_id] = _index_aliases(entries)
         return True
 
     def add_glossary_entry(self, session_id: str, project_id: str, entry: dict) -> bool:
@@ -244,8 +249,59 @@ class SessionManager:
         if project_id not in session.glossary:
             session.glossary[project_id] = []
         session.glossary[project_id].append(entry)
+        self._alias_index(session, project_id).setdefault(entry.get("alias"), entry)
         return True
 
+    def merge_glossary_occurrences(
+        self,
+        session_id: str,
+        project_id: str,
+        counts: Mapping[str, int],
+        new_entry: Callable[[str, int], dict],
+    ) -> bool:
+        """
+        Suma las ocurrencias de un documento al glossary en una sola pasada.
+
+        Cada alias se busca en el índice por alias (O(1)): si ya existe se
+        incrementa su contador; si no, se añade new_entry(alias, count).
+        El coste depende de los alias del documento, no del tamaño del glossary.
+        """
+        session = self.get_session(session_id)
+        if not session:
+            return False
+        entries = session.glossary.setdefault(project_id, [])
+        index = self._alias_index(session, project_id)
+        for alias, count in counts.items():
+            entry = index.get(alias)
+            if entry is not None and entry.get("alias") != alias:
+                # Alias renombrado en sitio sin set_glossary: reconstruir el índice
+                index = session.glossary_aliases[project_id] = _index_aliases(entries)
+                entry = index.get(alias)
+            if entry is None:
+                entry = new_entry(alias, count)
+                entries.append(entry)
+                index[alias] = entry
+            else:
+                entry["occurrences"] = entry.get("occurrences", 0) + count
+        return True
+
+    @staticmethod
+    def _alias_index(session: Session, project_id: str) -> dict[str, dict]:
+        """Índice alias -> entrada del proyecto (se construye si no existe)."""
+        index = session.glossary_aliases.get(project_id)
+        if index is None:
+            index = _index_aliases(session.glossary.get(project_id, []))
+            session.glossary_aliases[project_id] = index
+        return index
+
+
+def _index_aliases(entries: list) -> dict[str, dict]:
+    """Primera entrada de cada alias, en el orden del glossary."""
+    index: dict[str, dict] = {}
+    for entry in entries:
+        index.setdefault(entry.get("alias"), entry)
+    return index
+
 
 # Instancia global
 session_manager = SessionManager()
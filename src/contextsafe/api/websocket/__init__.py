@@ -5,6 +5,7 @@ WebSocket handlers for ContextSafe.
 from contextsafe.api.websocket.progress_handler import (
     ProgressWebSocketHandler,
     handle_progress_websocket,
+    handle_project_progress_websocket,
     progress_handler,
 )
 
@@ -12,5 +13,6 @@ from contextsafe.api.websocket.progress_handler import (
 __all__ = [
     "ProgressWebSocketHandler",
     "handle_progress_websocket",
+    "handle_project_progress_websocket",
     "progress_handler",
 ]
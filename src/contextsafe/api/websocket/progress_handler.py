@@ -1,7 +1,8 @@
 """
 WebSocket handler for progress updates.
 
-Streams real-time processing progress to frontend.
+Streams real-time processing progress to frontend. Progress is coalesced
+per document, and each client is sent to from its own task.
 
 Traceability:
 - Contract: CNT-T4-PROGRESS-WS-001
@@ -13,6 +14,8 @@ from __future__ import annotations
 import asyncio
 import json
 import logging
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Literal, Optional
 from uuid import UUID
 
@@ -22,9 +25,14 @@ from fastapi import WebSocket, WebSocketDisconnect
 logger = logging.getLogger(__name__)
 
 # Message types matching frontend expectations
-MessageType = Literal["progress", "complete", "error", "connected", "ping"]
+MessageType = Literal["progress", "complete", "error", "connected", "ping", "batch_progress"]
 ProcessingStage = Literal["ingesting", "detecting", "anonymizing"]
 
+# Stages of a document on the project channel besides the processing ones
+QUEUED_STAGE = "queued"
+COMPLETED_STAGE = "completed"
+ERROR_STAGE = "error"
+
 
 class WebSocketMessage:
     """WebSocket message matching frontend interface."""
@@ -83,20 +91,190 @@ class WebSocketMessage:
         """Create ping message."""
         return json.dumps({"type": "ping"})
 
+    @staticmethod
+    def batch_progress(
+        project_id: str,
+        documents: dict[str, Optional[dict]],
+        counters: dict[str, int],
+        snapshot: bool = False,
+    ) -> str:
+        """
+        Create project channel frame.
+
+        ``documents`` maps document ids to {"s": stage, "p": percent} (plus
+        "m" for errors), or None for documents that left the channel. A
+        snapshot lists every document; other frames only changed ones.
+        """
+        msg: dict = {"type": "batch_progress", "projectId": project_id, "documents": documents}
+        msg.update(counters)
+        if snapshot:
+            msg["snapshot"] = True
+        return json.dumps(msg, separators=(",", ":"))
+
+
+# Progress messages per second and document (stage changes and terminal
+# messages are never delayed)
+PROGRESS_MAX_RATE_HZ = 10.0
+
+# Messages queued per client before the oldest are dropped
+OUTBOX_SIZE = 64
+
+
+class _Connection:
+    """A client socket and the messages waiting to be sent to it."""
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.outbox: deque[str] = deque(maxlen=OUTBOX_SIZE)
+        self.ready = asyncio.Event()
+
+    def push(self, message: str) -> None:
+        """Queue a message without waiting for the client."""
+        self.outbox.append(message)
+        self.ready.set()
+
+    async def run_sender(self) -> None:
+        """Send queued messages in order, for as long as the socket lives."""
+        while True:
+            await self.ready.wait()
+            self.ready.clear()
+            while self.outbox:
+                await self.websocket.send_text(self.outbox.popleft())
+
+
+@dataclass
+class _DocumentProgress:
+    """Throttling state of one document's progress stream."""
+
+    stage: Optional[str] = None
+    last_sent: float = float("-inf")
+    pending: Optional[str] = None
+    flush: Optional[asyncio.TimerHandle] = None
+
+
+class _ChannelSubscriber:
+    """
+    A project channel client.
+
+    Changes are merged per document until the sender writes the next
+    frame, so a slow client gets fewer, larger frames and never loses the
+    latest state of a document.
+    """
+
+    def __init__(self, websocket: WebSocket) -> None:
+        self.websocket = websocket
+        self.dirty: dict[str, Optional[dict]] = {}
+        self.snapshot = True
+        self.ping = False
+        self.ready = asyncio.Event()
+        self.ready.set()
+
+    def mark(self, document_id: str, entry: Optional[dict]) -> None:
+        """Record a document change for the next frame."""
+        self.dirty[document_id] = entry
+        self.ready.set()
+
+    async def run_sender(self, channel: _ProjectChannel, project_id: str, interval: float) -> None:
+        """Send frames (at most one per interval) for as long as the socket lives."""
+        loop = asyncio.get_running_loop()
+        last_frame = float("-inf")
+        while True:
+            await self.ready.wait()
+            delay = last_frame + interval - loop.time()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.ready.clear()
+
+            if self.ping:
+                self.ping = False
+                await self.websocket.send_text(WebSocketMessage.ping())
+            if self.snapshot:
+                self.snapshot, self.dirty = False, {}
+                documents = dict(channel.documents)
+                frame = WebSocketMessage.batch_progress(
+                    project_id, documents, channel.counters(), snapshot=True
+                )
+            elif self.dirty:
+                documents, self.dirty = self.dirty, {}
+                frame = WebSocketMessage.batch_progress(project_id, documents, channel.counters())
+            else:
+                continue
+            await self.websocket.send_text(frame)
+            last_frame = loop.time()
+
+
+@dataclass
+class _ProjectChannel:
+    """Progress of a project's documents and the clients following it."""
+
+    documents: dict[str, dict] = field(default_factory=dict)
+    subscribers: dict[int, _ChannelSubscriber] = field(default_factory=dict)
+    active: int = 0
+    completed: int = 0
+    failed: int = 0
+
+    def update(self, document_id: str, entry: Optional[dict]) -> None:
+        """Set (or remove, with None) a document's entry and notify subscribers."""
+        previous = self.documents.get(document_id)
+        if previous == entry:
+            return
+        self._count(previous, -1)
+        self._count(entry, 1)
+        if entry is None:
+            self.documents.pop(document_id, None)
+        else:
+            self.documents[document_id] = entry
+        for subscriber in self.subscribers.values():
+            subscriber.mark(document_id, entry)
+
+    def counters(self) -> dict[str, int]:
+        """Aggregated document counters."""
+        return {
+            "active": self.active,
+            "completed": self.completed,
+            "failed": self.failed,
+            "total": len(self.documents),
+        }
+
+    def _count(self, entry: Optional[dict], delta: int) -> None:
+        if entry is None:
+            return
+        if entry["s"] == COMPLETED_STAGE:
+            self.completed += delta
+        elif entry["s"] == ERROR_STAGE:
+            self.failed += delta
+        else:
+            self.active += delta
+
 
 class ProgressWebSocketHandler:
     """
     WebSocket handler for streaming progress updates.
 
     Features:
-    - Connection management per document
-    - Progress broadcasting
+    - Connections indexed by document
+    - Progress coalesced per document to max_rate_hz (the latest update
+      wins; stage changes, completion and errors are sent right away)
+    - One sender task per connection, so a slow client cannot stall the
+      processing pipeline (its oldest queued messages are dropped)
+    - Project channels: one socket follows every document of a project
+      with compact delta frames and aggregated counters
     - Graceful disconnect handling
     """
 
-    def __init__(self) -> None:
-        """Initialize the handler."""
-        self._active_connections: dict[str, WebSocket] = {}
+    def __init__(self, max_rate_hz: float = PROGRESS_MAX_RATE_HZ) -> None:
+        """
+        Initialize the handler.
+
+        Args:
+            max_rate_hz: Progress messages per second and document (0 = no limit)
+        """
+        self._connections: dict[str, dict[int, _Connection]] = {}
+        self._progress: dict[str, _DocumentProgress] = {}
+        self._min_interval = 1.0 / max_rate_hz if max_rate_hz > 0 else 0.0
+        # Project channels, and the project of every document bound to one
+        self._channels: dict[str, _ProjectChannel] = {}
+        self._document_projects: dict[str, str] = {}
 
     async def connect(self, websocket: WebSocket, document_id: UUID) -> None:
         """
@@ -107,18 +285,18 @@ class ProgressWebSocketHandler:
             document_id: Document to monitor
         """
         await websocket.accept()
-        connection_id = f"{document_id}:{id(websocket)}"
-        self._active_connections[connection_id] = websocket
+        key = str(document_id)
+        connection = _Connection(websocket)
+        self._connections.setdefault(key, {})[id(websocket)] = connection
+        sender = asyncio.create_task(self._run_sender(key, connection))
 
         # CRITICAL: Log with print to ensure it shows in console
-        print(f"[WS-HANDLER] *** CONNECTED *** doc={document_id} conn_id={connection_id}")
-        print(f"[WS-HANDLER] Total active connections: {len(self._active_connections)}")
-        print(f"[WS-HANDLER] Connection IDs: {list(self._active_connections.keys())}")
+        print(f"[WS-HANDLER] *** CONNECTED *** doc={document_id} total={self.get_active_count()}")
         logger.info(f"WebSocket connected for document {document_id}")
 
         try:
             # Send initial connection acknowledgment
-            await websocket.send_text(WebSocketMessage.connected(document_id))
+            connection.push(WebSocketMessage.connected(document_id))
 
             # Keep connection alive until disconnect
             while True:
@@ -130,12 +308,13 @@ class ProgressWebSocketHandler:
                     )
                 except asyncio.TimeoutError:
                     # Send keepalive ping
-                    await websocket.send_text(WebSocketMessage.ping())
+                    connection.push(WebSocketMessage.ping())
 
         except WebSocketDisconnect:
             logger.info(f"WebSocket disconnected for document {document_id}")
         finally:
-            self._active_connections.pop(connection_id, None)
+            sender.cancel()
+            self._remove(key, connection)
 
     async def send_progress(
         self,
@@ -147,26 +326,20 @@ class ProgressWebSocketHandler:
         """
         Send progress update to all connected clients for a document.
 
+        Updates closer than 1/max_rate_hz to the previous one are coalesced:
+        only the latest is sent, when the interval expires.
+
         Args:
             document_id: Document being processed
             stage: Processing stage (ingesting, detecting, anonymizing)
             progress: Progress percentage (0.0-1.0)
             current_entity: Currently processing entity (optional)
         """
-        # Log connection status for debugging - USE PRINT to guarantee visibility
-        conn_count = self.get_document_connections(document_id)
-        print(
-            f"[WS-SEND] doc={document_id} stage={stage} progress={progress:.0%} connections={conn_count}"
-        )
-        print(f"[WS-SEND] All connections: {list(self._active_connections.keys())}")
-
-        if conn_count == 0:
-            print(f"[WS-SEND] *** WARNING *** NO CONNECTIONS for document {document_id}!")
-            print(f"[WS-SEND] Looking for prefix: {document_id!s}")
-
-        logger.info(
-            f"[WS] send_progress doc={document_id} stage={stage} progress={progress:.0%} connections={conn_count}"
-        )
+        key = str(document_id)
+        self._update_channel(key, {"s": stage, "p": round(progress * 100)})
+        if not self._connections.get(key):
+            logger.debug(f"[WS] No connections for document {document_id}")
+            return
 
         message = WebSocketMessage.progress(
             document_id=document_id,
@@ -174,42 +347,187 @@ class ProgressWebSocketHandler:
             progress=progress,
             current_entity=current_entity,
         )
-        await self._broadcast_to_document(document_id, message)
+        loop = asyncio.get_running_loop()
+        state = self._progress.setdefault(key, _DocumentProgress())
+        now = loop.time()
+
+        if stage != state.stage or now - state.last_sent >= self._min_interval:
+            state.stage = stage
+            self._emit(key, state, message, now)
+        else:
+            state.pending = message
+            if state.flush is None:
+                state.flush = loop.call_at(
+                    state.last_sent + self._min_interval, self._flush_pending, key
+                )
 
     async def send_complete(self, document_id: UUID) -> None:
         """Send completion message to all connected clients for a document."""
-        message = WebSocketMessage.complete(document_id)
-        await self._broadcast_to_document(document_id, message)
+        self._update_channel(str(document_id), {"s": COMPLETED_STAGE, "p": 100})
+        self._finish(str(document_id), WebSocketMessage.complete(document_id))
 
     async def send_error(self, document_id: UUID, error_message: str) -> None:
         """Send error message to all connected clients for a document."""
-        message = WebSocketMessage.error(document_id, error_message)
-        await self._broadcast_to_document(document_id, message)
+        key = str(document_id)
+        previous = self._channel_entry(key)
+        percent = previous["p"] if previous else 0
+        self._update_channel(key, {"s": ERROR_STAGE, "p": percent, "m": error_message})
+        self._finish(key, WebSocketMessage.error(document_id, error_message))
+
+    def _emit(self, key: str, state: _DocumentProgress, message: str, now: float) -> None:
+        """Publish a progress message now, superseding any pending one."""
+        if state.flush is not None:
+            state.flush.cancel()
+            state.flush = None
+        state.pending = None
+        state.last_sent = now
+        self._publish(key, message)
+
+    def _flush_pending(self, key: str) -> None:
+        """Timer callback: publish the latest coalesced update."""
+        state = self._progress.get(key)
+        if state is None:
+            return
+        state.flush = None
+        if state.pending is not None:
+            self._emit(key, state, state.pending, asyncio.get_running_loop().time())
+
+    def _finish(self, key: str, message: str) -> None:
+        """Publish a terminal message (pending progress is dropped)."""
+        state = self._progress.pop(key, None)
+        if state is not None and state.flush is not None:
+            state.flush.cancel()
+        self._publish(key, message)
+
+    def _publish(self, key: str, message: str) -> None:
+        """Queue a message on every connection of a document."""
+        for connection in self._connections.get(key, {}).values():
+            connection.push(message)
+
+    async def _run_sender(self, key: str, connection: _Connection) -> None:
+        """Sender task of a connection (drops the connection if sending fails)."""
+        try:
+            await connection.run_sender()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to document {key} client: {e}")
+            self._remove(key, connection)
+
+    def _remove(self, key: str, connection: _Connection) -> None:
+        """Unregister a connection (and the document's state with its last one)."""
+        connections = self._connections.get(key)
+        if connections is None or connections.get(id(connection.websocket)) is not connection:
+            return
+        del connections[id(connection.websocket)]
+        if not connections:
+            del self._connections[key]
+            state = self._progress.pop(key, None)
+            if state is not None and state.flush is not None:
+                state.flush.cancel()
+
+    def bind_document(self, document_id: UUID, project_id: str) -> None:
+        """
+        Follow a document on its project channel (as queued).
 
-    async def _broadcast_to_document(self, document_id: UUID, message: str) -> None:
-        """Broadcast message to all connections for a specific document."""
-        dead_connections = []
+        Called when a document is queued or starts processing; a document
+        that already has an active entry keeps it.
+        """
+        key = str(document_id)
+        self._document_projects[key] = project_id
+        entry = self._channel_entry(key)
+        if entry is None or entry["s"] in (COMPLETED_STAGE, ERROR_STAGE):
+            self._update_channel(key, {"s": QUEUED_STAGE, "p": 0})
+
+    def forget_document(self, document_id: UUID) -> None:
+        """Remove a document from its project channel (e.g. its job was cancelled)."""
+        key = str(document_id)
+        self._update_channel(key, None)
+        self._document_projects.pop(key, None)
+
+    async def connect_project(self, websocket: WebSocket, project_id: str) -> None:
+        """
+        Accept a project channel connection.
 
-        for conn_id, websocket in self._active_connections.items():
-            if conn_id.startswith(str(document_id)):
-                try:
-                    await websocket.send_text(message)
-                except Exception as e:
-                    logger.warning(f"Failed to send to {conn_id}: {e}")
-                    dead_connections.append(conn_id)
+        The client first gets a snapshot of every followed document, then
+        delta frames with the documents that changed (at most max_rate_hz).
+
+        Args:
+            websocket: The WebSocket connection
+            project_id: Project to follow
+        """
+        await websocket.accept()
+        channel = self._channels.setdefault(project_id, _ProjectChannel())
+        subscriber = _ChannelSubscriber(websocket)
+        channel.subscribers[id(websocket)] = subscriber
+        sender = asyncio.create_task(
+            self._run_channel_sender(project_id, channel, subscriber)
+        )
+        logger.info(f"Project channel connected for project {project_id}")
 
-        # Clean up dead connections
-        for conn_id in dead_connections:
-            self._active_connections.pop(conn_id, None)
+        try:
+            while True:
+                try:
+                    await asyncio.wait_for(websocket.receive_text(), timeout=60.0)
+                except asyncio.TimeoutError:
+                    subscriber.ping = True
+                    subscriber.ready.set()
+        except WebSocketDisconnect:
+            logger.info(f"Project channel disconnected for project {project_id}")
+        finally:
+            sender.cancel()
+            self._remove_subscriber(project_id, subscriber)
+
+    def _channel_entry(self, key: str) -> Optional[dict]:
+        """Current channel entry of a document, if it is bound."""
+        project_id = self._document_projects.get(key)
+        channel = self._channels.get(project_id) if project_id else None
+        return channel.documents.get(key) if channel else None
+
+    def _update_channel(self, key: str, entry: Optional[dict]) -> None:
+        """Update a bound document on its project channel."""
+        project_id = self._document_projects.get(key)
+        if project_id is None:
+            return
+        channel = self._channels.setdefault(project_id, _ProjectChannel())
+        channel.update(key, entry)
+        if not channel.subscribers and not channel.active:
+            # Nobody follows a finished run: drop its state
+            for document_id in channel.documents:
+                self._document_projects.pop(document_id, None)
+            del self._channels[project_id]
+
+    async def _run_channel_sender(
+        self, project_id: str, channel: _ProjectChannel, subscriber: _ChannelSubscriber
+    ) -> None:
+        """Sender task of a channel client (drops the client if sending fails)."""
+        try:
+            await subscriber.run_sender(channel, project_id, self._min_interval)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.warning(f"Failed to send to project {project_id} client: {e}")
+            self._remove_subscriber(project_id, subscriber)
+
+    def _remove_subscriber(self, project_id: str, subscriber: _ChannelSubscriber) -> None:
+        """Unregister a channel client (and an idle channel with its last one)."""
+        channel = self._channels.get(project_id)
+        if channel is None or channel.subscribers.get(id(subscriber.websocket)) is not subscriber:
+            return
+        del channel.subscribers[id(subscriber.websocket)]
+        if not channel.subscribers and not channel.active:
+            for document_id in channel.documents:
+                self._document_projects.pop(document_id, None)
+            del self._channels[project_id]
 
     def get_active_count(self) -> int:
-        """Get number of active connections."""
-        return len(self._active_connections)
+        """Get number of active connections (project channels included)."""
+        documents = sum(len(connections) for connections in self._connections.values())
+        return documents + sum(len(c.subscribers) for c in self._channels.values())
 
     def get_document_connections(self, document_id: UUID) -> int:
         """Get number of connections for a specific document."""
-        prefix = str(document_id)
-        return sum(1 for conn_id in self._active_connections if conn_id.startswith(prefix))
+        return len(self._connections.get(str(document_id), ()))
 
 
 # Global handler instance
@@ -225,3 +543,14 @@ async def handle_progress_websocket(websocket: WebSocket, document_id: UUID) ->
         document_id: Document to monitor
     """
     await progress_handler.connect(websocket, document_id)
+
+
+async def handle_project_progress_websocket(websocket: WebSocket, project_id: UUID) -> None:
+    """
+    FastAPI WebSocket endpoint handler for a project channel.
+
+    Args:
+        websocket: WebSocket connection
+        project_id: Project to follow
+    """
+    await progress_handler.connect_project(websocket, str(project_id))
@@ -9,11 +9,17 @@ from contextsafe.application.ports.anonymization_service import (
     AnonymizationResult,
     AnonymizationService,
     EntityReplacement,
+    ReplacementOffsetMap,
 )
 from contextsafe.application.ports.document_repository import DocumentRepository
 from contextsafe.application.ports.event_publisher import EventPublisher
 from contextsafe.application.ports.glossary_repository import GlossaryRepository
-from contextsafe.application.ports.ner_service import NerDetection, NerService, ProgressCallback
+from contextsafe.application.ports.ner_service import (
+    NerDetection,
+    NerDetections,
+    NerService,
+    ProgressCallback,
+)
 from contextsafe.application.ports.project_repository import ProjectRepository
 from contextsafe.application.ports.text_extractor import ExtractionResult, TextExtractor
 from contextsafe.application.ports.text_preprocessor import (
@@ -31,6 +37,7 @@ __all__ = [
     # Services
     "NerService",
     "NerDetection",
+    "NerDetections",
     "ProgressCallback",
     "TextExtractor",
     "ExtractionResult",
@@ -38,6 +45,7 @@ __all__ = [
     "AnonymizationService",
     "AnonymizationResult",
     "EntityReplacement",
+    "ReplacementOffsetMap",
     # Preprocessors
     "IngestPreprocessor",
     "DetectionPreprocessor",
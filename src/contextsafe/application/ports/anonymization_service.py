@@ -12,7 +12,9 @@ Traceability:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
+from array import array
+from bisect import bisect_right
+from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
 
@@ -28,6 +30,7 @@ class AnonymizationResult:
     anonymized_text: str
     replacements: list[EntityReplacement]
     error: str | None = None
+    offset_map: ReplacementOffsetMap | None = None
 
     @property
     def success(self) -> bool:
@@ -47,6 +50,70 @@ class EntityReplacement:
     confidence: float
 
 
+@dataclass(frozen=True, slots=True)
+class ReplacementOffsetMap:
+    """
+    Original <-> anonymized offsets for a set of replacements.
+
+    Stores one entry per replaced span (sorted by original start): the
+    original span and the span of the inserted alias. Text between
+    replacements is copied unchanged, so every other offset is a shift
+    from the nearest replacement.
+    """
+
+    original_length: int
+    anonymized_length: int
+    original_starts: array = field(default_factory=lambda: array("I"))
+    original_ends: array = field(default_factory=lambda: array("I"))
+    anonymized_starts: array = field(default_factory=lambda: array("I"))
+    anonymized_ends: array = field(default_factory=lambda: array("I"))
+
+    def __len__(self) -> int:
+        return len(self.original_starts)
+
+    def to_anonymized_offset(self, offset: int) -> int:
+        """
+        Translate an original offset to the anonymized text.
+
+        Offsets inside a replaced span map to the start of its alias.
+        """
+        i = bisect_right(self.original_starts, offset) - 1
+        if i < 0:
+            return offset
+        if offset < self.original_ends[i]:
+            return self.anonymized_starts[i]
+        return self._resume(i) + (offset - self.original_ends[i])
+
+    def to_anonymized_span(self, start: int, end: int) -> tuple[int, int]:
+        """
+        Translate an original span to the anonymized text (for highlighting).
+
+        A span ending inside a replacement extends to the end of its alias.
+        """
+        anon_start = self.to_anonymized_offset(start)
+        if end <= start:
+            return (anon_start, anon_start)
+
+        last = end - 1
+        i = bisect_right(self.original_starts, last) - 1
+        if i >= 0 and last < self.original_ends[i]:
+            anon_end = self.anonymized_ends[i]
+        else:
+            anon_end = self.to_anonymized_offset(last) + 1
+        return (anon_start, max(anon_start, anon_end))
+
+    def anonymized_spans(self) -> list[tuple[int, int]]:
+        """Spans of the inserted aliases in the anonymized text."""
+        return list(zip(self.anonymized_starts, self.anonymized_ends))
+
+    def _resume(self, i: int) -> int:
+        """Anonymized offset of the first original char after replacement i."""
+        if i + 1 < len(self.original_starts):
+            gap = self.original_starts[i + 1] - self.original_ends[i]
+            return self.anonymized_starts[i + 1] - gap
+        return self.anonymized_length - (self.original_length - self.original_ends[i])
+
+
 class AnonymizationService(ABC):
     """
     Port for anonymization services.
@@ -122,3 +189,12 @@ class AnonymizationService(ABC):
             Dict mapping category -> {original_value: alias}
         """
         ...
+
+    @abstractmethod
+    async def clear_project_glossary(self, project_id: str) -> None:
+        """
+        Forget all aliases and synthetic values of a project.
+
+        Removes the stored copy too: it holds the original PII values.
+        """
+        ...
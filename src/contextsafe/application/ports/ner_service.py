@@ -10,7 +10,7 @@ Traceability:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from collections.abc import Awaitable, Callable
+from collections.abc import Awaitable, Callable, Iterable
 from dataclasses import dataclass
 
 from contextsafe.domain.shared.value_objects import (
@@ -64,6 +64,25 @@ class NerDetection:
         )
 
 
+class NerDetections(list[NerDetection]):
+    """
+    Detections plus the detectors that did not run.
+
+    Services combining several detectors (CompositeNerAdapter) return it
+    so callers can tell a degraded result (a detector failed or was
+    unavailable) from a complete one, e.g. to avoid caching it.
+    """
+
+    def __init__(self, detections: Iterable[NerDetection] = (), skipped: Iterable[str] = ()):
+        super().__init__(detections)
+        self.skipped = tuple(skipped)
+
+    @property
+    def complete(self) -> bool:
+        """True when every detector ran."""
+        return not self.skipped
+
+
 class NerService(ABC):
     """
     Port for Named Entity Recognition.
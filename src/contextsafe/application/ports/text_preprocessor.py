@@ -10,6 +10,7 @@ Traceability:
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 
 
@@ -26,8 +27,10 @@ class OffsetMapping:
 
     source_text: str
     normalized_text: str
-    char_map: tuple[int, ...] = field(default_factory=tuple)
-    """char_map[i] = posición en source_text del carácter i del normalized."""
+    char_map: Sequence[int] = field(default_factory=tuple)
+    """char_map[i] = posición en source_text del carácter i del normalized.
+
+    Tupla o array('I') compacto (TextNormalizer) para documentos grandes."""
 
     def to_original_span(self, norm_start: int, norm_end: int) -> tuple[int, int]:
         """
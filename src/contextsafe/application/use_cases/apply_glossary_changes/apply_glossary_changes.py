@@ -11,7 +11,6 @@ Traceability:
 """
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import Optional
 
@@ -20,6 +19,7 @@ from contextsafe.application.ports import (
     EventPublisher,
     GlossaryRepository,
 )
+from contextsafe.domain.anonymization.services.glossary_matcher import get_glossary_matcher
 from contextsafe.domain.shared.errors import DocumentError, DomainError, NotFoundError
 from contextsafe.domain.shared.events import DocumentAnonymized
 from contextsafe.domain.shared.types import Err, Ok, Result
@@ -235,21 +235,11 @@ class ApplyGlossaryChanges:
         # Map: original_term -> new_alias
         text = aggregate.extracted_text
 
-        # Sort mappings by length (longest first) to avoid partial replacements
-        sorted_mappings = sorted(
-            glossary.mappings,
-            key=lambda m: len(m.normalized_value),
-            reverse=True,
+        # 5. Apply replacements in one pass (case-insensitive, longest match first)
+        matcher = get_glossary_matcher(
+            (mapping.normalized_value, mapping.alias.value) for mapping in glossary.mappings
         )
-
-        # 5. Apply replacements (case-insensitive)
-        for mapping in sorted_mappings:
-            # Create case-insensitive pattern for original term
-            pattern = re.compile(
-                re.escape(mapping.normalized_value),
-                re.IGNORECASE,
-            )
-            text = pattern.sub(mapping.alias.value, text)
+        text = matcher.replace(text)
 
         # 6. Update document aggregate
         # Note: We're updating the anonymized_text directly without state transition
@@ -269,8 +259,8 @@ class ApplyGlossaryChanges:
             anonymization_level=str(aggregate.anonymization_level)
             if aggregate.anonymization_level
             else "INTERMEDIATE",
-            entities_anonymized=len(sorted_mappings),
-            unique_aliases_used=len(sorted_mappings),
+            entities_anonymized=len(glossary.mappings),
+            unique_aliases_used=len(glossary.mappings),
             original_length=len(aggregate.extracted_text),
             anonymized_length=len(text),
         )
@@ -10,7 +10,6 @@ Traceability:
 """
 from __future__ import annotations
 
-import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -19,6 +18,7 @@ from contextsafe.application.ports import (
     EventPublisher,
     GlossaryRepository,
 )
+from contextsafe.domain.anonymization.services.glossary_matcher import get_glossary_matcher
 from contextsafe.domain.shared.errors import DocumentError, DomainError, NotFoundError
 from contextsafe.domain.shared.events import DocumentAnonymized
 from contextsafe.domain.shared.types import Err, Ok, Result
@@ -269,7 +269,7 @@ class GenerateAnonymized:
         Returns:
             Text with additional replacements applied
         """
-        additional_replacements: list[tuple[int, int, str]] = []
+        scan_entries: list[tuple[str, str]] = []
 
         for lookup_key, mapping in glossary._mappings_by_value.items():
             parts = lookup_key.split(":", 1)
@@ -293,21 +293,11 @@ class GenerateAnonymized:
             if len(normalized_value) < 5:
                 continue
 
-            # Search case-insensitive in the current text
-            pattern = re.compile(re.escape(normalized_value), re.IGNORECASE)
-            for match in pattern.finditer(text):
-                m_start, m_end = match.start(), match.end()
-
-                # Skip if this span overlaps with an already-replaced zone
-                overlaps = False
-                for r_start, r_end in replaced_spans:
-                    if m_start < r_end and m_end > r_start:
-                        overlaps = True
-                        break
-                if overlaps:
-                    continue
-
-                additional_replacements.append((m_start, m_end, mapping.alias.value))
+            scan_entries.append((normalized_value, mapping.alias.value))
+
+        # Search case-insensitive in the current text, outside already-replaced zones
+        matcher = get_glossary_matcher(scan_entries)
+        additional_replacements = matcher.find_outside(text, replaced_spans)
 
         # Apply replacements in reverse order (largest offset first)
         additional_replacements.sort(key=lambda x: x[0], reverse=True)
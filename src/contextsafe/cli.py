@@ -65,7 +65,7 @@ def init_db(path: str) -> None:
 
 
 @cli.command("download-model")
-@click.argument("model_name")
+@click.argument("model_name", default="MMG/xlm-roberta-large-ner-spanish")
 @click.option(
     "--output-dir",
     type=click.Path(),
@@ -78,14 +78,54 @@ def init_db(path: str) -> None:
     default="cpu",
     help="Compute mode",
 )
-def download_model(model_name: str, output_dir: str, compute_mode: str) -> None:
-    """Download an LLM model from Hugging Face."""
+@click.option("--onnx", "export_onnx", is_flag=True, help="Also export an ONNX graph (CPU only)")
+@click.option("--quantize/--no-quantize", default=True, help="Write an int8 ONNX graph")
+def download_model(
+    model_name: str, output_dir: str, compute_mode: str, export_onnx: bool, quantize: bool
+) -> None:
+    """Download an NER model from Hugging Face (optionally exporting it to ONNX)."""
     click.echo(f"Downloading model: {model_name}")
     click.echo(f"Output directory: {output_dir}")
     click.echo(f"Compute mode: {compute_mode}")
 
-    # TODO: Implement actual download logic
-    click.echo("Model download not yet implemented.")
+    from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+    model_dir = Path(output_dir) / model_name.replace("/", "--")
+    AutoTokenizer.from_pretrained(model_name).save_pretrained(model_dir)
+    AutoModelForTokenClassification.from_pretrained(model_name).save_pretrained(model_dir)
+    click.echo(f"Model saved to {model_dir}")
+
+    if export_onnx:
+        if compute_mode == "gpu":
+            click.echo("Note: the ONNX backend runs on CPU only.")
+        _export_onnx(model_dir, model_dir.with_name(f"{model_dir.name}_onnx"), quantize)
+
+
+@cli.command("export-onnx")
+@click.argument("model_path")
+@click.option(
+    "--output-dir",
+    type=click.Path(),
+    default=None,
+    help="Output directory (default: <model_path>_onnx)",
+)
+@click.option("--quantize/--no-quantize", default=True, help="Write an int8 ONNX graph")
+def export_onnx(model_path: str, output_dir: str | None, quantize: bool) -> None:
+    """Export a token-classification model to ONNX (with int8 quantization)."""
+    target = Path(output_dir) if output_dir else Path(f"{model_path.rstrip('/')}_onnx")
+    _export_onnx(model_path, target, quantize)
+
+
+def _export_onnx(model_path: str | Path, output_dir: Path, quantize: bool) -> None:
+    """Run the ONNX export and report where the graphs were written."""
+    from contextsafe.infrastructure.nlp.onnx_ner_adapter import export_onnx_model
+
+    click.echo(f"Exporting {model_path} to ONNX...")
+    export_onnx_model(model_path, output_dir, quantize=quantize)
+    click.echo(f"ONNX model written to {output_dir}")
+    if quantize:
+        click.echo("int8 graph: model.int8.onnx")
+    click.echo(f"Enable with: NER_BACKEND=onnx NER_ONNX_DIR={output_dir}")
 
 
 @cli.command()
@@ -8,12 +8,22 @@ Exports:
 - find_matching_value: Find matching value in glossary
 - DateShifter: Service for uniform date shifting
 - get_date_shifter: Get global date shifter instance
+- parse_spanish_date: Cached Spanish date parser
+- GlossaryMatcher: Single-pass multi-value glossary matcher
+- get_glossary_matcher: Get cached matcher for a glossary
+- GlossaryIndex: Indexed find_matching_value over a growing glossary
 """
 
 from contextsafe.domain.anonymization.services.date_shifter import (
     DateShiftConfig,
     DateShifter,
     get_date_shifter,
+    parse_spanish_date,
+)
+from contextsafe.domain.anonymization.services.glossary_index import GlossaryIndex
+from contextsafe.domain.anonymization.services.glossary_matcher import (
+    GlossaryMatcher,
+    get_glossary_matcher,
 )
 from contextsafe.domain.anonymization.services.normalization import (
     find_matching_value,
@@ -33,4 +43,9 @@ __all__ = [
     "DateShifter",
     "DateShiftConfig",
     "get_date_shifter",
+    "parse_spanish_date",
+    # Glossary matching
+    "GlossaryMatcher",
+    "get_glossary_matcher",
+    "GlossaryIndex",
 ]
@@ -23,10 +23,12 @@ Example:
 
 from __future__ import annotations
 
+import hashlib
 import random
 import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import Optional
 
 
@@ -57,6 +59,60 @@ MONTHS_ES = [
 ]
 
 
+# Distinct date strings kept parsed (shared by DateShifter and the glossary)
+PARSE_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def parse_spanish_date(date_str: str) -> Optional[datetime]:
+    """
+    Parse Spanish date strings into datetime objects.
+
+    Supports formats:
+    - "15 de marzo de 2024"
+    - "15/03/2024"
+    - "2024-03-15"
+    - "15-03-2024"
+
+    Results are cached per string, so a date repeated across a document
+    (or looked up again by the glossary) is parsed once.
+
+    Returns None if parsing fails.
+    """
+    date_str = date_str.strip()
+    date_lower = date_str.lower()
+
+    # Format: "15 de marzo de 2024"
+    match = re.match(r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", date_lower, re.IGNORECASE)
+    if match:
+        day, month_name, year = match.groups()
+        try:
+            month_idx = MONTHS_ES.index(month_name.lower()) + 1
+            return datetime(int(year), month_idx, int(day))
+        except (ValueError, IndexError):
+            pass
+
+    # Format: "15/03/2024" or "15-03-2024"
+    match = re.match(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})", date_str)
+    if match:
+        day, month, year = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+
+    # Format: "2024-03-15" or "2024/03/15" (ISO)
+    match = re.match(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})", date_str)
+    if match:
+        year, month, day = match.groups()
+        try:
+            return datetime(int(year), int(month), int(day))
+        except ValueError:
+            pass
+
+    return None
+
+
 class DateShifter:
     """
     Uniform date shifting service per project.
@@ -82,11 +138,12 @@ class DateShifter:
         Get or create the delta for a project.
 
         Delta is deterministic based on project_id for reproducibility.
-        The same project_id always produces the same delta.
+        The same project_id always produces the same delta, in every process:
+        dates shifted before a restart are kept in the stored glossary.
         """
         if project_id not in self._deltas:
-            # Use project_id as seed for reproducibility
-            seed = hash(project_id) % (2**32)
+            # Seed from project_id (sha256: hash() is salted per process)
+            seed = int.from_bytes(hashlib.sha256(project_id.encode()).digest()[:8], "big")
             rng = random.Random(seed)
 
             days = rng.randint(config.min_shift_days, config.max_shift_days)
@@ -180,38 +237,7 @@ class DateShifter:
 
     def _parse_spanish_date(self, date_str: str) -> Optional[datetime]:
         """Parse Spanish date strings into datetime objects."""
-        date_str = date_str.strip()
-        date_lower = date_str.lower()
-
-        # Format: "15 de marzo de 2024"
-        match = re.match(r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", date_lower, re.IGNORECASE)
-        if match:
-            day, month_name, year = match.groups()
-            try:
-                month_idx = MONTHS_ES.index(month_name.lower()) + 1
-                return datetime(int(year), month_idx, int(day))
-            except (ValueError, IndexError):
-                pass
-
-        # Format: "15/03/2024" or "15-03-2024"
-        match = re.match(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})", date_str)
-        if match:
-            day, month, year = match.groups()
-            try:
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
-
-        # Format: "2024-03-15" or "2024/03/15" (ISO)
-        match = re.match(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})", date_str)
-        if match:
-            year, month, day = match.groups()
-            try:
-                return datetime(int(year), int(month), int(day))
-            except ValueError:
-                pass
-
-        return None
+        return parse_spanish_date(date_str)
 
     def _format_like_original(self, date: datetime, original_str: str) -> str:
         """Format date in the same style as the original string."""
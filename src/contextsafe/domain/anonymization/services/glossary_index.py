@@ -0,0 +1,179 @@
+"""
+Indexed glossary lookup.
+
+Same results as ``find_matching_value`` (first matching candidate in
+insertion order, exact -> partial -> fuzzy), without scanning and
+re-normalizing every candidate on each lookup:
+
+- exact pass: normalized value -> first entry (hash map)
+- partial pass (PERSON_NAME): word-prefix tuples -> first entry, so
+  "alberto baxeras" finds "alberto baxeras aizpún" and vice versa
+- fuzzy pass (PERSON_NAME): entries bucketed by string length; fuzzy
+  scores are only computed for entries whose length can still reach
+  FUZZY_MATCH_THRESHOLD (a ratio is bounded by 2*min(len)/(len1+len2))
+
+Traceability:
+- Bug Fix: Corrección #5 - Inconsistencia de entidades
+- Bug Fix: FP-6 - Typos no consolidados (Tapia vs Tapias)
+"""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Iterable
+from typing import Optional
+
+from contextsafe.domain.anonymization.services import normalization
+from contextsafe.domain.anonymization.services.normalization import normalize_pii_value
+
+
+class GlossaryIndex:
+    """
+    Lookup index over the original values of one glossary category.
+
+    Values are matched with the normalization rules of ``category`` (the
+    cross-category check indexes other categories with PERSON_NAME rules).
+    The index only grows; ``find`` returns the matching original value so
+    the caller reads the current alias from its own dict.
+    """
+
+    def __init__(self, category: str, values: Iterable[str] = ()) -> None:
+        """
+        Build the index.
+
+        Args:
+            category: Category whose matching rules apply
+            values: Initial original values, in insertion order
+        """
+        self._category = category
+        self._originals: list[str] = []
+        self._normalized: list[str] = []
+        # token_sort_ratio input (thefuzz full_process), computed once per entry
+        self._processed: list[str] = []
+        self._positions: dict[str, int] = {}
+        # normalized value -> first entry
+        self._exact: dict[str, int] = {}
+        # full word tuple -> first entry / proper word prefix -> first longer entry
+        self._words: dict[tuple[str, ...], int] = {}
+        self._word_prefixes: dict[tuple[str, ...], int] = {}
+        # length -> entries (ascending), for ratio and token_sort_ratio bounds
+        self._by_length: dict[int, list[int]] = {}
+        self._by_token_length: dict[int, list[int]] = {}
+
+        for value in values:
+            self.add(value)
+
+    def __len__(self) -> int:
+        return len(self._originals)
+
+    def __contains__(self, original: str) -> bool:
+        return original in self._positions
+
+    def add(self, original: str) -> None:
+        """Index an original value (no-op if already indexed)."""
+        if original in self._positions:
+            return
+        i = len(self._originals)
+        normalized = normalize_pii_value(original, self._category)
+        self._originals.append(original)
+        self._normalized.append(normalized)
+        self._positions[original] = i
+
+        self._exact.setdefault(normalized, i)
+
+        if self._category == "PERSON_NAME":
+            words = tuple(normalized.split())
+            self._words.setdefault(words, i)
+            for k in range(2, len(words)):
+                self._word_prefixes.setdefault(words[:k], i)
+
+            self._by_length.setdefault(len(normalized), []).append(i)
+            if normalization.THEFUZZ_AVAILABLE:
+                processed = _full_process(normalized)
+                self._processed.append(processed)
+                self._by_token_length.setdefault(_token_sort_length(processed), []).append(i)
+
+    def find(self, target: str) -> Optional[str]:
+        """
+        Find the original value ``target`` refers to.
+
+        Args:
+            target: Value to look up
+
+        Returns:
+            The first matching original value, or None
+        """
+        target_normalized = normalize_pii_value(target, self._category)
+
+        # First pass: exact match (normalized)
+        i = self._exact.get(target_normalized)
+        if i is not None:
+            return self._originals[i]
+
+        if self._category != "PERSON_NAME" or not target_normalized:
+            return None
+
+        # Second pass: partial name matching (target or original is a word prefix)
+        target_words = tuple(target_normalized.split())
+        if len(target_words) >= 2:
+            matches = [self._word_prefixes.get(target_words)]
+            matches.extend(self._words.get(target_words[:k]) for k in range(len(target_words)))
+            found = [m for m in matches if m is not None]
+            if found:
+                return self._originals[min(found)]
+
+        # Third pass: fuzzy matching for typos
+        if normalization.THEFUZZ_AVAILABLE:
+            return self._find_fuzzy(target_normalized)
+        return None
+
+    def _find_fuzzy(self, target_normalized: str) -> Optional[str]:
+        fuzz = normalization.fuzz
+        threshold = normalization.FUZZY_MATCH_THRESHOLD
+
+        target_processed = _full_process(target_normalized)
+
+        candidates = set(_length_window(self._by_length, len(target_normalized), threshold))
+        token_length = _token_sort_length(target_processed)
+        candidates.update(_length_window(self._by_token_length, token_length, threshold))
+
+        for i in sorted(candidates):
+            if fuzz.ratio(target_normalized, self._normalized[i]) >= threshold:
+                return self._originals[i]
+            # Same score as token_sort_ratio(target, original) with default processing
+            token_ratio = fuzz.token_sort_ratio(
+                target_processed, self._processed[i], full_process=False
+            )
+            if token_ratio >= threshold:
+                return self._originals[i]
+        return None
+
+
+def _length_window(buckets: dict[int, list[int]], length: int, threshold: int) -> list[int]:
+    """
+    Entries whose length allows a rounded ratio >= threshold.
+
+    ratio <= 200 * min(len1, len2) / (len1 + len2); rounding passes from
+    threshold - 0.5. Empty strings are always included.
+    """
+    reach = (threshold - 0.5) / 100
+    if length == 0 or reach <= 0:
+        return [i for ids in buckets.values() for i in ids]
+    low = math.floor(length * reach / (2 - reach)) - 1
+    high = math.ceil(length * (2 - reach) / reach) + 1
+    result = list(buckets.get(0, ()))
+    for candidate_length in range(max(low, 1), high + 1):
+        result.extend(buckets.get(candidate_length, ()))
+    return result
+
+
+def _full_process(value: str) -> str:
+    """Preprocessing token_sort_ratio applies by default."""
+    from thefuzz import utils
+
+    return utils.full_process(value, force_ascii=True)
+
+
+def _token_sort_length(processed: str) -> int:
+    """Length of the sorted-token string token_sort_ratio compares."""
+    return len(" ".join(sorted(processed.split())))
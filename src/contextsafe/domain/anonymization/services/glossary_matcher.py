@@ -0,0 +1,181 @@
+"""
+Multi-pattern glossary matcher.
+
+Finds every glossary value in a text in a single pass, instead of compiling
+and running one case-insensitive regex per glossary entry (which costs
+O(entries x text) and, when chained with ``sub``, re-matches text that was
+already replaced by an alias).
+
+The glossary values are inserted into a case-folded trie and the trie is
+compiled into one regex (``juan(?: garcía(?: pérez)?| pérez)|maría ...``).
+The regex engine walks the trie in C, so at each text position it follows
+a single path instead of trying every entry; longer continuations are tried
+first, which gives leftmost-longest, non-overlapping matches (the same
+semantics as an Aho-Corasick automaton with leftmost-longest selection).
+
+Matchers are cached by glossary content: a glossary is compiled once and a
+changed glossary (new entry, new alias) gets a new matcher.
+
+Traceability:
+- Bug Fix: Corrección #5 - Inconsistencia de entidades (PLAN_CORRECCION_AUDITORIA.md)
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterable, Iterator
+from functools import lru_cache
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+# Distinct glossaries kept compiled (one per project/level in practice)
+MATCHER_CACHE_SIZE = 32
+
+# Trie node key marking the end of a glossary value
+_END = ""
+
+
+class GlossaryMatcher(Generic[T]):
+    """
+    Case-insensitive, leftmost-longest matcher over a set of glossary values.
+
+    Matching follows ``re.IGNORECASE`` rules, like the per-entry patterns
+    it replaces. When two values are equal ignoring case, the first one
+    given wins.
+    """
+
+    def __init__(self, entries: Iterable[tuple[str, T]]) -> None:
+        """
+        Build the matcher.
+
+        Args:
+            entries: (value, payload) pairs; empty values are ignored
+        """
+        self._payloads: dict[str, T] = {}
+        self._originals: list[tuple[str, T]] = []
+        trie: dict = {}
+
+        for value, payload in entries:
+            if not value:
+                continue
+            folded = value.lower()
+            if folded in self._payloads:
+                continue
+            self._payloads[folded] = payload
+            self._originals.append((value, payload))
+
+            node = trie
+            for ch in folded:
+                node = node.setdefault(ch, {})
+            node[_END] = {}
+
+        self._pattern = re.compile(_trie_pattern(trie), re.IGNORECASE) if trie else None
+
+    def __len__(self) -> int:
+        return len(self._payloads)
+
+    def finditer(
+        self, text: str, start: int = 0, end: int | None = None
+    ) -> Iterator[tuple[int, int, T]]:
+        """
+        Find glossary values in text[start:end].
+
+        Args:
+            text: Text to scan
+            start: First position to scan
+            end: Position where the scan stops (default: end of text)
+
+        Yields:
+            (start, end, payload) for each non-overlapping match, left to right
+        """
+        if self._pattern is None:
+            return
+        end = len(text) if end is None else end
+        for match in self._pattern.finditer(text, start, end):
+            yield match.start(), match.end(), self._payload(match.group())
+
+    def find_all(
+        self, text: str, start: int = 0, end: int | None = None
+    ) -> list[tuple[int, int, T]]:
+        """List version of finditer."""
+        return list(self.finditer(text, start, end))
+
+    def find_outside(
+        self, text: str, excluded_spans: Iterable[tuple[int, int]]
+    ) -> list[tuple[int, int, T]]:
+        """
+        Find glossary values that do not overlap any excluded span.
+
+        Only the gaps between excluded spans are scanned.
+
+        Args:
+            text: Text to scan
+            excluded_spans: (start, end) spans to skip (e.g. already replaced)
+
+        Returns:
+            (start, end, payload) matches, left to right
+        """
+        matches: list[tuple[int, int, T]] = []
+        position = 0
+        for span_start, span_end in sorted(excluded_spans):
+            if span_start > position:
+                matches.extend(self.finditer(text, position, span_start))
+            position = max(position, span_end)
+        matches.extend(self.finditer(text, position))
+        return matches
+
+    def replace(self, text: str) -> str:
+        """
+        Replace every glossary value in text with its payload.
+
+        Payloads are inserted literally (they are not regex templates).
+        """
+        if self._pattern is None:
+            return text
+        return self._pattern.sub(lambda m: str(self._payload(m.group())), text)
+
+    def _payload(self, matched: str) -> T:
+        payload = self._payloads.get(matched.lower())
+        if payload is not None:
+            return payload
+        # Characters where str.lower() and re.IGNORECASE disagree (e.g. "ſ")
+        for value, candidate in self._originals:
+            if re.fullmatch(re.escape(value), matched, re.IGNORECASE):
+                return candidate
+        raise KeyError(matched)
+
+
+def _trie_pattern(node: dict) -> str:
+    """Compile a trie node into a regex that prefers the longest continuation."""
+    alternatives = [
+        re.escape(ch) + _trie_pattern(child) for ch, child in sorted(node.items()) if ch != _END
+    ]
+    if not alternatives:
+        return ""
+    body = "|".join(alternatives)
+    if _END in node:
+        return f"(?:{body})?"
+    return body if len(alternatives) == 1 else f"(?:{body})"
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(entries: tuple[tuple[str, str], ...]) -> GlossaryMatcher[str]:
+    return GlossaryMatcher(entries)
+
+
+def get_glossary_matcher(entries: Iterable[tuple[str, str]]) -> GlossaryMatcher[str]:
+    """
+    Get a (cached) matcher for glossary (value, alias) pairs.
+
+    The cache is keyed by the glossary content, so an unchanged glossary
+    reuses its compiled matcher and any change builds a new one.
+
+    Args:
+        entries: (original value, alias) pairs, in priority order
+
+    Returns:
+        GlossaryMatcher mapping matches to aliases
+    """
+    return _cached_matcher(tuple(entries))
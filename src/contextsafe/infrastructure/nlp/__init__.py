@@ -9,8 +9,11 @@ from contextsafe.infrastructure.nlp.anonymization_adapter import (
     get_anonymization_service,
 )
 from contextsafe.infrastructure.nlp.composite_adapter import CompositeNerAdapter
+from contextsafe.infrastructure.nlp.detection_cache import CachedNerAdapter, DetectionCache
 from contextsafe.infrastructure.nlp.hybrid_ner_adapter import HybridNerAdapter
+from contextsafe.infrastructure.nlp.onnx_ner_adapter import OnnxNerAdapter
 from contextsafe.infrastructure.nlp.presidio_adapter import PresidioNerAdapter
+from contextsafe.infrastructure.nlp.process_pool_adapter import ProcessPoolNerAdapter
 from contextsafe.infrastructure.nlp.recognizers.legal_titles import LegalTitlesRecognizer
 from contextsafe.infrastructure.nlp.regex_adapter import RegexNerAdapter
 from contextsafe.infrastructure.nlp.roberta_ner_adapter import RobertaNerAdapter
@@ -18,12 +21,16 @@ from contextsafe.infrastructure.nlp.spacy_adapter import SpacyNerAdapter
 
 
 __all__ = [
+    "CachedNerAdapter",
     "CompositeNerAdapter",
+    "DetectionCache",
     "HybridNerAdapter",
+    "OnnxNerAdapter",
     "RegexNerAdapter",
     "RobertaNerAdapter",
     "SpacyNerAdapter",
     "PresidioNerAdapter",
+    "ProcessPoolNerAdapter",
     "LegalTitlesRecognizer",
     "InMemoryAnonymizationAdapter",
     "get_anonymization_service",
@@ -14,9 +14,12 @@ Traceability:
 
 from __future__ import annotations
 
+import asyncio
 import copy
-import re
+import itertools
+import logging
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
@@ -26,81 +29,32 @@ from contextsafe.application.ports import (
     EntityReplacement,
     NerDetection,
 )
-from contextsafe.domain.anonymization.services.normalization import (
-    find_matching_value,
-)
+from contextsafe.domain.anonymization.services.date_shifter import parse_spanish_date
+from contextsafe.domain.anonymization.services.glossary_index import GlossaryIndex
+from contextsafe.domain.anonymization.services.glossary_matcher import get_glossary_matcher
+from contextsafe.infrastructure.nlp.merge.span_index import SpanIndex
+from contextsafe.infrastructure.text_processing.replacement_builder import ReplacementBuilder
 
 
 if TYPE_CHECKING:
     from contextsafe.application.compute_mode import ComputeMode
     from contextsafe.infrastructure.nlp.strategies.base import AnonymizationStrategy
+    from contextsafe.infrastructure.persistence import SQLiteSyntheticStore
+
+logger = logging.getLogger(__name__)
 
 
 # ============================================================================
 # DATE PARSING AND NORMALIZATION (ERROR 2)
 # ============================================================================
 
-# Spanish month names to numbers
-SPANISH_MONTHS = {
-    "enero": 1,
-    "febrero": 2,
-    "marzo": 3,
-    "abril": 4,
-    "mayo": 5,
-    "junio": 6,
-    "julio": 7,
-    "agosto": 8,
-    "septiembre": 9,
-    "octubre": 10,
-    "noviembre": 11,
-    "diciembre": 12,
-}
-
-
-def parse_spanish_date(date_str: str) -> Optional[datetime]:
-    """
-    Parse Spanish date strings into datetime objects.
-
-    Supports formats:
-    - "15 de marzo de 2024"
-    - "15/03/2024"
-    - "2024-03-15"
-    - "15-03-2024"
 
-    Returns None if parsing fails.
-    """
-    date_str = date_str.strip().lower()
-
-    # Format: "15 de marzo de 2024"
-    match = re.match(r"(\d{1,2})\s+de\s+(\w+)\s+de\s+(\d{4})", date_str, re.IGNORECASE)
-    if match:
-        day, month_name, year = match.groups()
-        month = SPANISH_MONTHS.get(month_name.lower())
-        if month:
-            try:
-                return datetime(int(year), month, int(day))
-            except ValueError:
-                pass
-
-    # Format: "15/03/2024" or "15-03-2024"
-    match = re.match(r"(\d{1,2})[/-](\d{1,2})[/-](\d{4})", date_str)
-    if match:
-        day, month, year = match.groups()
-        try:
-            return datetime(int(year), int(month), int(day))
-        except ValueError:
-            pass
-
-    # Format: "2024-03-15" or "2024/03/15" (ISO format)
-    match = re.match(r"(\d{4})[/-](\d{1,2})[/-](\d{1,2})", date_str)
-    if match:
-        year, month, day = match.groups()
-        try:
-            return datetime(int(year), int(month), int(day))
-        except ValueError:
-            pass
+@dataclass
+class _DateIndex:
+    """Parsed DATE glossary entries: first original value per date."""
 
-    return None
+    size: int = 0
+    originals: dict[datetime, str] = field(default_factory=dict)
 
 
 def get_chronological_alias(index: int) -> str:
@@ -170,12 +124,30 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
     - Support for controlled vocabulary prefixes
     """
 
-    def __init__(self) -> None:
-        """Initialize the anonymization adapter."""
+    def __init__(self, synthetic_store: SQLiteSyntheticStore | None = None) -> None:
+        """
+        Initialize the anonymization adapter.
+
+        Args:
+            synthetic_store: Optional persistent store for project glossaries,
+                counters and synthetic values (loaded lazily per project)
+        """
         # Glossary structure: {project_id: {category: {original: alias}}}
         self._glossaries: dict[str, dict[str, dict[str, str]]] = {}
+        # Lookup indexes: {project_id: {(category, matching_category): GlossaryIndex}}
+        self._glossary_indexes: dict[str, dict[tuple[str, str], GlossaryIndex]] = {}
+        # Parsed DATE entries per project, for format-independent date reuse
+        self._date_indexes: dict[str, _DateIndex] = {}
         # Counters structure: {project_id: {category: next_number}}
         self._counters: dict[str, dict[str, int]] = {}
+        # Level 3 synthetic values: {project_id: {(category, alias): synthetic}}
+        self._synthetic_values: dict[str, dict[tuple[str, str], str]] = {}
+        # Persistence: projects already loaded, and entry counts last saved
+        self._store = synthetic_store
+        self._loaded_projects: set[str] = set()
+        # One load at a time per project
+        self._load_locks: dict[str, asyncio.Lock] = {}
+        self._saved_sizes: dict[str, tuple[int, int]] = {}
 
     @staticmethod
     def _is_wsl() -> bool:
@@ -286,10 +258,13 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         )
 
         result: list[NerDetection] = []
+        selected_index: SpanIndex[NerDetection] = SpanIndex()
+        gap = max(0, self.MAX_ADJACENT_GAP)
         for detection in sorted_dets:
             # Check if this detection overlaps or is adjacent to ANY already selected
             should_skip = False
-            for selected in result:
+            nearby = selected_index.query(detection.span.start - gap, detection.span.end + gap)
+            for selected in nearby:
                 # Check strict overlap
                 if self._spans_overlap(detection.span, selected.span):
                     should_skip = True
@@ -302,6 +277,7 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
 
             if not should_skip:
                 result.append(detection)
+                selected_index.add(detection.span.start, detection.span.end, detection)
 
         return result
 
@@ -413,8 +389,9 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         - INTERMEDIATE: Pseudonyms (PseudonymStrategy)
         - ADVANCED: Synthetic names via LLM (SyntheticStrategy)
 
-        Processes detections in reverse order (by position) to maintain
-        correct offsets during replacement.
+        Replacements are collected against the original offsets and applied
+        in a single pass at the end (see ReplacementBuilder), which also
+        yields the original -> anonymized offset map.
 
         Args:
             progress_callback: Optional async callback(current, total, entity_info)
@@ -434,6 +411,8 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
                 replacements=[],
             )
 
+        await self._load_project_state(project_id)
+
         # Get strategy for this level
         strategy = self._get_strategy(level, compute_mode=compute_mode)
 
@@ -447,45 +426,55 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
             reverse=True,
         )
 
-        anonymized = text
+        builder = ReplacementBuilder(text)
         replacements: list[EntityReplacement] = []
         total_detections = len(sorted_detections)
 
-        for i, detection in enumerate(sorted_detections):
-            # Use strategy to generate replacement
-            # For Level 3 (ADVANCED), this includes LLM calls to Ollama
-            result = await strategy.generate_replacement(detection, project_id)
-
-            # Report progress AFTER processing - reflects COMPLETED work
-            # This ensures progress bar shows actual completion, not queued work
-            if progress_callback:
-                entity_info = f"{detection.category.value}: {result.replacement[:25]}..."
-                await progress_callback(i + 1, total_detections, entity_info)
-
-            # Replace in text (with boundary check to preserve whitespace)
-            start = detection.span.start
-            end = detection.span.end
-            after_char = anonymized[end : end + 1] if end < len(anonymized) else ""
-            space_suffix = " " if after_char.isalnum() else ""
-            anonymized = anonymized[:start] + result.replacement + space_suffix + anonymized[end:]
-
-            # Record replacement
-            replacements.append(
-                EntityReplacement(
-                    category=result.category,
-                    original_value=result.original,
-                    alias=result.replacement,
-                    start_offset=start,
-                    end_offset=end,
-                    confidence=detection.confidence.value,
+        try:
+            # Batch work first (Level 3: concurrent LLM synthesis of unique entities)
+            await strategy.prepare(sorted_detections, project_id)
+
+            for i, detection in enumerate(sorted_detections):
+                # Use strategy to generate replacement
+                # For Level 3 (ADVANCED), LLM values were already fetched in prepare()
+                result = await strategy.generate_replacement(detection, project_id)
+
+                # Report progress AFTER processing - reflects COMPLETED work
+                # This ensures progress bar shows actual completion, not queued work
+                if progress_callback:
+                    entity_info = f"{detection.category.value}: {result.replacement[:25]}..."
+                    await progress_callback(i + 1, total_detections, entity_info)
+
+                # Replace in text (the builder adds a space before a following word)
+                start = detection.span.start
+                end = detection.span.end
+                builder.replace(start, end, result.replacement)
+
+                # Record replacement
+                replacements.append(
+                    EntityReplacement(
+                        category=result.category,
+                        original_value=result.original,
+                        alias=result.replacement,
+                        start_offset=start,
+                        end_offset=end,
+                        confidence=detection.confidence.value,
+                    )
                 )
-            )
+        finally:
+            await strategy.close()
 
         # Glossary consistency scan — find values NER missed
         # Searches text for glossary-known entities (PERSON_NAME, ORGANIZATION)
         # that were not detected by NER (e.g., bare names in tables).
         replaced_spans = [(d.span.start, d.span.end) for d in sorted_detections]
-        anonymized = self._glossary_consistency_scan(anonymized, project_id, replaced_spans)
+        for start, end, alias_value in self._glossary_consistency_scan(
+            text, project_id, replaced_spans
+        ):
+            builder.replace(start, end, alias_value)
+
+        anonymized, offset_map = builder.build()
+        await self._save_project_state(project_id)
 
         # Final progress update
         if progress_callback:
@@ -498,6 +487,7 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
             original_text=text,
             anonymized_text=anonymized,
             replacements=replacements,
+            offset_map=offset_map,
         )
 
     def _glossary_consistency_scan(
@@ -505,65 +495,47 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         text: str,
         project_id: str,
         replaced_spans: list[tuple[int, int]],
-    ) -> str:
+    ) -> list[tuple[int, int, str]]:
         """
-        Post-replacement scan: find glossary-known values that NER missed.
+        Post-detection scan: find glossary-known values that NER missed.
 
-        Searches the already-partially-anonymized text for occurrences of
-        values that exist in the glossary but were not detected by NER.
-        This catches bare names in tables, repeated mentions without titles, etc.
+        Searches the original text, outside the spans NER already replaced,
+        for occurrences of values that exist in the glossary but were not
+        detected by NER (one GlossaryMatcher pass over the gaps). This catches
+        bare names in tables, repeated mentions without titles, etc.
 
         Only scans for PERSON_NAME and ORGANIZATION categories (the ones
         prone to detection gaps when appearing without contextual markers).
 
         Args:
-            text: Text after NER-based replacements
+            text: Original text
             project_id: Project ID for glossary lookup
-            replaced_spans: Spans already replaced (to avoid double-processing)
+            replaced_spans: Spans replaced from NER detections
 
         Returns:
-            Text with additional replacements applied
+            Additional (start, end, alias) replacements in original offsets
         """
         project_glossary = self._glossaries.get(project_id, {})
         if not project_glossary:
-            return text
+            return []
 
         # Only scan categories prone to detection gaps
         scan_categories = ("PERSON_NAME", "ORGANIZATION")
 
-        additional_replacements: list[tuple[int, int, str]] = []
-
-        for category in scan_categories:
-            entries = project_glossary.get(category, {})
-            for original_value, alias in entries.items():
-                # Skip very short values to avoid false matches
-                if len(original_value) < 5:
-                    continue
-
-                # Search case-insensitive in the current text
-                pattern = re.compile(re.escape(original_value), re.IGNORECASE)
-                for match in pattern.finditer(text):
-                    m_start, m_end = match.start(), match.end()
-
-                    # Skip if this span overlaps with an already-replaced zone
-                    overlaps = False
-                    for r_start, r_end in replaced_spans:
-                        if m_start < r_end and m_end > r_start:
-                            overlaps = True
-                            break
-                    if overlaps:
-                        continue
-
-                    additional_replacements.append((m_start, m_end, alias))
+        # Skip very short values to avoid false matches
+        matcher = get_glossary_matcher(
+            (original_value, alias)
+            for category in scan_categories
+            for original_value, alias in project_glossary.get(category, {}).items()
+            if len(original_value) >= 5
+        )
+        if not matcher:
+            return []
 
-        # Apply replacements in reverse order (largest offset first)
-        additional_replacements.sort(key=lambda x: x[0], reverse=True)
-        for start, end, alias_value in additional_replacements:
-            after_char = text[end : end + 1] if end < len(text) else ""
-            space_suffix = " " if after_char.isalnum() else ""
-            text = text[:start] + alias_value + space_suffix + text[end:]
+        # Case-insensitive search outside the already-replaced zones
+        additional_replacements = matcher.find_outside(text, replaced_spans)
 
-        return text
+        return additional_replacements
 
     async def get_or_create_alias(
         self,
@@ -585,7 +557,13 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
 
         Args:
             level: Anonymization level (INTERMEDIATE or ADVANCED)
+
+        Raises:
+            Exception: If the project's stored state cannot be loaded
         """
+        # Never hand out aliases without the stored ones
+        await self._load_project_state(project_id)
+
         # Initialize project glossary if needed
         if project_id not in self._glossaries:
             self._glossaries[project_id] = {}
@@ -606,18 +584,20 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         # ================================================================
 
         # Check if already mapped in CURRENT category
-        existing_alias = find_matching_value(original_value, project_glossary[category], category)
+        existing_alias = self._find_alias(project_id, category, category, original_value)
         if existing_alias:
             return existing_alias
 
         # CROSS-CATEGORY CHECK (Fix C1): Same text in different category = reuse alias
         # Prevents "ALEJANDRO ÁLVAREZ ESPEJO" getting Org_002 AND Persona_001
-        for other_category, other_entries in project_glossary.items():
+        for other_category in project_glossary:
             if other_category == category or other_category.startswith("_"):
                 continue
             # Use PERSON_NAME matching rules (partial, fuzzy) for cross-category
             # because the same name may appear as ORG in one detector and PER in another
-            cross_match = find_matching_value(original_value, other_entries, "PERSON_NAME")
+            cross_match = self._find_alias(
+                project_id, other_category, "PERSON_NAME", original_value
+            )
             if cross_match:
                 # Found in another category — reuse that alias
                 # Also register in current category to avoid repeated cross-lookups
@@ -628,10 +608,9 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         if category == "DATE":
             parsed_new = parse_spanish_date(original_value)
             if parsed_new:
-                for orig, alias in project_glossary[category].items():
-                    parsed_orig = parse_spanish_date(orig)
-                    if parsed_orig and parsed_orig == parsed_new:
-                        return alias
+                existing_alias = self._find_date_alias(project_id, parsed_new)
+                if existing_alias is not None:
+                    return existing_alias
 
         # ================================================================
         # DATE CATEGORY: Level-dependent handling
@@ -655,6 +634,48 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
 
         return alias
 
+    def _find_alias(
+        self, project_id: str, category: str, matching_category: str, value: str
+    ) -> Optional[str]:
+        """
+        Indexed ``find_matching_value`` over one glossary category.
+
+        Indexes are built lazily and catch up with values appended to the
+        glossary since the last lookup, so stored values are normalized once
+        instead of on every call.
+        """
+        entries = self._glossaries[project_id][category]
+        indexes = self._glossary_indexes.setdefault(project_id, {})
+        index = indexes.get((category, matching_category))
+        if index is None or len(index) > len(entries):
+            index = indexes[(category, matching_category)] = GlossaryIndex(matching_category)
+        if len(index) < len(entries):
+            for original in itertools.islice(entries, len(index), None):
+                index.add(original)
+
+        original = index.find(value)
+        return entries[original] if original is not None else None
+
+    def _find_date_alias(self, project_id: str, parsed: datetime) -> Optional[str]:
+        """
+        Alias of the first DATE entry that parses to the same date.
+
+        Each DATE entry is parsed once, when the index first sees it, instead
+        of re-parsing the whole category for every new date.
+        """
+        entries = self._glossaries[project_id].get("DATE", {})
+        index = self._date_indexes.get(project_id)
+        if index is None or index.size > len(entries):
+            index = self._date_indexes[project_id] = _DateIndex()
+        for original in itertools.islice(entries, index.size, None):
+            parsed_original = parse_spanish_date(original)
+            if parsed_original:
+                index.originals.setdefault(parsed_original, original)
+        index.size = len(entries)
+
+        original = index.originals.get(parsed)
+        return entries[original] if original is not None else None
+
     async def _get_or_create_date_alias(
         self,
         date_str: str,
@@ -708,10 +729,10 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
 
         # Check if this PARSED date already exists (handles different formats)
         # "5 de diciembre de 2025" should match "05/12/2025"
-        for existing_str, existing_dt in date_parsed.items():
-            if existing_dt == parsed:
-                # Same date already exists - return its alias
-                return project_glossary["DATE"][existing_str]
+        existing_alias = self._find_date_alias(project_id, parsed)
+        if existing_alias is not None:
+            # Same date already exists - return its alias
+            return existing_alias
 
         # ================================================================
         # DATE SHIFTING (Corrección #3)
@@ -733,10 +754,96 @@ class InMemoryAnonymizationAdapter(AnonymizationService):
         """Get the full alias glossary for a project (deep copy)."""
         return copy.deepcopy(self._glossaries.get(project_id, {}))
 
-    def clear_project_glossary(self, project_id: str) -> None:
-        """Clear glossary for a project (for testing)."""
-        self._glossaries.pop(project_id, None)
-        self._counters.pop(project_id, None)
+    async def clear_project_glossary(self, project_id: str) -> None:
+        """Forget a project's aliases and synthetic values, in memory and in the store."""
+        async with self._load_locks.setdefault(project_id, asyncio.Lock()):
+            if self._store is not None:
+                await self._store.delete(project_id)
+            self._glossaries.pop(project_id, None)
+            self._glossary_indexes.pop(project_id, None)
+            self._date_indexes.pop(project_id, None)
+            self._counters.pop(project_id, None)
+            self._synthetic_values.pop(project_id, None)
+            self._loaded_projects.discard(project_id)
+            self._saved_sizes.pop(project_id, None)
+
+    def synthetic_values(self, project_id: str) -> dict[tuple[str, str], str]:
+        """Level 3 synthetic values of a project, {(category, alias): synthetic} (live)."""
+        return self._synthetic_values.setdefault(project_id, {})
+
+    async def _load_project_state(self, project_id: str) -> None:
+        """
+        Load the stored glossary state of a project, once per process.
+
+        Concurrent calls for a project wait for the same load. A project is
+        only marked loaded once the load succeeds. A failed load raises (the
+        document fails) rather than numbering aliases from an empty glossary
+        that would repeat the stored ones; the next call retries.
+        """
+        if self._store is None or project_id in self._loaded_projects:
+            return
+        lock = self._load_locks.setdefault(project_id, asyncio.Lock())
+        async with lock:
+            if project_id in self._loaded_projects:
+                return
+
+            try:
+                state = await self._store.load(project_id)
+            except Exception as e:
+                logger.warning(
+                    f"Could not load stored aliases for project {project_id} "
+                    f"(retrying on next use): {e}"
+                )
+                raise
+
+            self._loaded_projects.add(project_id)
+            if state is None:
+                return
+
+            self._glossaries[project_id] = state.glossary
+            self._glossary_indexes.pop(project_id, None)
+            self._date_indexes.pop(project_id, None)
+            self._counters[project_id] = state.counters
+            self.synthetic_values(project_id).update(state.synthetic)
+            self._saved_sizes[project_id] = self._state_sizes(project_id)
+            logger.info(
+                f"Loaded {self._saved_sizes[project_id][0]} aliases and "
+                f"{len(state.synthetic)} synthetic values for project {project_id}"
+            )
+
+    async def _save_project_state(self, project_id: str) -> None:
+        """Write the project state back if entries were added since the last save."""
+        if self._store is None or project_id not in self._loaded_projects:
+            # Never overwrite stored state that could not be loaded
+            return
+        sizes = self._state_sizes(project_id)
+        if sizes == self._saved_sizes.get(project_id, (0, 0)):
+            return
+
+        from contextsafe.infrastructure.persistence import SyntheticProjectState
+
+        glossary = {
+            category: dict(entries)
+            for category, entries in self._glossaries.get(project_id, {}).items()
+            if not category.startswith("_")
+        }
+        state = SyntheticProjectState(
+            glossary=glossary,
+            counters=dict(self._counters.get(project_id, {})),
+            synthetic=dict(self.synthetic_values(project_id)),
+        )
+        try:
+            await self._store.save(project_id, state)
+        except Exception as e:
+            logger.warning(f"Could not store aliases for project {project_id}: {e}")
+            return
+        self._saved_sizes[project_id] = sizes
+
+    def _state_sizes(self, project_id: str) -> tuple[int, int]:
+        """(glossary entries, synthetic values): entries are only ever added."""
+        glossary = self._glossaries.get(project_id, {})
+        aliases = sum(len(v) for k, v in glossary.items() if not k.startswith("_"))
+        return aliases, len(self._synthetic_values.get(project_id, {}))
 
 
 # Global instance for simple use
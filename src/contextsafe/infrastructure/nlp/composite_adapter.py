@@ -24,7 +24,12 @@ import re
 from re import Pattern
 from typing import Any
 
-from contextsafe.application.ports import NerDetection, NerService, ProgressCallback
+from contextsafe.application.ports import (
+    NerDetection,
+    NerDetections,
+    NerService,
+    ProgressCallback,
+)
 from contextsafe.domain.shared.types import Ok
 from contextsafe.domain.shared.value_objects import (
     ADDRESS,
@@ -44,11 +49,19 @@ from contextsafe.domain.shared.value_objects import (
 # Intelligent merge components
 from contextsafe.infrastructure.nlp.merge.anchors import apply_contextual_anchors
 from contextsafe.infrastructure.nlp.merge.snapping import snap_all_detections
+from contextsafe.infrastructure.nlp.merge.span_index import SpanIndex
 from contextsafe.infrastructure.nlp.merge.voting import (
     get_weighted_score,
     weighted_vote_with_tiebreaker,
 )
 
+# Multi-pattern regex helpers (prefilters, merged alternations)
+from contextsafe.infrastructure.nlp.regex_engine import (
+    PatternScanner,
+    combine_patterns,
+    derive_prefilter,
+)
+
 # Text normalization (Unicode, OCR robustness)
 from contextsafe.infrastructure.nlp.text_normalizer import TextNormalizer
 
@@ -475,6 +488,17 @@ JUDICIAL_LOCATION_CONTEXT: list[re.Pattern] = [
     ),
 ]
 
+# Yes/no pattern lists merged into single alternations (one call instead of N)
+_FALSE_POSITIVE_ANY = combine_patterns(FALSE_POSITIVE_PATTERNS)
+_STRUCTURAL_DATE_ANY = combine_patterns(STRUCTURAL_DATE_PATTERNS)
+_STRUCTURAL_CASE_NUMBER_ANY = combine_patterns(STRUCTURAL_CASE_NUMBER_PATTERNS)
+_JUDICIAL_LOCATION_ANY = combine_patterns(JUDICIAL_LOCATION_CONTEXT)
+
+# Exclusion scans are skipped when their keyword (doi, orcid, http, ...) is absent
+_CONTEXT_EXCLUSION_PREFILTERS = [
+    (pattern, derive_prefilter(pattern)) for pattern in CONTEXT_EXCLUSION_PATTERNS
+]
+
 
 # ============================================================================
 # NER GARBAGE FILTERS (ML audit R2/R3 — post-merge false positive reduction)
@@ -554,7 +578,6 @@ class CompositeNerAdapter(NerService):
         self._dedup_threshold = dedup_overlap_threshold
         self._tie_threshold = tie_threshold
         self._spacy_adapter = spacy_adapter
-        self._spacy_doc_cache: Any = None  # Cached spaCy Doc for current text
         self._normalizer = TextNormalizer() if enable_normalization else None
         self._enable_type_validation = enable_type_validation
         self._type_validator = type_validator
@@ -622,6 +645,9 @@ class CompositeNerAdapter(NerService):
             return scoped_callback
 
         # Check availability and create tasks for available adapters
+        # Adapters that fail or are unavailable are recorded: the result is degraded
+        skipped: list[str] = []
+
         async def run_adapter(idx: int, adapter: NerService) -> list[NerDetection]:
             scoped_cb = create_scoped_callback(idx)
             try:
@@ -629,8 +655,9 @@ class CompositeNerAdapter(NerService):
                     return await adapter.detect_entities(
                         text, categories, min_confidence, scoped_cb
                     )
-            except Exception:
-                pass
+            except Exception as e:
+                logger.warning(f"[NER] {type(adapter).__name__} failed: {e}")
+            skipped.append(type(adapter).__name__)
             return []
 
         # Run ALL adapters in PARALLEL using asyncio.gather
@@ -650,11 +677,11 @@ class CompositeNerAdapter(NerService):
                 all_detections.extend(result)
 
         # Get spaCy Doc for token snapping (if spacy_adapter available)
+        # Reuses the Doc parsed by the spaCy adapter during detection
         spacy_doc = None
         if self._spacy_adapter:
             try:
                 spacy_doc = await self._spacy_adapter.tokenize(text)
-                self._spacy_doc_cache = spacy_doc
             except Exception:
                 pass  # Continue without snapping
 
@@ -666,7 +693,9 @@ class CompositeNerAdapter(NerService):
         if progress_callback:
             await progress_callback(95, 100, f"Filtrando {len(all_detections)} detecciones...")
 
-        merged = self._merge_detections(all_detections, text)
+        # Merge off the event loop (embedding validation and filters are CPU-bound)
+        loop = asyncio.get_running_loop()
+        merged = await loop.run_in_executor(None, self._merge_detections, all_detections, text)
 
         if offset_mapping is not None:
             restored = []
@@ -686,7 +715,7 @@ class CompositeNerAdapter(NerService):
         if progress_callback:
             await progress_callback(100, 100, f"Detección completa: {len(merged)} entidades")
 
-        return merged
+        return NerDetections(merged, skipped=skipped)
 
     def _merge_detections(
         self, detections: list[NerDetection], text: str = ""
@@ -792,34 +821,61 @@ class CompositeNerAdapter(NerService):
         # Sort by start position
         sorted_dets = sorted(detections, key=lambda d: d.span.start)
 
-        groups: list[list[NerDetection]] = []
-        used: set[int] = set()
+        if self._dedup_threshold <= 0:
+            # Every pair qualifies (IoU >= 0): a single group in start order
+            return [sorted_dets]
 
+        # Neighbours: pairs with IoU >= threshold (they must overlap)
+        index: SpanIndex[int] = SpanIndex()
         for i, det in enumerate(sorted_dets):
-            if i in used:
-                continue
+            index.add(det.span.start, det.span.end, i)
+
+        neighbours: list[list[int]] = []
+        for i, det in enumerate(sorted_dets):
+            neighbours.append(
+                [
+                    j
+                    for j in index.query(det.span.start, det.span.end)
+                    if j != i and self._calculate_overlap(sorted_dets[j], det) >= self._dedup_threshold
+                ]
+            )
 
-            # Start a new group with this detection
-            group = [det]
-            used.add(i)
+        groups: list[list[NerDetection]] = []
+        used = [False] * len(sorted_dets)
+
+        for i in range(len(sorted_dets)):
+            if used[i]:
+                continue
 
-            # Find all detections that overlap with any member of the group
+            # Connected component of this detection
+            component = {i}
+            stack = [i]
+            while stack:
+                for j in neighbours[stack.pop()]:
+                    if j not in component:
+                        component.add(j)
+                        stack.append(j)
+            members = sorted(component)
+
+            # Grow the group in passes over the component (in start order) so
+            # member order matches the original fixed-point scan; voting
+            # breaks ties by order.
+            group = [i]
+            in_group = {i}
             changed = True
             while changed:
                 changed = False
-                for j, other in enumerate(sorted_dets):
-                    if j in used:
+                for j in members:
+                    if j in in_group:
                         continue
-                    # Check overlap with any group member
-                    for member in group:
-                        overlap = self._calculate_overlap(other, member)
-                        if overlap >= self._dedup_threshold:
-                            group.append(other)
-                            used.add(j)
-                            changed = True
-                            break
+                    if any(k in in_group for k in neighbours[j]):
+                        group.append(j)
+                        in_group.add(j)
+                        changed = True
 
-            groups.append(group)
+            for j in members:
+                used[j] = True
+            groups.append([sorted_dets[j] for j in group])
 
         return groups
 
@@ -893,18 +949,12 @@ class CompositeNerAdapter(NerService):
             value = det.value.strip()
 
             # Override 1: DATE patterns
-            if det.category != _date:
-                for pattern in STRUCTURAL_DATE_PATTERNS:
-                    if pattern.match(value):
-                        det = det.with_category(_date)
-                        break
+            if det.category != _date and _STRUCTURAL_DATE_ANY.match(value):
+                det = det.with_category(_date)
 
             # Override 2: CASE_NUMBER patterns
-            if det.category != _case_number:
-                for pattern in STRUCTURAL_CASE_NUMBER_PATTERNS:
-                    if pattern.match(value):
-                        det = det.with_category(_case_number)
-                        break
+            if det.category != _case_number and _STRUCTURAL_CASE_NUMBER_ANY.match(value):
+                det = det.with_category(_case_number)
 
             # Override 3: LOCATION in judicial headers
             # If entity is classified as ORG and context before it matches
@@ -912,7 +962,7 @@ class CompositeNerAdapter(NerService):
             if det.category == ORGANIZATION and text:
                 context_start = max(0, det.span.start - 120)
                 context_before = text[context_start : det.span.start]
-                if any(p.search(context_before) for p in JUDICIAL_LOCATION_CONTEXT):
+                if _JUDICIAL_LOCATION_ANY.search(context_before):
                     det = det.with_category(_location)
 
             result.append(det)
@@ -1012,22 +1062,24 @@ class CompositeNerAdapter(NerService):
         sorted_by_length = sorted(detections, key=lambda d: -(d.span.end - d.span.start))
 
         kept: list[NerDetection] = []
+        # Only kept entities with sufficient confidence (>= 0.7) can absorb others
+        containers: SpanIndex[NerDetection] = SpanIndex()
 
         for detection in sorted_by_length:
             is_nested = False
 
-            for larger in kept:
+            for larger in containers.query(detection.span.start, detection.span.end):
                 # Check if detection is fully contained within larger
                 if self._is_fully_contained(detection, larger):
                     # Same category or compatible categories
                     if self._are_compatible_categories(detection.category, larger.category):
-                        # Larger entity has sufficient confidence (>= 0.7)
-                        if larger.confidence.value >= 0.7:
-                            is_nested = True
-                            break
+                        is_nested = True
+                        break
 
             if not is_nested:
                 kept.append(detection)
+                if detection.confidence.value >= 0.7:
+                    containers.add(detection.span.start, detection.span.end, detection)
 
         return kept
 
@@ -1105,14 +1157,8 @@ class CompositeNerAdapter(NerService):
         for detection in detections:
             value = detection.value.strip()
 
-            # Check against all false positive patterns
-            is_false_positive = False
-            for pattern in FALSE_POSITIVE_PATTERNS:
-                if pattern.match(value):
-                    is_false_positive = True
-                    break
-
-            if not is_false_positive:
+            # Check against all false positive patterns (single alternation)
+            if not _FALSE_POSITIVE_ANY.match(value):
                 filtered.append(detection)
 
         return filtered
@@ -1278,7 +1324,10 @@ class CompositeNerAdapter(NerService):
 
         # Find all exclusion zones in the text
         exclusion_zones: list[tuple[int, int]] = []
-        for pattern in CONTEXT_EXCLUSION_PATTERNS:
+        prefilters = PatternScanner(text)
+        for pattern, prefilter in _CONTEXT_EXCLUSION_PREFILTERS:
+            if not prefilters.passes(prefilter):
+                continue
             for match in pattern.finditer(text):
                 exclusion_zones.append((match.start(), match.end()))
 
@@ -1406,17 +1455,15 @@ class CompositeNerAdapter(NerService):
                 self._enable_type_validation = False
                 return detections
 
-        validated: list[NerDetection] = []
+        # One batched embedding pass for all detections
+        results = self._type_validator.validate_batch(
+            [(det.value, det.category.value, det.span.start, det.span.end) for det in detections],
+            text,
+        )
 
-        for det in detections:
-            result = self._type_validator.validate(
-                entity_text=det.value,
-                entity_type=det.category.value,
-                full_text=text,
-                start=det.span.start,
-                end=det.span.end,
-            )
+        validated: list[NerDetection] = []
 
+        for det, result in zip(detections, results, strict=True):
             if result.action == ValidationAction.REJECT:
                 logger.debug(
                     f"Type validator REJECTED: '{det.value}' "
@@ -1509,6 +1556,9 @@ class CompositeNerAdapter(NerService):
             "parallel_execution": True,
             "nested_entity_handling": True,
             "adapters": adapter_infos,
+            "embedding_cache": (
+                self._type_validator.cache_stats() if self._type_validator is not None else None
+            ),
         }
 
     def add_adapter(self, adapter: NerService) -> None:
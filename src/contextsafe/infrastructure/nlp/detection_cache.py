@@ -0,0 +1,351 @@
+"""
+Content-addressed cache of NER detection results.
+
+Reprocessing a document (after an error, a level change or a re-run of
+process-all) sends the same text through the full NER pipeline again.
+CachedNerAdapter wraps the NER service and keeps its results keyed by:
+
+- the exact text (detections carry character offsets into it)
+- the NER configuration fingerprint (models, backend, thresholds,
+  validator, compute mode) and the code version
+- the call arguments (categories, min_confidence)
+
+The anonymization level is not part of the key: changing it never runs
+NER again. Degraded results (a detector of the composite failed or was
+unavailable) are never stored, so a re-run after an error retries them.
+
+Results are kept serialized in a byte-bounded in-memory LRU, optionally
+backed by a SQLite file with the same byte budget (least recently used
+rows are evicted first). Cache lookups and writes run in the default
+executor, off the event loop; disk hits update the rows' last use in
+batches, not with one commit per hit.
+
+Cached results contain the detected PII values: the SQLite store is
+opt-in and should live next to the other local data.
+
+Traceability:
+- Port: ports.NerService
+- Wraps: CompositeNerAdapter or ProcessPoolNerAdapter
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from contextsafe.application.ports import (
+    NerDetection,
+    NerDetections,
+    NerService,
+    ProgressCallback,
+)
+from contextsafe.domain.shared.value_objects import ConfidenceScore, PiiCategory, TextSpan
+
+
+logger = logging.getLogger(__name__)
+
+# Bump when the serialized format or the meaning of cached results changes
+DETECTION_CACHE_VERSION = 1
+
+# Rows evicted per SQLite round trip; disk hits whose last use is written at once
+_EVICT_BATCH = 64
+
+
+def serialize_detections(detections: list[NerDetection]) -> bytes:
+    """Encode detections as compact JSON."""
+    rows = [
+        [
+            str(d.category),
+            d.value,
+            d.span.start,
+            d.span.end,
+            d.span.text,
+            d.confidence.value,
+            d.source,
+        ]
+        for d in detections
+    ]
+    return json.dumps(rows, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def deserialize_detections(payload: bytes) -> list[NerDetection]:
+    """Decode detections encoded by serialize_detections."""
+    detections: list[NerDetection] = []
+    for category, value, start, end, span_text, confidence, source in json.loads(payload):
+        detections.append(
+            NerDetection(
+                category=PiiCategory.from_string(category).unwrap(),
+                value=value,
+                span=TextSpan(start=start, end=end, text=span_text),
+                confidence=ConfidenceScore(value=confidence),
+                source=source,
+            )
+        )
+    return detections
+
+
+class DetectionCache:
+    """
+    Byte-bounded LRU of serialized detection lists with an optional SQLite store.
+
+    Args:
+        max_bytes: Budget for serialized results (memory and, separately, disk).
+        db_path: Optional SQLite file for persistent storage (None = memory only).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, db_path: Path | None = None) -> None:
+        self.max_bytes = max(1, max_bytes)
+        self.db_path = Path(db_path) if db_path else None
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        # Disk hits not yet written back: {key: last use}
+        self._touched: dict[str, float] = {}
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        if self.db_path is not None:
+            self._open_store()
+
+    @staticmethod
+    def make_key(fingerprint: str, text: str, *params: Any) -> str:
+        """Cache key for the detections of ``text`` under a NER configuration."""
+        digest = hashlib.sha256()
+        for part in (str(DETECTION_CACHE_VERSION), fingerprint, repr(params), text):
+            digest.update(part.encode("utf-8", "surrogatepass"))
+            digest.update(b"\0")
+        return digest.hexdigest()
+
+    def get(self, key: str) -> bytes | None:
+        """Look up a serialized result (memory first, then disk)."""
+        with self._lock:
+            payload = self._memory.get(key)
+            if payload is not None:
+                self._memory.move_to_end(key)
+            elif self._conn is not None:
+                payload = self._load(key)
+                if payload is not None:
+                    self._remember(key, payload)
+                    self.disk_hits += 1
+
+            if payload is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return payload
+
+    def put(self, key: str, payload: bytes) -> None:
+        """Store a serialized result in memory and, if configured, on disk."""
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock:
+            self._remember(key, payload)
+            if self._conn is not None:
+                self._store(key, payload)
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Get hit/miss counters and sizes."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "memory_bytes": self._memory_bytes,
+            "disk_bytes": self._disk_bytes,
+            "max_bytes": self.max_bytes,
+            "db_path": str(self.db_path) if self.db_path else None,
+        }
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._conn is not None:
+                self._flush_touched()
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, payload: bytes) -> None:
+        """Insert into the LRU, evicting least recently used entries over budget."""
+        previous = self._memory.pop(key, None)
+        if previous is not None:
+            self._memory_bytes -= len(previous)
+        self._memory[key] = payload
+        self._memory_bytes += len(payload)
+        while self._memory_bytes > self.max_bytes:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_bytes -= len(evicted)
+
+    def _open_store(self) -> None:
+        """Open (and create) the SQLite store; fall back to memory-only on error."""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS detections ("
+                "key TEXT PRIMARY KEY, payload BLOB NOT NULL, "
+                "size INTEGER NOT NULL, used REAL NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS detections_used ON detections (used)")
+            self._conn.commit()
+            row = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM detections").fetchone()
+            self._disk_bytes = row[0]
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Detection cache store unavailable ({self.db_path}): {e}")
+            self._conn = None
+
+    def _load(self, key: str) -> bytes | None:
+        """Read a result from the SQLite store (its last use is written later)."""
+        try:
+            row = self._conn.execute(
+                "SELECT payload FROM detections WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"Detection cache read failed: {e}")
+            return None
+        if row is None:
+            return None
+        self._touched[key] = time.time()
+        if len(self._touched) >= _EVICT_BATCH:
+            self._flush_touched()
+        return bytes(row[0])
+
+    def _flush_touched(self) -> None:
+        """Write the last use of pending disk hits in one transaction."""
+        if not self._touched:
+            return
+        touched = [(used, key) for key, used in self._touched.items()]
+        self._touched.clear()
+        try:
+            self._conn.executemany("UPDATE detections SET used = ? WHERE key = ?", touched)
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Detection cache write failed: {e}")
+
+    def _store(self, key: str, payload: bytes) -> None:
+        """Write a result to the SQLite store, evicting the least recently used rows."""
+        # Recency of disk hits must be current before choosing rows to evict
+        self._flush_touched()
+        try:
+            row = self._conn.execute(
+                "SELECT size FROM detections WHERE key = ?", (key,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO detections (key, payload, size, used) VALUES (?, ?, ?, ?)",
+                (key, payload, len(payload), time.time()),
+            )
+            self._disk_bytes += len(payload) - (row[0] if row else 0)
+
+            while self._disk_bytes > self.max_bytes:
+                oldest = self._conn.execute(
+                    "SELECT key, size FROM detections WHERE key != ? ORDER BY used LIMIT ?",
+                    (key, _EVICT_BATCH),
+                ).fetchall()
+                if not oldest:
+                    break
+                for old_key, size in oldest:
+                    if self._disk_bytes <= self.max_bytes:
+                        break
+                    self._conn.execute("DELETE FROM detections WHERE key = ?", (old_key,))
+                    self._disk_bytes -= size
+            self._conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"Detection cache write failed: {e}")
+
+
+class CachedNerAdapter(NerService):
+    """
+    NerService that reuses detections for texts it has already analyzed.
+
+    A hit skips the wrapped service entirely; progress jumps to 100%.
+    """
+
+    def __init__(self, inner: NerService, cache: DetectionCache, fingerprint: str) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            inner: The NER service whose results are cached
+            cache: Result store (may be shared across service rebuilds)
+            fingerprint: NER configuration and code version (part of every key)
+        """
+        self.inner = inner
+        self.cache = cache
+        self.fingerprint = fingerprint
+
+    async def detect_entities(
+        self,
+        text: str,
+        categories: list[PiiCategory] | None = None,
+        min_confidence: float = 0.5,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[NerDetection]:
+        """
+        Detect entities, answering from the cache when possible.
+
+        Args:
+            text: The text to analyze
+            categories: Optional filter for specific categories
+            min_confidence: Minimum confidence threshold
+            progress_callback: Forwarded on a miss; called once at 100% on a hit
+
+        Returns:
+            Detections of the wrapped NER service
+        """
+        if not text or not text.strip():
+            return []
+
+        category_names = sorted(str(c) for c in categories) if categories is not None else None
+        key = DetectionCache.make_key(self.fingerprint, text, category_names, min_confidence)
+
+        # The cache may hit SQLite: keep it off the event loop
+        loop = asyncio.get_running_loop()
+        payload = await loop.run_in_executor(None, self.cache.get, key)
+        if payload is not None:
+            try:
+                detections = deserialize_detections(payload)
+            except (ValueError, TypeError, KeyError) as e:
+                logger.warning(f"[NER] Discarding unreadable cached detections: {e}")
+            else:
+                logger.info(f"[NER] Detection cache hit ({len(detections)} entities)")
+                if progress_callback:
+                    await progress_callback(100, 100, f"{len(detections)} entidades")
+                return detections
+
+        detections = await self.inner.detect_entities(
+            text, categories, min_confidence, progress_callback
+        )
+        if isinstance(detections, NerDetections) and not detections.complete:
+            # A detector failed or was unavailable: the next run must try again
+            logger.info(f"[NER] Not caching degraded result (skipped: {detections.skipped})")
+        else:
+            await loop.run_in_executor(None, self._store, key, detections)
+        return detections
+
+    def _store(self, key: str, detections: list[NerDetection]) -> None:
+        """Serialize and store a result (runs in the executor)."""
+        self.cache.put(key, serialize_detections(detections))
+
+    async def is_available(self) -> bool:
+        """Check if the wrapped service is available."""
+        return await self.inner.is_available()
+
+    async def get_model_info(self) -> dict:
+        """Get the wrapped service's info plus cache counters."""
+        info = dict(await self.inner.get_model_info())
+        info["detection_cache"] = self.cache.stats()
+        return info
@@ -0,0 +1,181 @@
+"""
+Micro-batching inference scheduler.
+
+Sits in front of a batch inference function (a transformers pipeline or
+an ONNX session) and merges work submitted concurrently by several
+documents into micro-batches. A batch is run as soon as it reaches
+``max_batch_size`` items or ``max_wait_ms`` has elapsed since the first
+pending item, whichever comes first. Results are dispatched back to the
+awaiting coroutines in submission order.
+
+Traceability:
+- Used by: RobertaNerAdapter, OnnxNerAdapter
+- Architecture: single inference worker shared by all in-flight documents
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Generic, TypeVar
+
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+@dataclass(slots=True)
+class _PendingItem:
+    """A submitted work item and the future awaiting its result."""
+
+    item: Any
+    future: asyncio.Future
+
+
+class MicroBatchScheduler(Generic[T, R]):
+    """
+    Collects items from concurrent callers and runs them in shared batches.
+
+    The batch function runs in ``executor`` so the event loop stays free
+    for WebSocket progress updates while the model is busy.
+    """
+
+    def __init__(
+        self,
+        batch_fn: Callable[[list[T]], Sequence[R]],
+        executor_factory: Callable[[], Executor],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+        name: str = "inference",
+    ) -> None:
+        """
+        Initialize the scheduler.
+
+        Args:
+            batch_fn: Synchronous function mapping a list of items to their results
+            executor_factory: Returns the executor the batch function runs in
+            max_batch_size: Maximum items per batch
+            max_wait_ms: Maximum time to wait for more items before running a batch
+            name: Name used in logs
+        """
+        self._batch_fn = batch_fn
+        self._executor_factory = executor_factory
+        self._max_batch_size = max(1, max_batch_size)
+        self._max_wait = max(0.0, max_wait_ms) / 1000
+        self._name = name
+
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._pending: list[_PendingItem] = []
+        self._wakeup: asyncio.Event | None = None
+        self._worker: asyncio.Task | None = None
+
+        self._batches_run = 0
+        self._items_run = 0
+
+    @property
+    def max_batch_size(self) -> int:
+        """Maximum number of items per batch."""
+        return self._max_batch_size
+
+    async def submit(self, items: Sequence[T]) -> list[R]:
+        """
+        Submit items for inference and wait for their results.
+
+        Args:
+            items: Work items (e.g. text chunks or token windows)
+
+        Returns:
+            One result per item, in the same order
+        """
+        if not items:
+            return []
+
+        loop = asyncio.get_running_loop()
+        self._ensure_worker(loop)
+
+        futures = [loop.create_future() for _ in items]
+        self._pending.extend(_PendingItem(item, future) for item, future in zip(items, futures))
+        self._wakeup.set()
+
+        return list(await asyncio.gather(*futures))
+
+    def stats(self) -> dict[str, Any]:
+        """Get batching counters."""
+        return {
+            "max_batch_size": self._max_batch_size,
+            "max_wait_ms": self._max_wait * 1000,
+            "batches_run": self._batches_run,
+            "items_run": self._items_run,
+            "avg_batch_size": (self._items_run / self._batches_run) if self._batches_run else 0.0,
+            "pending": len(self._pending),
+        }
+
+    def _ensure_worker(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Start the batching task on the running loop (restarting if the loop changed)."""
+        if self._loop is not loop:
+            self._loop = loop
+            self._pending = []
+            self._wakeup = asyncio.Event()
+            self._worker = None
+
+        if self._worker is None or self._worker.done():
+            self._worker = loop.create_task(self._run(), name=f"{self._name}_scheduler")
+
+    async def _run(self) -> None:
+        """Batching loop: wait for items, fill a batch, run it, dispatch results."""
+        loop = asyncio.get_running_loop()
+
+        while True:
+            await self._wakeup.wait()
+
+            # Give concurrent documents a chance to join this batch
+            deadline = loop.time() + self._max_wait
+            while len(self._pending) < self._max_batch_size:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                self._wakeup.clear()
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), remaining)
+                except TimeoutError:
+                    break
+
+            batch = self._pending[: self._max_batch_size]
+            del self._pending[: self._max_batch_size]
+            if not self._pending:
+                self._wakeup.clear()
+            else:
+                self._wakeup.set()
+
+            # Skip items whose caller was cancelled
+            live = [pending for pending in batch if not pending.future.done()]
+            if not live:
+                continue
+
+            try:
+                results = await loop.run_in_executor(
+                    self._executor_factory(),
+                    self._batch_fn,
+                    [pending.item for pending in live],
+                )
+                if len(results) != len(live):
+                    raise ValueError(
+                        f"Batch function returned {len(results)} results for {len(live)} items"
+                    )
+            except Exception as e:
+                logger.error(f"[{self._name}] Batch of {len(live)} items failed: {e}")
+                for pending in live:
+                    if not pending.future.done():
+                        pending.future.set_exception(e)
+                continue
+
+            self._batches_run += 1
+            self._items_run += len(live)
+            for pending, result in zip(live, results, strict=True):
+                if not pending.future.done():
+                    pending.future.set_result(result)
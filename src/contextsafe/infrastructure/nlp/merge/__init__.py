@@ -5,6 +5,7 @@ This module provides:
 - Contextual anchors for Spanish legal domain
 - Weighted voting with tiebreaker
 - Token snapping for RoBERTa alignment
+- Span index for overlap queries
 
 Traceability:
 - Design: docs/plans/2026-02-02-intelligent-merge-spacy-design.md
@@ -17,6 +18,7 @@ from contextsafe.infrastructure.nlp.merge.anchors import (
     apply_contextual_anchors,
 )
 from contextsafe.infrastructure.nlp.merge.snapping import snap_to_tokens
+from contextsafe.infrastructure.nlp.merge.span_index import SpanIndex
 from contextsafe.infrastructure.nlp.merge.voting import (
     DETECTOR_WEIGHTS,
     RISK_PRIORITY,
@@ -38,4 +40,6 @@ __all__ = [
     "RISK_PRIORITY",
     # Snapping
     "snap_to_tokens",
+    # Span index
+    "SpanIndex",
 ]
@@ -0,0 +1,71 @@
+"""
+Span index for overlap queries during merge.
+
+Detections are kept sorted by start offset together with the longest
+span length seen so far. Any span touching [start, end] must begin in
+(start - max_length, end], so a query is two bisections plus a scan of
+the nearby spans instead of a pass over every detection.
+
+Used by:
+- CompositeNerAdapter._group_overlapping_detections
+- CompositeNerAdapter._filter_nested_entities
+- InMemoryAnonymizationAdapter._remove_overlapping_detections
+
+Traceability:
+- Design: docs/plans/2026-02-02-intelligent-merge-spacy-design.md
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from typing import Generic, TypeVar
+
+
+T = TypeVar("T")
+
+
+class SpanIndex(Generic[T]):
+    """
+    Sorted index of [start, end) spans supporting incremental inserts.
+
+    Queries return a superset of the overlapping spans (spans that merely
+    touch the query range are included); callers apply their exact
+    overlap/containment predicate to the candidates.
+    """
+
+    def __init__(self) -> None:
+        self._starts: list[int] = []
+        self._entries: list[tuple[int, int, T]] = []
+        self._max_length = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, start: int, end: int, item: T) -> None:
+        """
+        Insert a span.
+
+        Args:
+            start: Span start (inclusive)
+            end: Span end (exclusive)
+            item: Payload returned by queries
+        """
+        position = bisect_right(self._starts, start)
+        self._starts.insert(position, start)
+        self._entries.insert(position, (start, end, item))
+        self._max_length = max(self._max_length, end - start)
+
+    def query(self, start: int, end: int) -> list[T]:
+        """
+        Find spans that overlap or touch [start, end].
+
+        Args:
+            start: Query start
+            end: Query end
+
+        Returns:
+            Payloads ordered by span start (insertion order on ties)
+        """
+        lo = bisect_left(self._starts, start - self._max_length)
+        hi = bisect_right(self._starts, end)
+        return [item for _, span_end, item in self._entries[lo:hi] if span_end >= start]
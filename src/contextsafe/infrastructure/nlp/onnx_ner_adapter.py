@@ -0,0 +1,294 @@
+"""
+ONNX Runtime backend for the RoBERTa NER adapter.
+
+Runs the same token-classification model as RobertaNerAdapter from an
+exported ONNX graph (optionally int8 dynamically quantized) on
+onnxruntime's CPU execution provider. Tokenization, token windows,
+aggregation and all validation filters are inherited unchanged, so the
+detections only differ by the numeric precision of the forward pass.
+
+Export a model with:
+    contextsafe export-onnx ml/models/legal_ner_v2 --output-dir ml/models/legal_ner_v2_onnx
+
+Traceability:
+- Port: ports.NerService
+- Base: RobertaNerAdapter (token-window mode)
+- Runtime: onnxruntime CPUExecutionProvider
+"""
+
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from contextsafe.infrastructure.nlp.roberta_ner_adapter import RobertaNerAdapter
+
+
+logger = logging.getLogger(__name__)
+
+ONNX_MODEL_FILENAME = "model.onnx"
+ONNX_QUANTIZED_FILENAME = "model.int8.onnx"
+
+
+@dataclass(frozen=True)
+class OnnxTokenClassifier:
+    """Loaded ONNX session plus the tokenizer and config it was exported with."""
+
+    session: Any
+    tokenizer: Any
+    config: Any
+
+
+class OnnxNerAdapter(RobertaNerAdapter):
+    """
+    NER service running an exported RoBERTa token classifier on onnxruntime.
+
+    Features:
+    - fp32 or int8 (dynamic quantization) graph
+    - CPU execution provider with configurable intra-op threads
+    - Always uses exact token-window chunking
+    """
+
+    def __init__(
+        self,
+        model_dir: str | Path,
+        quantized: bool = True,
+        min_score: float = 0.85,
+        batch_size: int = RobertaNerAdapter.DEFAULT_BATCH_SIZE,
+        window_tokens: int = RobertaNerAdapter.WINDOW_TOKENS,
+        token_stride: int = RobertaNerAdapter.TOKEN_STRIDE,
+        max_batch_size: int = RobertaNerAdapter.MAX_BATCH_SIZE,
+        max_wait_ms: float = RobertaNerAdapter.MAX_WAIT_MS,
+        intra_op_threads: int | None = None,
+    ) -> None:
+        """
+        Initialize the ONNX NER adapter.
+
+        Args:
+            model_dir: Directory produced by export_onnx_model (graph, tokenizer, config)
+            quantized: Load the int8 graph instead of the fp32 one
+            min_score: Minimum confidence score to accept entities
+            batch_size: Token windows submitted per document step
+            window_tokens: Content tokens per window
+            token_stride: Tokens shared by consecutive windows
+            max_batch_size: Max windows per session.run across all documents
+            max_wait_ms: Max time a batch waits for other documents to join
+            intra_op_threads: onnxruntime intra-op threads (None = runtime default)
+        """
+        super().__init__(
+            model_name=str(model_dir),
+            min_score=min_score,
+            device=-1,
+            local_files_only=True,
+            batch_size=batch_size,
+            chunking="tokens",
+            window_tokens=window_tokens,
+            token_stride=token_stride,
+            max_batch_size=max_batch_size,
+            max_wait_ms=max_wait_ms,
+        )
+        self._model_dir = Path(model_dir)
+        self._quantized = quantized
+        self._intra_op_threads = intra_op_threads
+
+    @property
+    def onnx_path(self) -> Path:
+        """Path of the ONNX graph this adapter loads."""
+        filename = ONNX_QUANTIZED_FILENAME if self._quantized else ONNX_MODEL_FILENAME
+        return self._model_dir / filename
+
+    def _check_model_cached(self) -> bool:
+        """Check that the exported graph and its config are present."""
+        if self.onnx_path.exists() and (self._model_dir / "config.json").exists():
+            return True
+        logger.warning(f"ONNX model not found: {self.onnx_path}")
+        return False
+
+    def _ensure_pipeline(self) -> Any:
+        """Lazily create the onnxruntime session and load the tokenizer."""
+        if self._pipeline is not None:
+            return self._pipeline
+
+        if self._load_error:
+            raise RuntimeError(self._load_error)
+
+        try:
+            import onnxruntime as ort
+            from transformers import AutoConfig, AutoTokenizer
+
+            if not self._check_model_cached():
+                error_msg = (
+                    f"ONNX model not found at '{self.onnx_path}'.\n"
+                    f"To export it, run:\n"
+                    f"  contextsafe export-onnx <model> --output-dir {self._model_dir}"
+                )
+                self._load_error = error_msg
+                raise RuntimeError(error_msg)
+
+            options = ort.SessionOptions()
+            options.graph_optimization_level = ort.GraphOptimizationLevel.ORT_ENABLE_ALL
+            if self._intra_op_threads:
+                options.intra_op_num_threads = self._intra_op_threads
+
+            logger.info(f"Loading ONNX NER model: {self.onnx_path}")
+            session = ort.InferenceSession(
+                str(self.onnx_path), options, providers=["CPUExecutionProvider"]
+            )
+            tokenizer = AutoTokenizer.from_pretrained(self._model_dir, use_fast=True)
+            config = AutoConfig.from_pretrained(self._model_dir)
+
+            self._pipeline = OnnxTokenClassifier(session=session, tokenizer=tokenizer, config=config)
+            self._is_loaded = True
+            logger.info("ONNX NER model loaded successfully")
+            return self._pipeline
+
+        except Exception as e:
+            if not self._load_error:
+                self._load_error = f"Failed to load ONNX model: {e}"
+            logger.error(self._load_error)
+            raise RuntimeError(self._load_error) from e
+
+    def _supports_token_windows(self) -> bool:
+        """The ONNX backend only runs in token-window mode."""
+        self._ensure_pipeline()
+        return True
+
+    def _id2label(self) -> dict[int, str]:
+        """Get the label mapping from the exported config."""
+        return self._ensure_pipeline().config.id2label
+
+    def _forward_token_rows(self, rows: list[list[int]]) -> list[Any]:
+        """
+        Run the ONNX graph on a padded batch of token windows (executor thread).
+
+        Args:
+            rows: Token ids of each window (no special tokens)
+
+        Returns:
+            Per-window float32 logits arrays of shape (window_len, num_labels)
+        """
+        pipe = self._ensure_pipeline()
+        batch_ids, attention, prefix = self._build_window_batch(pipe.tokenizer, rows)
+
+        feed = {"input_ids": batch_ids, "attention_mask": attention}
+        input_names = {node.name for node in pipe.session.get_inputs()}
+        logits = pipe.session.run(None, {k: v for k, v in feed.items() if k in input_names})[0]
+
+        return [logits[i, prefix : prefix + len(row)] for i, row in enumerate(rows)]
+
+    async def is_available(self) -> bool:
+        """Check if onnxruntime is installed and the exported model loads."""
+        try:
+            import onnxruntime  # noqa: F401
+
+            if self._is_loaded:
+                return True
+            if self._load_error:
+                return False
+
+            self._ensure_pipeline()
+            return True
+
+        except Exception as e:
+            logger.warning(f"ONNX NER not available: {e}")
+            return False
+
+    async def get_model_info(self) -> dict:
+        """
+        Get information about the ONNX model configuration.
+
+        Returns:
+            Dict with model details and status
+        """
+        available = await self.is_available()
+
+        return {
+            "type": "onnx_ner",
+            "model": str(self._model_dir),
+            "onnx_path": str(self.onnx_path),
+            "quantized": self._quantized,
+            "is_available": available,
+            "is_loaded": self._is_loaded,
+            "load_error": self._load_error,
+            "min_score": self._min_score,
+            "device": "CPU",
+            "provider": "CPUExecutionProvider",
+            "intra_op_threads": self._intra_op_threads,
+            "batching": self._scheduler_stats(),
+            "window_tokens": self._window_tokens,
+            "architecture": "pre-presidio",
+        }
+
+
+def export_onnx_model(
+    model_name_or_path: str | Path,
+    output_dir: str | Path,
+    quantize: bool = True,
+    opset: int = 17,
+) -> Path:
+    """
+    Export a HuggingFace token-classification model to ONNX.
+
+    Writes the fp32 graph, the tokenizer and the config to ``output_dir``
+    and, if requested, an int8 dynamically quantized copy of the graph.
+
+    Args:
+        model_name_or_path: HuggingFace model id or local model directory
+        output_dir: Destination directory
+        quantize: Also write the int8 graph (ONNX_QUANTIZED_FILENAME)
+        opset: ONNX opset version
+
+    Returns:
+        The output directory
+    """
+    import torch
+    from transformers import AutoModelForTokenClassification, AutoTokenizer
+
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+
+    tokenizer = AutoTokenizer.from_pretrained(str(model_name_or_path), use_fast=True)
+    model = AutoModelForTokenClassification.from_pretrained(str(model_name_or_path))
+    model.eval()
+
+    tokenizer.save_pretrained(output_path)
+    model.config.save_pretrained(output_path)
+
+    class _LogitsOnly(torch.nn.Module):
+        def __init__(self, wrapped: Any) -> None:
+            super().__init__()
+            self.wrapped = wrapped
+
+        def forward(self, input_ids: Any, attention_mask: Any) -> Any:
+            return self.wrapped(input_ids=input_ids, attention_mask=attention_mask).logits
+
+    sample = tokenizer("Don Juan García Pérez reside en Madrid.", return_tensors="pt")
+    onnx_path = output_path / ONNX_MODEL_FILENAME
+
+    logger.info(f"Exporting {model_name_or_path} to {onnx_path}")
+    with torch.no_grad():
+        torch.onnx.export(
+            _LogitsOnly(model),
+            (sample["input_ids"], sample["attention_mask"]),
+            str(onnx_path),
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "sequence"},
+                "attention_mask": {0: "batch", 1: "sequence"},
+                "logits": {0: "batch", 1: "sequence"},
+            },
+            opset_version=opset,
+            do_constant_folding=True,
+        )
+
+    if quantize:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        quantized_path = output_path / ONNX_QUANTIZED_FILENAME
+        logger.info(f"Quantizing to int8: {quantized_path}")
+        quantize_dynamic(str(onnx_path), str(quantized_path), weight_type=QuantType.QInt8)
+
+    return output_path
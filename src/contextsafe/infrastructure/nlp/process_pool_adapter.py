@@ -0,0 +1,223 @@
+"""
+Multi-process NER execution.
+
+Runs a NER service (normally the full CompositeNerAdapter) in N worker
+processes, so documents are analyzed on several cores at once instead of
+sharing one interpreter (spaCy, regex and merge hold the GIL; RoBERTa
+runs on a single executor thread).
+
+- each worker builds its own adapter once, from a picklable factory, and
+  keeps it (plus an event loop) for its whole life
+- document text travels to the worker in shared memory when it is large
+  (``shared_memory_min_bytes``), pickled otherwise; detections come back
+  pickled
+- ``torch_threads`` caps torch intra-op threads per worker, so cores can
+  be split between intra-op and inter-document parallelism
+  (workers x torch_threads ~ cores)
+
+Each worker loads its own copy of the models: memory grows with the
+number of workers. Progress is only reported at start and end of a
+document (detection runs in another process).
+
+Traceability:
+- Port: ports.NerService
+- Wraps: CompositeNerAdapter (built per worker)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import multiprocessing
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import NamedTuple
+
+from contextsafe.application.ports import NerDetection, NerService, ProgressCallback
+from contextsafe.domain.shared.value_objects import PiiCategory
+
+
+logger = logging.getLogger(__name__)
+
+# Texts from this size (UTF-8 bytes) go through shared memory
+SHARED_MEMORY_MIN_BYTES = 64 * 1024
+
+
+class _SharedText(NamedTuple):
+    """Document text placed in a shared memory block."""
+
+    name: str
+    size: int
+
+
+# Worker process state (set by _init_worker)
+_worker_adapter: NerService | None = None
+_worker_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _init_worker(factory: Callable[[], NerService], torch_threads: int) -> None:
+    """Process pool initializer: limit torch threads and build the adapter."""
+    global _worker_adapter, _worker_loop
+    if torch_threads > 0:
+        # Read by torch/OpenMP when they are first imported
+        os.environ["OMP_NUM_THREADS"] = str(torch_threads)
+        try:
+            import torch
+
+            torch.set_num_threads(torch_threads)
+        except ImportError:
+            pass
+    _worker_loop = asyncio.new_event_loop()
+    _worker_adapter = factory()
+
+
+def _detect_in_worker(
+    payload: str | _SharedText,
+    categories: list[PiiCategory] | None,
+    min_confidence: float,
+) -> list[NerDetection]:
+    """Run detection on the worker's adapter."""
+    if isinstance(payload, _SharedText):
+        shm = SharedMemory(name=payload.name)
+        try:
+            text = bytes(shm.buf[: payload.size]).decode("utf-8")
+        finally:
+            shm.close()
+    else:
+        text = payload
+    return _worker_loop.run_until_complete(
+        _worker_adapter.detect_entities(text, categories, min_confidence)
+    )
+
+
+def _model_info_in_worker() -> dict:
+    """Model info of the worker's adapter."""
+    return _worker_loop.run_until_complete(_worker_adapter.get_model_info())
+
+
+class ProcessPoolNerAdapter(NerService):
+    """
+    NerService that dispatches documents to a pool of worker processes.
+
+    The pool is started on first use; a crashed pool is replaced on the
+    next call.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], NerService],
+        workers: int = 2,
+        torch_threads: int = 0,
+        shared_memory_min_bytes: int = SHARED_MEMORY_MIN_BYTES,
+    ) -> None:
+        """
+        Initialize the adapter.
+
+        Args:
+            factory: Picklable callable building the NER service in each worker
+            workers: Number of worker processes
+            torch_threads: torch intra-op threads per worker (0 = torch default)
+            shared_memory_min_bytes: Texts from this size are sent via shared memory
+        """
+        self._factory = factory
+        self._workers = max(1, workers)
+        self._torch_threads = max(0, torch_threads)
+        self._shared_memory_min_bytes = shared_memory_min_bytes
+        self._executor: ProcessPoolExecutor | None = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Get or start the worker pool (spawned: no forked torch/OpenMP state)."""
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_worker,
+                initargs=(self._factory, self._torch_threads),
+            )
+            logger.info(
+                f"[NER] Started {self._workers} worker processes "
+                f"(torch threads per worker: {self._torch_threads or 'default'})"
+            )
+        return self._executor
+
+    async def _run(self, fn: Callable, *args):
+        """Run a function in the pool, dropping the pool if a worker died."""
+        loop = asyncio.get_running_loop()
+        try:
+            return await loop.run_in_executor(self._get_executor(), fn, *args)
+        except BrokenProcessPool:
+            logger.error("[NER] Worker process died, restarting the pool on next call")
+            self.shutdown()
+            raise
+
+    async def detect_entities(
+        self,
+        text: str,
+        categories: list[PiiCategory] | None = None,
+        min_confidence: float = 0.5,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[NerDetection]:
+        """
+        Detect entities in a worker process.
+
+        Args:
+            text: The text to analyze
+            categories: Optional filter for specific categories
+            min_confidence: Minimum confidence threshold
+            progress_callback: Called at 0% and 100% only
+
+        Returns:
+            Detections of the worker's NER service
+        """
+        if not text or not text.strip():
+            return []
+
+        if progress_callback:
+            await progress_callback(0, 100, "")
+
+        data = text.encode("utf-8")
+        shm: SharedMemory | None = None
+        payload: str | _SharedText = text
+        if len(data) >= self._shared_memory_min_bytes:
+            shm = SharedMemory(create=True, size=len(data))
+            shm.buf[: len(data)] = data
+            payload = _SharedText(shm.name, len(data))
+
+        try:
+            detections = await self._run(_detect_in_worker, payload, categories, min_confidence)
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        if progress_callback:
+            await progress_callback(100, 100, f"{len(detections)} entidades")
+        return detections
+
+    async def is_available(self) -> bool:
+        """Workers are started on demand, so the service is always available."""
+        return True
+
+    async def get_model_info(self) -> dict:
+        """
+        Get the pool configuration and the model info of one worker.
+
+        Returns:
+            Dict with pool details and the worker adapter's info
+        """
+        return {
+            "type": "process_pool",
+            "workers": self._workers,
+            "torch_threads": self._torch_threads or None,
+            "shared_memory_min_bytes": self._shared_memory_min_bytes,
+            "worker": await self._run(_model_info_in_worker),
+        }
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a new pool starts on the next call)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
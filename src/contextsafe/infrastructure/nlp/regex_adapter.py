@@ -22,6 +22,11 @@ from contextsafe.domain.shared.value_objects import (
     PiiCategory,
     TextSpan,
 )
+from contextsafe.infrastructure.nlp.regex_engine import (
+    PatternPrefilter,
+    PatternScanner,
+    derive_prefilter,
+)
 
 
 # DNI/NIE validation letters (official algorithm)
@@ -129,6 +134,7 @@ class RegexPattern:
     base_confidence: float
     validator: callable = None  # Optional validation function
     case_sensitive: bool = False  # Whether pattern needs case-sensitive matching
+    prefilter: PatternPrefilter = PatternPrefilter()  # Tokens every match contains
 
 
 # ============================================================================
@@ -814,8 +820,15 @@ class RegexNerAdapter(NerService):
     Validated patterns (DNI, IBAN) return confidence=1.0.
     """
 
-    def __init__(self) -> None:
-        """Initialize the regex NER adapter."""
+    def __init__(self, use_prefilters: bool = True) -> None:
+        """
+        Initialize the regex NER adapter.
+
+        Args:
+            use_prefilters: Skip patterns whose required digit/keyword is absent
+                from the text (same detections, fewer full scans)
+        """
+        self._use_prefilters = use_prefilters
         self._patterns: list[RegexPattern] = []
         self._compile_patterns()
 
@@ -831,13 +844,15 @@ class RegexNerAdapter(NerService):
             if category_result.is_ok():
                 # Use IGNORECASE only when NOT case_sensitive
                 flags = 0 if case_sensitive else re.IGNORECASE
+                compiled = re.compile(pattern_str, flags)
                 self._patterns.append(
                     RegexPattern(
-                        pattern=re.compile(pattern_str, flags),
+                        pattern=compiled,
                         category=category_result.unwrap(),
                         base_confidence=confidence,
                         validator=validator,
                         case_sensitive=case_sensitive,
+                        prefilter=derive_prefilter(compiled),
                     )
                 )
 
@@ -865,6 +880,9 @@ class RegexNerAdapter(NerService):
 
         detections: list[NerDetection] = []
         seen_spans: set = set()  # Avoid duplicates
+        scanner = PatternScanner(text)
+        # A regex already scanned in this call can only yield seen spans
+        scanned: set[tuple[str, int]] = set()
 
         for regex_pattern in self._patterns:
             # Filter by category if specified
@@ -875,7 +893,21 @@ class RegexNerAdapter(NerService):
             if regex_pattern.base_confidence < min_confidence:
                 continue
 
-            for match in regex_pattern.pattern.finditer(text):
+            # Skip the full scan if a token every match needs is absent
+            if self._use_prefilters and not scanner.passes(regex_pattern.prefilter):
+                continue
+
+            source = (regex_pattern.pattern.pattern, regex_pattern.pattern.flags)
+            if source in scanned:
+                continue
+            scanned.add(source)
+
+            if self._use_prefilters:
+                matches = scanner.finditer(regex_pattern.pattern, regex_pattern.prefilter)
+            else:
+                matches = regex_pattern.pattern.finditer(text)
+
+            for match in matches:
                 # ============================================================
                 # CRITICAL FIX: Decide whether to use group 1 or full match
                 #
@@ -994,6 +1026,7 @@ class RegexNerAdapter(NerService):
             "type": "regex",
             "pattern_count": len(self._patterns),
             "validated_patterns": validated_patterns,
+            "prefiltered_patterns": sum(1 for p in self._patterns if not p.prefilter.is_trivial),
             "categories": list(set(str(p.category) for p in self._patterns)),
             "note": "Validated patterns (DNI, IBAN) return confidence=1.0",
         }
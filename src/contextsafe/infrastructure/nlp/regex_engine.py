@@ -0,0 +1,410 @@
+"""
+Multi-pattern regex engine helpers.
+
+Two exact optimizations for the large pattern lists used by NER:
+
+1. Prefilters. Each pattern is analysed once at compile time to find
+   tokens every match must contain: a digit, or one of a set of literal
+   keywords ("ECLI", "colegiado", "@", ...). Before scanning a text the
+   prefilters are checked (each distinct prefilter once per text) and
+   patterns whose prefilter is absent skip their full ``finditer`` pass.
+   Patterns whose matches always start with a keyword ("Autos", "Banco",
+   "Calle", ...) are only tried at the keyword's occurrences.
+
+2. Alternation groups. Pattern lists used only as a yes/no test
+   (``any(p.match(value) for p in patterns)``) are merged into a single
+   alternation with per-branch scoped flags, so one call replaces N.
+
+Both return exactly what the sequential version returns. Patterns that
+produce spans are never merged: overlapping matches from different
+patterns are part of the detector output.
+
+Traceability:
+- Adapter: RegexNerAdapter
+- Merge filters: CompositeNerAdapter
+"""
+
+from __future__ import annotations
+
+import re
+from collections.abc import Iterator
+from dataclasses import dataclass
+from functools import lru_cache
+from re import Match, Pattern
+from typing import Any
+
+
+DIGIT_PREFILTER = re.compile(r"\d")
+
+# Global inline flags at the start of a pattern, e.g. "(?i)" or "(?im)"
+_LEADING_FLAGS = re.compile(r"^\(\?([aiLmsux]+)\)")
+
+_FLAG_LETTERS = (
+    (re.IGNORECASE, "i"),
+    (re.MULTILINE, "m"),
+    (re.DOTALL, "s"),
+)
+
+# Shortest keyword worth a prefilter (single characters only if not alphanumeric, e.g. "@")
+_MIN_KEYWORD_LENGTH = 2
+
+# Shortest leading keyword worth jumping to instead of a full scan
+_MIN_LEADING_LENGTH = 3
+
+# Pattern analysis reads CPython's private sre modules. If they are missing
+# or changed, every prefilter is trivial and patterns get a plain full scan.
+try:
+    import re._casefix as sre_casefix
+    import re._constants as sre_constants
+    import re._parser as sre_parse
+
+    # Characters that match others under re.IGNORECASE without sharing their
+    # str.lower() form (e.g. "ı" ~ "i", "ſ" ~ "s", "İ" lowers to two chars).
+    # Texts containing them use the regex prefilter instead of substring checks.
+    _CASE_FOLD_EXTRAS = frozenset(
+        chr(code) for codes in sre_casefix._EXTRA_CASES.values() for code in codes
+    )
+    _REPEATS = {
+        sre_constants.MAX_REPEAT,
+        sre_constants.MIN_REPEAT,
+        getattr(sre_constants, "POSSESSIVE_REPEAT", sre_constants.MAX_REPEAT),
+    }
+except (ImportError, AttributeError):
+    sre_constants = sre_parse = None
+    _CASE_FOLD_EXTRAS = frozenset()
+    _REPEATS = set()
+
+_IRREGULAR_CASE = re.compile(
+    "[" + re.escape("".join(sorted(_CASE_FOLD_EXTRAS | {"\u0130"}))) + "]"
+)
+
+
+@dataclass(frozen=True)
+class PatternPrefilter:
+    """Tokens that every match of a pattern must contain."""
+
+    requires_digit: bool = False
+    keywords: tuple[str, ...] = ()  # At least one must occur
+    ignore_case: bool = False
+    # Lowercased keywords when str.lower() agrees with re.IGNORECASE for them
+    folded_keywords: tuple[str, ...] = ()
+    # Every match starts with one of these (lowercased if ignore_case)
+    leading: tuple[str, ...] = ()
+
+    @property
+    def is_trivial(self) -> bool:
+        """True when the pattern has no usable prefilter."""
+        return not self.requires_digit and not self.keywords
+
+
+# Equal prefilters share one instance so per-text results are memoized once
+_INTERNED: dict[PatternPrefilter, PatternPrefilter] = {}
+
+
+def _simple_case(keyword: str) -> bool:
+    """Check if str.lower() agrees with re.IGNORECASE for every char of keyword."""
+    return all(len(c.lower()) == 1 and c.lower() not in _CASE_FOLD_EXTRAS for c in keyword)
+
+
+@lru_cache(maxsize=256)
+def _keyword_regex(keywords: tuple[str, ...], ignore_case: bool) -> Pattern:
+    return re.compile("|".join(re.escape(k) for k in keywords), re.IGNORECASE if ignore_case else 0)
+
+
+def derive_prefilter(pattern: Pattern) -> PatternPrefilter:
+    """
+    Find tokens every match of ``pattern`` must contain.
+
+    Conservative: anything the analysis does not understand (scoped flag
+    changes, look-arounds, optional parts) is treated as not required.
+
+    Args:
+        pattern: Compiled pattern
+
+    Returns:
+        Prefilter (possibly trivial)
+    """
+    if sre_parse is None:
+        return _INTERNED.setdefault(PatternPrefilter(), PatternPrefilter())
+    try:
+        parsed = sre_parse.parse(pattern.pattern, pattern.flags)
+        items = list(parsed)
+        requires_digit = _requires_digit(items)
+        required = _required_keywords(items)
+        starts = _leading_literals(items)
+    except Exception:
+        return _INTERNED.setdefault(PatternPrefilter(), PatternPrefilter())
+
+    keywords = tuple(sorted(required or (), key=lambda k: (-len(k), k)))
+    ignore_case = bool(pattern.flags & re.IGNORECASE)
+    folded = ()
+    if ignore_case and all(_simple_case(k) for k in keywords):
+        folded = tuple(k.lower() for k in keywords)
+
+    leading: tuple[str, ...] = ()
+    if (
+        starts
+        and parsed.getwidth()[0] > 0
+        and all(len(k) >= _MIN_LEADING_LENGTH for k in starts)
+        and (not ignore_case or all(_simple_case(k) for k in starts))
+    ):
+        leading = tuple(sorted(k.lower() if ignore_case else k for k in starts))
+
+    prefilter = PatternPrefilter(
+        requires_digit=requires_digit,
+        keywords=keywords,
+        ignore_case=ignore_case,
+        folded_keywords=folded,
+        leading=leading,
+    )
+    return _INTERNED.setdefault(prefilter, prefilter)
+
+
+def _is_digit_set(av: Any) -> bool:
+    """Check if an IN set only contains digits."""
+    if not av:
+        return False
+    for op, value in av:
+        if op == sre_constants.NEGATE:
+            return False
+        if op == sre_constants.CATEGORY:
+            if value != sre_constants.CATEGORY_DIGIT:
+                return False
+        elif op == sre_constants.LITERAL:
+            if not chr(value).isdecimal():
+                return False
+        elif op == sre_constants.RANGE:
+            low, high = value
+            if not (ord("0") <= low and high <= ord("9")):
+                return False
+        else:
+            return False
+    return True
+
+
+def _requires_digit(items: list) -> bool:
+    """Check if a parsed sequence always consumes at least one digit."""
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            if chr(av).isdecimal():
+                return True
+        elif op == sre_constants.IN:
+            if _is_digit_set(av):
+                return True
+        elif op in _REPEATS:
+            min_count, _, sub = av
+            if min_count >= 1 and _requires_digit(list(sub)):
+                return True
+        elif op == sre_constants.SUBPATTERN:
+            sub = av[-1]
+            if _requires_digit(list(sub)):
+                return True
+        elif op == sre_constants.ATOMIC_GROUP:
+            if _requires_digit(list(av)):
+                return True
+        elif op == sre_constants.BRANCH:
+            _, branches = av
+            if branches and all(_requires_digit(list(b)) for b in branches):
+                return True
+    return False
+
+
+def _literal_runs(items: list) -> list[set[str]]:
+    """
+    Collect keyword sets from a parsed sequence.
+
+    Each returned set means "every match contains one of these strings".
+    """
+    found: list[set[str]] = []
+    run: list[str] = []
+
+    def flush() -> None:
+        if run:
+            found.append({"".join(run)})
+            run.clear()
+
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            # Zero-width: does not break a literal run
+            continue
+        flush()
+        if op == sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                continue
+            found.extend(_literal_runs(list(sub)))
+        elif op in _REPEATS:
+            min_count, _, sub = av
+            if min_count >= 1:
+                found.extend(_literal_runs(list(sub)))
+        elif op == sre_constants.BRANCH:
+            _, branches = av
+            branch_sets = []
+            for branch in branches:
+                best = _best_keywords(_literal_runs(list(branch)))
+                if best is None:
+                    branch_sets = []
+                    break
+                branch_sets.append(best)
+            if branch_sets:
+                found.append(set().union(*branch_sets))
+    flush()
+    return found
+
+
+def _leading_literals(items: list) -> set[str] | None:
+    """Strings one of which every match starts with (None if unknown)."""
+    run: list[str] = []
+    for op, av in items:
+        if op == sre_constants.LITERAL:
+            run.append(chr(av))
+            continue
+        if op in (sre_constants.AT, sre_constants.ASSERT, sre_constants.ASSERT_NOT):
+            continue
+        if run:
+            break
+        if op == sre_constants.SUBPATTERN:
+            _, add_flags, del_flags, sub = av
+            if add_flags or del_flags:
+                return None
+            return _leading_literals(list(sub))
+        if op in _REPEATS:
+            min_count, _, sub = av
+            return _leading_literals(list(sub)) if min_count >= 1 else None
+        if op == sre_constants.BRANCH:
+            _, branches = av
+            starts: set[str] = set()
+            for branch in branches:
+                branch_starts = _leading_literals(list(branch))
+                if not branch_starts:
+                    return None
+                starts |= branch_starts
+            return starts
+        return None
+    return {"".join(run)} if run else None
+
+
+def _usable(keyword: str) -> bool:
+    return len(keyword) >= _MIN_KEYWORD_LENGTH or not keyword.isalnum()
+
+
+def _best_keywords(candidates: list[set[str]]) -> set[str] | None:
+    """Pick the most selective keyword set (longest shortest alternative)."""
+    usable = [c for c in candidates if c and all(_usable(k) and k.strip() for k in c)]
+    if not usable:
+        return None
+    return max(usable, key=lambda c: (min(len(k) for k in c), -len(c)))
+
+
+def _required_keywords(items: list) -> set[str] | None:
+    return _best_keywords(_literal_runs(items))
+
+
+class PatternScanner:
+    """
+    Runs prefiltered pattern scans over one text.
+
+    Keyword checks are plain substring searches (on a lowercased copy for
+    case-insensitive patterns); each distinct prefilter is evaluated once.
+    """
+
+    def __init__(self, text: str) -> None:
+        self._text = text
+        self._lowered: str | None = None
+        self._lower_checked = False
+        self._has_digit: bool | None = None
+        self._results: dict[int, bool] = {}
+
+    def passes(self, prefilter: PatternPrefilter) -> bool:
+        """Check whether the text can contain a match for the prefilter's pattern."""
+        result = self._results.get(id(prefilter))
+        if result is None:
+            result = self._evaluate(prefilter)
+            self._results[id(prefilter)] = result
+        return result
+
+    def finditer(self, pattern: Pattern, prefilter: PatternPrefilter) -> Iterator[Match]:
+        """
+        Same matches as ``pattern.finditer(text)``.
+
+        Patterns with leading keywords are only tried where a keyword
+        occurs instead of at every position.
+        """
+        if not prefilter.leading:
+            return pattern.finditer(self._text)
+        if prefilter.ignore_case:
+            haystack = self._lower()
+            if haystack is None:
+                return pattern.finditer(self._text)
+        else:
+            haystack = self._text
+
+        starts: set[int] = set()
+        for keyword in prefilter.leading:
+            position = haystack.find(keyword)
+            while position != -1:
+                starts.add(position)
+                position = haystack.find(keyword, position + 1)
+
+        return self._match_at(pattern, sorted(starts))
+
+    def _match_at(self, pattern: Pattern, starts: list[int]) -> Iterator[Match]:
+        # finditer semantics: leftmost match, next search resumes at its end
+        resume = 0
+        for start in starts:
+            if start < resume:
+                continue
+            match = pattern.match(self._text, start)
+            if match:
+                yield match
+                resume = match.end()
+
+    def _evaluate(self, prefilter: PatternPrefilter) -> bool:
+        if prefilter.requires_digit:
+            if self._has_digit is None:
+                self._has_digit = DIGIT_PREFILTER.search(self._text) is not None
+            if not self._has_digit:
+                return False
+
+        if not prefilter.keywords:
+            return True
+        if not prefilter.ignore_case:
+            return any(k in self._text for k in prefilter.keywords)
+        if prefilter.folded_keywords and self._lower() is not None:
+            return any(k in self._lowered for k in prefilter.folded_keywords)
+        return _keyword_regex(prefilter.keywords, True).search(self._text) is not None
+
+    def _lower(self) -> str | None:
+        """Lowercased text, or None if it has irregular case-folding characters."""
+        if not self._lower_checked:
+            self._lower_checked = True
+            if not _IRREGULAR_CASE.search(self._text):
+                self._lowered = self._text.lower()
+        return self._lowered
+
+
+def _scoped_source(pattern: Pattern) -> str:
+    """Rewrite a pattern as a group carrying its own flags."""
+    source = _LEADING_FLAGS.sub("", pattern.pattern, count=1)
+    letters = "".join(letter for flag, letter in _FLAG_LETTERS if pattern.flags & flag)
+    return f"(?{letters}:{source})" if letters else f"(?:{source})"
+
+
+def combine_patterns(patterns: list[Pattern]) -> Pattern:
+    """
+    Merge patterns into a single alternation for yes/no tests.
+
+    ``combined.match(s)`` succeeds iff some pattern matches at the start
+    of ``s``; ``combined.search(s)`` succeeds iff some pattern matches
+    anywhere. Group numbers are not preserved.
+
+    Args:
+        patterns: Compiled patterns (no backreferences)
+
+    Returns:
+        Compiled alternation
+    """
+    return re.compile("|".join(_scoped_source(p) for p in patterns))
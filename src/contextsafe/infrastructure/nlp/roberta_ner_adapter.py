@@ -23,7 +23,6 @@ OFFLINE MODE:
 
 from __future__ import annotations
 
-import asyncio
 import logging
 import os
 import re
@@ -37,6 +36,7 @@ from contextsafe.domain.shared.value_objects import (
     PiiCategory,
     TextSpan,
 )
+from contextsafe.infrastructure.nlp.inference_scheduler import MicroBatchScheduler
 
 
 # Check for offline mode via environment variables
@@ -150,7 +150,10 @@ class RobertaNerAdapter(NerService):
     Features:
     - Lazy model loading
     - Automatic chunking for long documents (>512 tokens)
+    - Token-window chunking driven by the tokenizer's offset mapping
     - Overlap handling to avoid losing entities at chunk boundaries
+    - Batched inference: chunks are sent to the pipeline as padded batches
+    - Cross-document micro-batching through a shared MicroBatchScheduler
     - High accuracy for formal Spanish text
     - Non-blocking inference via ThreadPoolExecutor
     """
@@ -158,6 +161,16 @@ class RobertaNerAdapter(NerService):
     # RoBERTa max tokens is 512, but we use less to be safe with special tokens
     MAX_CHUNK_CHARS = 1500  # ~375 tokens approx (4 chars/token average)
     OVERLAP_CHARS = 200  # Overlap between chunks to catch boundary entities
+    DEFAULT_BATCH_SIZE = 8  # Chunks per pipeline call (padded batch)
+
+    # Cross-document micro-batching (shared by all in-flight documents)
+    MAX_BATCH_SIZE = 32  # Max chunks/windows per forward pass
+    MAX_WAIT_MS = 10.0  # Max wait for other documents to join a batch
+
+    # Token-window chunking (exact, driven by the tokenizer offset mapping)
+    WINDOW_TOKENS = 510  # Content tokens per window (512 minus <s> and </s>)
+    TOKEN_STRIDE = 64  # Tokens shared by consecutive windows (HF "stride")
+    CHUNKING_MODES = ("tokens", "chars")
 
     # Thread pool for non-blocking ML inference
     # Using max_workers=1 to avoid GPU memory issues with concurrent inference
@@ -170,6 +183,12 @@ class RobertaNerAdapter(NerService):
         device: str | int = -1,  # -1 = CPU, 0+ = GPU index
         local_files_only: bool | None = None,  # None = auto-detect
         cache_dir: str | Path | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        chunking: str = "tokens",
+        window_tokens: int = WINDOW_TOKENS,
+        token_stride: int = TOKEN_STRIDE,
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait_ms: float = MAX_WAIT_MS,
     ) -> None:
         """
         Initialize the Spanish NER adapter.
@@ -181,7 +200,19 @@ class RobertaNerAdapter(NerService):
             local_files_only: If True, only use cached models (no internet required)
                              If None, auto-detect based on HF_OFFLINE env var
             cache_dir: Custom cache directory for models
+            batch_size: Number of chunks sent to the pipeline per call (1 = no batching)
+            chunking: "tokens" to cut exact token windows from a single tokenization
+                      (falls back to "chars" if the tokenizer has no offset mapping),
+                      or "chars" for the legacy character-based chunker
+            window_tokens: Content tokens per window in "tokens" mode
+            token_stride: Tokens shared by consecutive windows in "tokens" mode
+            max_batch_size: Max chunks/windows per forward pass across all documents
+            max_wait_ms: Max time a batch waits for other documents to join
         """
+        if chunking not in self.CHUNKING_MODES:
+            raise ValueError(f"Unknown chunking mode: {chunking!r}")
+        if not 0 <= token_stride < window_tokens:
+            raise ValueError("token_stride must be >= 0 and smaller than window_tokens")
         self._model_name = model_name
         self._min_score = min_score
         self._device = device
@@ -189,6 +220,14 @@ class RobertaNerAdapter(NerService):
         self._is_loaded = False
         self._load_error: str | None = None
         self._cache_dir = Path(cache_dir) if cache_dir else DEFAULT_CACHE_DIR
+        self._batch_size = max(1, batch_size)
+        self._chunking = chunking
+        self._window_tokens = window_tokens
+        self._token_stride = token_stride
+        self._max_batch_size = max(max_batch_size, self._batch_size)
+        self._max_wait_ms = max_wait_ms
+        self._text_scheduler: MicroBatchScheduler[str, list[dict[str, Any]]] | None = None
+        self._window_scheduler: MicroBatchScheduler[list[int], Any] | None = None
         # Auto-detect offline mode from environment
         self._local_files_only = local_files_only if local_files_only is not None else OFFLINE_MODE
 
@@ -359,8 +398,10 @@ class RobertaNerAdapter(NerService):
         """
         Detect PII entities using BERT NER with automatic chunking.
 
-        For long documents (>1500 chars), splits into overlapping chunks
-        to handle BERT's 512 token limit.
+        In "tokens" mode the document is tokenized once and split into
+        overlapping windows of exact token length. Otherwise, long documents
+        (>1500 chars) are split into overlapping character chunks to handle
+        BERT's 512 token limit.
 
         Args:
             text: The text to analyze
@@ -382,6 +423,12 @@ class RobertaNerAdapter(NerService):
             if progress_callback:
                 await progress_callback(0, 100, "Cargando modelo RoBERTa...")
 
+            # Exact token windows (no truncation, no re-tokenized overlap)
+            if self._chunking == "tokens" and self._supports_token_windows():
+                return await self._detect_with_token_windows(
+                    text, categories, effective_min_score, progress_callback
+                )
+
             # For long texts, use chunking
             if len(text) > self.MAX_CHUNK_CHARS:
                 return await self._detect_with_chunking(
@@ -403,8 +450,10 @@ class RobertaNerAdapter(NerService):
             return result
 
         except Exception as e:
+            # Propagate: an empty result would pass for "no entities found"
+            # (CompositeNerAdapter reports the detector as skipped instead)
             logger.error(f"[RobertaNerAdapter] Error during detection: {e}")
-            return []
+            raise
 
     async def _detect_with_chunking(
         self,
@@ -416,11 +465,9 @@ class RobertaNerAdapter(NerService):
         """
         Process long text in overlapping chunks with intelligent splitting.
 
-        Uses smart boundaries to avoid cutting words or entities:
-        1. Paragraph boundaries (double newline)
-        2. Sentence boundaries (period + space/newline)
-        3. Single newlines
-        4. Word boundaries (space) - NEVER cuts mid-word
+        All chunk boundaries are computed up front (see _compute_chunk_spans)
+        and the chunks are sent to the pipeline in padded batches of
+        ``batch_size``, one executor call per batch.
 
         Args:
             text: Full text to process
@@ -432,45 +479,340 @@ class RobertaNerAdapter(NerService):
             Merged detections from all chunks
         """
         all_detections: list[NerDetection] = []
-        chunk_size = self.MAX_CHUNK_CHARS
-        overlap = self.OVERLAP_CHARS
+        spans = self._compute_chunk_spans(text)
+        total_chunks = len(spans)
+        batch_size = self._batch_size
+        total_batches = (total_chunks + batch_size - 1) // batch_size
+        logger.info(
+            f"Processing {len(text)} chars in {total_chunks} chunks "
+            f"({total_batches} batches of up to {batch_size})"
+        )
 
-        pos = 0
-        chunk_num = 0
-        total_chunks = (len(text) // (chunk_size - overlap)) + 1
-        logger.info(f"Processing {len(text)} chars in ~{total_chunks} chunks")
+        for batch_num, batch_start in enumerate(range(0, total_chunks, batch_size), start=1):
+            batch_spans = spans[batch_start : batch_start + batch_size]
+            chunks = [text[start:end] for start, end in batch_spans]
+            first_chunk = batch_start + 1
+            last_chunk = batch_start + len(batch_spans)
 
-        while pos < len(text):
-            # Calculate ideal chunk end
-            ideal_end = min(pos + chunk_size, len(text))
+            # Report progress before processing batch (map to 10-90 range)
+            if progress_callback:
+                pre_progress = int(10 + (80 * batch_start / total_chunks))
+                await progress_callback(
+                    pre_progress,
+                    100,
+                    f"RoBERTa: analizando chunks {first_chunk}-{last_chunk}/{total_chunks}...",
+                )
 
-            # Find the best breaking point
-            chunk_end = self._find_chunk_boundary(text, pos, ideal_end)
+            # Detect entities in the whole batch (async to allow WebSocket updates)
+            batch_results = await self._run_pipeline_batch(chunks)
 
-            chunk = text[pos:chunk_end]
-            chunk_num += 1
+            batch_count = 0
+            for (offset, _end), chunk, raw_entities in zip(
+                batch_spans, chunks, batch_results, strict=True
+            ):
+                chunk_detections = self._build_detections(
+                    raw_entities, chunk, offset, categories, min_score
+                )
+                batch_count += len(chunk_detections)
+                all_detections.extend(chunk_detections)
 
-            # Report progress before processing chunk (map to 0-90 range)
+            # Report progress after processing batch
             if progress_callback:
-                # Use percentage scale (0-100) for more granular updates
-                pre_progress = int(10 + (80 * (chunk_num - 1) / total_chunks))
+                post_progress = int(10 + (80 * last_chunk / total_chunks))
                 await progress_callback(
-                    pre_progress, 100, f"RoBERTa: analizando chunk {chunk_num}/{total_chunks}..."
+                    post_progress,
+                    100,
+                    f"RoBERTa: lote {batch_num}/{total_batches} - {batch_count} entidades",
                 )
 
-            # Detect entities in this chunk (async to allow WebSocket updates)
-            chunk_detections = await self._detect_single_chunk(chunk, pos, categories, min_score)
-            all_detections.extend(chunk_detections)
+        # Report completion
+        if progress_callback:
+            await progress_callback(
+                95, 100, f"RoBERTa: deduplicando {len(all_detections)} detecciones..."
+            )
+
+        # Deduplicate (especially important for overlap regions)
+        return self._deduplicate_overlapping(all_detections)
+
+    def _supports_token_windows(self) -> bool:
+        """Check whether the loaded pipeline exposes a fast tokenizer and model."""
+        pipe = self._ensure_pipeline()
+        tokenizer = getattr(pipe, "tokenizer", None)
+        return (
+            tokenizer is not None
+            and getattr(tokenizer, "is_fast", False)
+            and getattr(pipe, "model", None) is not None
+        )
+
+    async def _detect_with_token_windows(
+        self,
+        text: str,
+        categories: list[PiiCategory] | None,
+        min_score: float,
+        progress_callback: ProgressCallback | None = None,
+    ) -> list[NerDetection]:
+        """
+        Process text in overlapping windows of exactly ``window_tokens`` tokens.
+
+        The document is tokenized once with ``return_offsets_mapping``; windows
+        are slices of that token sequence, so nothing is truncated and the
+        overlap is never re-tokenized. Logits of tokens seen by several
+        windows are averaged before decoding, then entities are grouped
+        like the pipeline's "simple" aggregation and mapped back to the
+        original text through the offsets.
+
+        Args:
+            text: Full text to process
+            categories: Category filter
+            min_score: Minimum confidence
+            progress_callback: Optional async callback for progress updates
+
+        Returns:
+            Detections with positions in the original text
+        """
+        import numpy as np
+
+        pipe = self._ensure_pipeline()
+        encoding = pipe.tokenizer(
+            text, add_special_tokens=False, return_offsets_mapping=True
+        )
+        input_ids: list[int] = encoding["input_ids"]
+        offsets: list[tuple[int, int]] = [tuple(o) for o in encoding["offset_mapping"]]
+        if not input_ids:
+            return []
+
+        windows = self._compute_token_windows(len(input_ids))
+        total_windows = len(windows)
+        batch_size = self._batch_size
+        total_batches = (total_windows + batch_size - 1) // batch_size
+        logger.info(
+            f"Processing {len(input_ids)} tokens in {total_windows} windows "
+            f"({total_batches} batches of up to {batch_size})"
+        )
+
+        logits_sum: Any = None
+        counts = np.zeros(len(input_ids), dtype=np.float32)
+
+        for batch_num, batch_start in enumerate(range(0, total_windows, batch_size), start=1):
+            batch_windows = windows[batch_start : batch_start + batch_size]
+            last_window = batch_start + len(batch_windows)
+
+            if progress_callback:
+                pre_progress = int(10 + (80 * batch_start / total_windows))
+                await progress_callback(
+                    pre_progress,
+                    100,
+                    f"RoBERTa: analizando ventanas {batch_start + 1}-{last_window}/{total_windows}...",
+                )
+
+            # Shared scheduler: may run together with other documents' windows
+            window_logits = await self._get_window_scheduler().submit(
+                [input_ids[start:end] for start, end in batch_windows]
+            )
+
+            for (start, end), logits in zip(batch_windows, window_logits, strict=True):
+                if logits_sum is None:
+                    logits_sum = np.zeros((len(input_ids), logits.shape[-1]), dtype=np.float32)
+                logits_sum[start:end] += logits
+                counts[start:end] += 1
 
-            # Report progress after processing chunk
             if progress_callback:
-                post_progress = int(10 + (80 * chunk_num / total_chunks))
+                post_progress = int(10 + (80 * last_window / total_windows))
                 await progress_callback(
                     post_progress,
                     100,
-                    f"RoBERTa: chunk {chunk_num}/{total_chunks} - {len(chunk_detections)} entidades",
+                    f"RoBERTa: lote {batch_num}/{total_batches} procesado",
                 )
 
+        merged_logits = logits_sum / counts[:, None]
+        raw_entities = self._aggregate_token_predictions(
+            merged_logits, offsets, self._id2label(), text
+        )
+        detections = self._build_detections(raw_entities, text, 0, categories, min_score)
+
+        if progress_callback:
+            await progress_callback(
+                95, 100, f"RoBERTa: deduplicando {len(detections)} detecciones..."
+            )
+
+        return self._deduplicate_overlapping(detections)
+
+    def _compute_token_windows(self, num_tokens: int) -> list[tuple[int, int]]:
+        """
+        Split a token sequence into overlapping windows.
+
+        Args:
+            num_tokens: Length of the tokenized document
+
+        Returns:
+            List of (start, end) token index spans covering the whole sequence
+        """
+        window = self._window_tokens
+        step = window - self._token_stride
+        windows: list[tuple[int, int]] = []
+
+        start = 0
+        while True:
+            end = min(start + window, num_tokens)
+            windows.append((start, end))
+            if end >= num_tokens:
+                break
+            start += step
+
+        return windows
+
+    def _forward_token_rows(self, rows: list[list[int]]) -> list[Any]:
+        """
+        Run the model on a padded batch of token windows (executor thread).
+
+        Args:
+            rows: Token ids of each window (no special tokens)
+
+        Returns:
+            Per-window float32 logits arrays of shape (window_len, num_labels),
+            with special tokens and padding stripped
+        """
+        import torch
+
+        pipe = self._ensure_pipeline()
+        model = pipe.model
+        batch_ids, attention, prefix = self._build_window_batch(pipe.tokenizer, rows)
+
+        with torch.no_grad():
+            logits = model(
+                input_ids=torch.from_numpy(batch_ids).to(model.device),
+                attention_mask=torch.from_numpy(attention).to(model.device),
+            ).logits
+        logits = logits.float().cpu().numpy()
+
+        return [logits[i, prefix : prefix + len(row)] for i, row in enumerate(rows)]
+
+    def _build_window_batch(self, tokenizer: Any, rows: list[list[int]]) -> tuple[Any, Any, int]:
+        """
+        Build a right-padded int64 batch (with special tokens) for token windows.
+
+        Args:
+            tokenizer: Fast tokenizer of the model
+            rows: Token ids of each window (no special tokens)
+
+        Returns:
+            (input_ids, attention_mask, prefix) where prefix is the number of
+            leading special tokens before the window content
+        """
+        import numpy as np
+
+        full_rows = [tokenizer.build_inputs_with_special_tokens(row) for row in rows]
+        max_len = max(len(row) for row in full_rows)
+        pad_id = tokenizer.pad_token_id if tokenizer.pad_token_id is not None else 0
+
+        batch_ids = np.full((len(full_rows), max_len), pad_id, dtype=np.int64)
+        attention = np.zeros((len(full_rows), max_len), dtype=np.int64)
+        for i, row in enumerate(full_rows):
+            batch_ids[i, : len(row)] = row
+            attention[i, : len(row)] = 1
+
+        # Content tokens sit between the leading and trailing special tokens
+        prefix = len(tokenizer.build_inputs_with_special_tokens([])) // 2
+        return batch_ids, attention, prefix
+
+    def _id2label(self) -> dict[int, str]:
+        """Get the label mapping of the loaded model."""
+        return self._ensure_pipeline().model.config.id2label
+
+    def _aggregate_token_predictions(
+        self,
+        logits: Any,
+        offsets: list[tuple[int, int]],
+        id2label: dict[int, str],
+        text: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Group per-token predictions into entities ("simple" aggregation).
+
+        Adjacent tokens with the same entity type are merged unless the
+        token starts a new entity (B- prefix). The entity score is the mean
+        probability of its tokens.
+
+        Args:
+            logits: Array of shape (num_tokens, num_labels)
+            offsets: Character offsets of each token in the original text
+            id2label: Model label mapping
+            text: Original text
+
+        Returns:
+            Raw entities in pipeline format (entity_group, score, word, start, end)
+        """
+        import numpy as np
+
+        shifted = logits - logits.max(axis=-1, keepdims=True)
+        probs = np.exp(shifted)
+        probs /= probs.sum(axis=-1, keepdims=True)
+        label_ids = probs.argmax(axis=-1)
+
+        entities: list[dict[str, Any]] = []
+        current: dict[str, Any] | None = None
+        scores: list[float] = []
+
+        def close_current() -> None:
+            if current is not None:
+                current["score"] = float(np.mean(scores))
+                current["word"] = text[current["start"] : current["end"]]
+                entities.append(current)
+
+        for index, label_id in enumerate(label_ids):
+            start, end = offsets[index]
+            if start == end:
+                continue  # Token without characters (e.g. a bare "▁")
+
+            label = id2label[int(label_id)]
+            if label == "O":
+                close_current()
+                current, scores = None, []
+                continue
+
+            prefix, _, tag = label.rpartition("-")
+            if current is not None and tag == current["entity_group"] and prefix != "B":
+                current["end"] = end
+                scores.append(float(probs[index, label_id]))
+                continue
+
+            close_current()
+            current = {"entity_group": tag, "start": start, "end": end}
+            scores = [float(probs[index, label_id])]
+
+        close_current()
+        return entities
+
+    def _compute_chunk_spans(self, text: str) -> list[tuple[int, int]]:
+        """
+        Pre-compute overlapping chunk boundaries for a long text.
+
+        Uses smart boundaries to avoid cutting words or entities:
+        1. Paragraph boundaries (double newline)
+        2. Sentence boundaries (period + space/newline)
+        3. Single newlines
+        4. Word boundaries (space) - NEVER cuts mid-word
+
+        Args:
+            text: Full text to split
+
+        Returns:
+            List of (start, end) character spans, in document order
+        """
+        chunk_size = self.MAX_CHUNK_CHARS
+        overlap = self.OVERLAP_CHARS
+        spans: list[tuple[int, int]] = []
+
+        pos = 0
+        while pos < len(text):
+            # Calculate ideal chunk end and find the best breaking point
+            ideal_end = min(pos + chunk_size, len(text))
+            chunk_end = self._find_chunk_boundary(text, pos, ideal_end)
+            spans.append((pos, chunk_end))
+
+            if chunk_end >= len(text):
+                break
+
             # Move position for next chunk
             # Start overlap from a word boundary
             next_pos = chunk_end - overlap
@@ -482,17 +824,7 @@ class RobertaNerAdapter(NerService):
             else:
                 pos = chunk_end  # No overlap possible
 
-            if pos >= len(text):
-                break
-
-        # Report completion
-        if progress_callback:
-            await progress_callback(
-                95, 100, f"RoBERTa: deduplicando {len(all_detections)} detecciones..."
-            )
-
-        # Deduplicate (especially important for overlap regions)
-        return self._deduplicate_overlapping(all_detections)
+        return spans
 
     def _find_chunk_boundary(self, text: str, start: int, ideal_end: int) -> int:
         """
@@ -558,9 +890,9 @@ class RobertaNerAdapter(NerService):
         """
         Detect entities in a single text chunk.
 
-        Uses run_in_executor to avoid blocking the asyncio event loop during
-        ML inference. This allows WebSocket progress updates to continue
-        while the model processes the chunk.
+        Inference runs in the shared executor (via the scheduler) to avoid
+        blocking the asyncio event loop. This allows WebSocket progress
+        updates to continue while the model processes the chunk.
 
         Args:
             chunk: Text chunk to process
@@ -571,17 +903,87 @@ class RobertaNerAdapter(NerService):
         Returns:
             List of detections with positions adjusted by offset
         """
+        raw_entities = (await self._run_pipeline_batch([chunk]))[0]
+        return self._build_detections(raw_entities, chunk, offset, categories, min_score)
+
+    async def _run_pipeline_batch(self, chunks: list[str]) -> list[list[dict[str, Any]]]:
+        """
+        Run the NER pipeline on several chunks through the shared scheduler.
+
+        Chunks submitted concurrently by other documents are merged into the
+        same padded batch, so the forward pass is amortized across documents.
+
+        Args:
+            chunks: Text chunks to process
+
+        Returns:
+            Raw pipeline entities for each chunk, in the same order
+        """
+        return await self._get_text_scheduler().submit(chunks)
+
+    def _pipeline_batch(self, chunks: list[str]) -> list[list[dict[str, Any]]]:
+        """
+        Run the transformers pipeline on a batch of chunks (executor thread).
+
+        Args:
+            chunks: Text chunks to process
+
+        Returns:
+            Raw pipeline entities for each chunk, in the same order
+        """
         pipe = self._ensure_pipeline()
+        results = pipe(chunks, batch_size=len(chunks))
+
+        # A single-element input may come back unwrapped
+        if len(chunks) == 1 and results and isinstance(results[0], dict):
+            return [results]
+        return list(results)
+
+    def _get_text_scheduler(self) -> MicroBatchScheduler[str, list[dict[str, Any]]]:
+        """Get the scheduler batching text chunks through the pipeline."""
+        if self._text_scheduler is None:
+            self._text_scheduler = MicroBatchScheduler(
+                self._pipeline_batch,
+                self._get_executor,
+                max_batch_size=self._max_batch_size,
+                max_wait_ms=self._max_wait_ms,
+                name="roberta_chunks",
+            )
+        return self._text_scheduler
+
+    def _get_window_scheduler(self) -> MicroBatchScheduler[list[int], Any]:
+        """Get the scheduler batching token windows through the model."""
+        if self._window_scheduler is None:
+            self._window_scheduler = MicroBatchScheduler(
+                self._forward_token_rows,
+                self._get_executor,
+                max_batch_size=self._max_batch_size,
+                max_wait_ms=self._max_wait_ms,
+                name="roberta_windows",
+            )
+        return self._window_scheduler
 
-        # Run inference in thread pool to avoid blocking event loop
-        # This allows WebSocket updates to be sent during processing
-        loop = asyncio.get_running_loop()
-        raw_entities = await loop.run_in_executor(
-            self._get_executor(),
-            pipe,
-            chunk,
-        )
+    def _build_detections(
+        self,
+        raw_entities: list[dict[str, Any]],
+        chunk: str,
+        offset: int,
+        categories: list[PiiCategory] | None,
+        min_score: float,
+    ) -> list[NerDetection]:
+        """
+        Convert raw pipeline entities for one chunk into NerDetections.
 
+        Args:
+            raw_entities: Pipeline output for the chunk
+            chunk: Text chunk the entities refer to
+            offset: Character offset of this chunk in the original text
+            categories: Category filter
+            min_score: Minimum confidence
+
+        Returns:
+            List of detections with positions adjusted by offset
+        """
         detections: list[NerDetection] = []
 
         for entity in raw_entities:
@@ -855,6 +1257,15 @@ class RobertaNerAdapter(NerService):
 
         return False
 
+    def _scheduler_stats(self) -> dict[str, Any]:
+        """Get micro-batching counters of the active schedulers."""
+        stats: dict[str, Any] = {"batch_size": self._batch_size}
+        if self._text_scheduler is not None:
+            stats["chunks"] = self._text_scheduler.stats()
+        if self._window_scheduler is not None:
+            stats["windows"] = self._window_scheduler.stats()
+        return stats
+
     async def is_available(self) -> bool:
         """
         Check if the RoBERTa model can be loaded.
@@ -909,6 +1320,8 @@ class RobertaNerAdapter(NerService):
             "load_error": self._load_error,
             "min_score": self._min_score,
             "device": "CPU" if self._device == -1 else f"GPU:{self._device}",
+            "chunking": self._chunking,
+            "batching": self._scheduler_stats(),
             "architecture": "pre-presidio",
             "label_mapping": LABEL_TO_CATEGORY,
             "tip": (
@@ -11,9 +11,11 @@ Traceability:
 from __future__ import annotations
 
 import asyncio
+import hashlib
+from collections import OrderedDict
 from typing import Any
 
-from contextsafe.application.ports import NerDetection, NerService
+from contextsafe.application.ports import NerDetection, NerService, ProgressCallback
 from contextsafe.domain.shared.value_objects import (
     ConfidenceScore,
     PiiCategory,
@@ -43,8 +45,15 @@ class SpacyNerAdapter(NerService):
     NER service using spaCy models.
 
     Provides fast, CPU-based NER for common entity types.
+
+    The Doc parsed by detect_entities() is kept briefly so that tokenize()
+    on the same text (token snapping in CompositeNerAdapter) reuses it
+    instead of parsing the document a second time.
     """
 
+    # Parsed Docs awaiting reuse by tokenize() (about one per in-flight document)
+    DOC_CACHE_SIZE = 8
+
     def __init__(
         self,
         model_name: str = "es_core_news_lg",
@@ -61,6 +70,7 @@ class SpacyNerAdapter(NerService):
         self._confidence_default = confidence_default
         self._nlp: Any = None
         self._is_loaded = False
+        self._doc_cache: OrderedDict[str, Any] = OrderedDict()
 
     async def _ensure_loaded(self) -> None:
         """Ensure the spaCy model is loaded."""
@@ -85,6 +95,7 @@ class SpacyNerAdapter(NerService):
         text: str,
         categories: list[PiiCategory] | None = None,
         min_confidence: float = 0.5,
+        progress_callback: ProgressCallback | None = None,
     ) -> list[NerDetection]:
         """
         Detect entities in text using spaCy.
@@ -93,6 +104,7 @@ class SpacyNerAdapter(NerService):
             text: The text to analyze
             categories: Optional filter for specific categories
             min_confidence: Minimum confidence threshold
+            progress_callback: Optional async callback (unused, single pass)
 
         Returns:
             List of detected entities
@@ -104,6 +116,7 @@ class SpacyNerAdapter(NerService):
 
         loop = asyncio.get_running_loop()
         doc = await loop.run_in_executor(None, self._nlp, text)
+        self._remember_doc(text, doc)
         detections: list[NerDetection] = []
 
         for ent in doc.ents:
@@ -176,7 +189,10 @@ class SpacyNerAdapter(NerService):
         Tokenize text and return spaCy Doc.
 
         Used by token snapping to align RoBERTa detections
-        to proper word boundaries.
+        to proper word boundaries. Reuses the Doc parsed by
+        detect_entities() for the same text; otherwise runs only the
+        tokenizer (nlp.make_doc), since snapping needs no NER output.
+        Runs off the event loop.
 
         Args:
             text: Text to tokenize
@@ -185,4 +201,25 @@ class SpacyNerAdapter(NerService):
             spaCy Doc object with tokens
         """
         await self._ensure_loaded()
-        return self._nlp(text)
+
+        doc = self._doc_cache.pop(self._doc_key(text), None)
+        if doc is not None and doc.text == text:
+            return doc
+
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._nlp.make_doc, text)
+
+    def _remember_doc(self, text: str, doc: Any) -> None:
+        """Keep a parsed Doc for reuse by tokenize(), evicting the oldest."""
+        key = self._doc_key(text)
+        self._doc_cache[key] = doc
+        self._doc_cache.move_to_end(key)
+        while len(self._doc_cache) > self.DOC_CACHE_SIZE:
+            self._doc_cache.popitem(last=False)
+
+    @staticmethod
+    def _doc_key(text: str) -> str:
+        """Hash of the text used as Doc cache key."""
+        return hashlib.blake2b(
+            text.encode("utf-8", "surrogatepass"), digest_size=16
+        ).hexdigest()
@@ -67,6 +67,27 @@ class AnonymizationStrategy(ABC):
         """
         ...
 
+    async def prepare(
+        self,
+        detections: list[NerDetection],
+        project_id: str,
+    ) -> None:
+        """
+        Optional batch step run before generate_replacement is called.
+
+        Strategies with expensive per-entity work (e.g. LLM calls) can plan
+        and prefetch it here. Default: nothing to do.
+
+        Args:
+            detections: Detections about to be replaced, in replacement order
+            project_id: Project context for consistency
+        """
+        return None
+
+    async def close(self) -> None:
+        """Release resources held by the strategy (default: none)."""
+        return None
+
     @property
     @abstractmethod
     def creates_glossary_entries(self) -> bool:
@@ -22,11 +22,16 @@ Example:
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
 import logging
 import random
 import shutil
 import subprocess
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
 from typing import TYPE_CHECKING
 
 import httpx
@@ -77,23 +82,26 @@ HAS_POWERSHELL = _has_powershell()
 
 DNI_LETTERS = "TRWAGMYFPDXBNJZSQVHLCKE"
 
+# Default RNG of the generators (pools pass their own seeded one)
+_RNG = random.Random()
 
-def generate_invalid_dni() -> str:
+
+def generate_invalid_dni(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish DNI with INVALID control letter.
 
     Real DNI: 8 digits + letter calculated as digits mod 23 → DNI_LETTERS
     We intentionally use a WRONG letter.
     """
-    digits = random.randint(10000000, 99999999)
+    digits = rng.randint(10000000, 99999999)
     valid_letter = DNI_LETTERS[digits % 23]
     # Pick any letter EXCEPT the valid one
     invalid_letters = [ch for ch in DNI_LETTERS if ch != valid_letter]
-    invalid_letter = random.choice(invalid_letters)
+    invalid_letter = rng.choice(invalid_letters)
     return f"{digits}{invalid_letter}"
 
 
-def generate_invalid_nie() -> str:
+def generate_invalid_nie(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish NIE with INVALID control letter.
 
@@ -101,48 +109,48 @@ def generate_invalid_nie() -> str:
     X=0, Y=1, Z=2 for calculation, then same mod-23 algorithm.
     """
     prefix_map = {"X": 0, "Y": 1, "Z": 2}
-    prefix = random.choice(["X", "Y", "Z"])
-    digits = random.randint(1000000, 9999999)
+    prefix = rng.choice(["X", "Y", "Z"])
+    digits = rng.randint(1000000, 9999999)
     full_number = int(f"{prefix_map[prefix]}{digits}")
     valid_letter = DNI_LETTERS[full_number % 23]
     invalid_letters = [ch for ch in DNI_LETTERS if ch != valid_letter]
-    invalid_letter = random.choice(invalid_letters)
+    invalid_letter = rng.choice(invalid_letters)
     return f"{prefix}{digits}{invalid_letter}"
 
 
-def generate_invalid_iban() -> str:
+def generate_invalid_iban(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish IBAN with INVALID check digits.
 
     Real IBAN check: rearrange, convert letters to numbers, mod 97 must equal 1.
     We use check digits "00" which is almost always invalid.
     """
-    bank = f"{random.randint(0, 9999):04d}"
-    branch = f"{random.randint(0, 9999):04d}"
-    dc = f"{random.randint(0, 99):02d}"
-    account = f"{random.randint(0, 9999999999):010d}"
+    bank = f"{rng.randint(0, 9999):04d}"
+    branch = f"{rng.randint(0, 9999):04d}"
+    dc = f"{rng.randint(0, 99):02d}"
+    account = f"{rng.randint(0, 9999999999):010d}"
     # Use invalid IBAN check digits (00 is almost always invalid)
     iban_check = "00"
     return f"ES{iban_check} {bank} {branch} {dc} {account[:4]} {account[4:]}"
 
 
-def generate_invalid_nss() -> str:
+def generate_invalid_nss(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish Social Security Number with INVALID control digits.
 
     Format: XX/NNNNNNNN/CC where CC = mod-97 check
     We intentionally use wrong control digits.
     """
-    province = f"{random.randint(1, 52):02d}"
-    number = f"{random.randint(10000000, 99999999):08d}"
+    province = f"{rng.randint(1, 52):02d}"
+    number = f"{rng.randint(10000000, 99999999):08d}"
     full_num = int(f"{province}{number}")
     valid_control = f"{full_num % 97:02d}"
     # Use invalid control (add random offset and wrap)
-    invalid_control = f"{(int(valid_control) + random.randint(1, 96)) % 97:02d}"
+    invalid_control = f"{(int(valid_control) + rng.randint(1, 96)) % 97:02d}"
     return f"{province}/{number}/{invalid_control}"
 
 
-def generate_invalid_credit_card() -> str:
+def generate_invalid_credit_card(rng: random.Random = _RNG) -> str:
     """
     Generate a credit card number that FAILS the Luhn algorithm.
 
@@ -150,7 +158,7 @@ def generate_invalid_credit_card() -> str:
     We ensure it's NOT divisible by 10.
     """
     # Start with Visa-like prefix
-    digits = [4] + [random.randint(0, 9) for _ in range(14)]
+    digits = [4] + [rng.randint(0, 9) for _ in range(14)]
 
     # Calculate Luhn checksum
     total = 0
@@ -164,26 +172,26 @@ def generate_invalid_credit_card() -> str:
     # Find check digit that would make it valid
     valid_check = (10 - (total % 10)) % 10
     # Use invalid check digit (anything except valid)
-    invalid_check = (valid_check + random.randint(1, 9)) % 10
+    invalid_check = (valid_check + rng.randint(1, 9)) % 10
     digits.append(invalid_check)
 
     num = "".join(map(str, digits))
     return f"{num[:4]} {num[4:8]} {num[8:12]} {num[12:]}"
 
 
-def generate_phone() -> str:
+def generate_phone(rng: random.Random = _RNG) -> str:
     """Generate a plausible Spanish mobile number."""
-    prefix = random.choice(["6", "7"])
-    rest = "".join([str(random.randint(0, 9)) for _ in range(8)])
+    prefix = rng.choice(["6", "7"])
+    rest = "".join([str(rng.randint(0, 9)) for _ in range(8)])
     return f"+34 {prefix}{rest[:2]} {rest[2:5]} {rest[5:]}"
 
 
-def generate_license_plate() -> str:
+def generate_license_plate(rng: random.Random = _RNG) -> str:
     """Generate a Spanish license plate (valid format, random values)."""
-    digits = f"{random.randint(0, 9999):04d}"
+    digits = f"{rng.randint(0, 9999):04d}"
     # Spanish plates use consonants only (no vowels, no Ñ, Q)
     consonants = "BCDFGHJKLMNPRSTVWXYZ"
-    letters = "".join(random.choices(consonants, k=3))
+    letters = "".join(rng.choices(consonants, k=3))
     return f"{digits} {letters}"
 
 
@@ -193,7 +201,7 @@ def generate_license_plate() -> str:
 # =============================================================================
 
 
-def generate_id_support() -> str:
+def generate_id_support(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish ID support number (Número de Soporte).
 
@@ -201,12 +209,12 @@ def generate_id_support() -> str:
     These numbers don't have a public checksum algorithm,
     but we generate random ones that are unlikely to match real ones.
     """
-    letters = "".join(random.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=3))
-    digits = f"{random.randint(0, 999999):06d}"
+    letters = "".join(rng.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=3))
+    digits = f"{rng.randint(0, 999999):06d}"
     return f"{letters}{digits}"
 
 
-def generate_nig() -> str:
+def generate_nig(rng: random.Random = _RNG) -> str:
     """
     Generate a fake NIG (Número de Identificación General).
 
@@ -216,19 +224,19 @@ def generate_nig() -> str:
     they don't match real cases.
     """
     # Fake municipality (99XXX range doesn't exist)
-    municipality = f"99{random.randint(0, 999):03d}"
+    municipality = f"99{rng.randint(0, 999):03d}"
     # Random organ type
-    organ = f"{random.randint(10, 99):02d}"
+    organ = f"{rng.randint(10, 99):02d}"
     # Random jurisdiction (1-4)
-    jurisdiction = str(random.randint(1, 4))
+    jurisdiction = str(rng.randint(1, 4))
     # Future year (2099) to ensure it's fake
     year = "2099"
     # Random correlative
-    correlative = f"{random.randint(0, 9999999):07d}"
+    correlative = f"{rng.randint(0, 9999999):07d}"
     return f"{municipality}/{organ}/{jurisdiction}/{year}/{correlative}"
 
 
-def generate_ecli() -> str:
+def generate_ecli(rng: random.Random = _RNG) -> str:
     """
     Generate a fake ECLI (European Case Law Identifier).
 
@@ -238,27 +246,27 @@ def generate_ecli() -> str:
     """
     # Fictional organs (XX, ZZ don't exist)
     organs = ["XX", "ZZ", "QQ", "YY"]
-    organ = random.choice(organs)
+    organ = rng.choice(organs)
     # Future year
     year = "2099"
     # Random number
-    number = random.randint(10000, 99999)
+    number = rng.randint(10000, 99999)
     return f"ECLI:ES:{organ}:{year}:{number}"
 
 
-def generate_csv() -> str:
+def generate_csv(rng: random.Random = _RNG) -> str:
     """
     Generate a fake CSV (Código Seguro de Verificación).
 
     High-entropy alphanumeric string (16-22 characters).
     Random generation ensures it won't match real CSVs.
     """
-    length = random.randint(16, 22)
+    length = rng.randint(16, 22)
     chars = "ABCDEFGHJKLMNPQRSTUVWXYZ0123456789"
-    return "".join(random.choices(chars, k=length))
+    return "".join(rng.choices(chars, k=length))
 
 
-def generate_health_id() -> str:
+def generate_health_id(rng: random.Random = _RNG) -> str:
     """
     Generate a fake CIP-SNS (Spanish Health ID).
 
@@ -268,13 +276,13 @@ def generate_health_id() -> str:
     """
     # Consonant-only prefix (unlikely real surname pattern)
     consonants = "BCDFGHJKLMNPQRSTVWXZ"
-    prefix = "".join(random.choices(consonants, k=4))
+    prefix = "".join(rng.choices(consonants, k=4))
     # Random digits
-    digits = "".join([str(random.randint(0, 9)) for _ in range(12)])
+    digits = "".join([str(rng.randint(0, 9)) for _ in range(12)])
     return f"{prefix}{digits}"
 
 
-def generate_cadastral_ref() -> str:
+def generate_cadastral_ref(rng: random.Random = _RNG) -> str:
     """
     Generate a fake Cadastral Reference (Referencia Catastral).
 
@@ -283,19 +291,19 @@ def generate_cadastral_ref() -> str:
     We use patterns that don't correspond to real geographic zones.
     """
     # First block: 7 digits (fake zone starting with 9999)
-    block1 = f"9999{random.randint(0, 999):03d}"
+    block1 = f"9999{rng.randint(0, 999):03d}"
     # Second block: 7 digits
-    block2 = f"{random.randint(0, 9999999):07d}"
+    block2 = f"{rng.randint(0, 9999999):07d}"
     # Control letters (2)
-    letters1 = "".join(random.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=2))
+    letters1 = "".join(rng.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=2))
     # Final 4 digits
-    digits = f"{random.randint(0, 9999):04d}"
+    digits = f"{rng.randint(0, 9999):04d}"
     # Final 4 letters
-    letters2 = "".join(random.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=4))
+    letters2 = "".join(rng.choices("ABCDEFGHJKLMNPQRSTUVWXYZ", k=4))
     return f"{block1}{block2}{letters1}{digits}{letters2}"
 
 
-def generate_invalid_employer_id() -> str:
+def generate_invalid_employer_id(rng: random.Random = _RNG) -> str:
     """
     Generate a Spanish CCC (Código Cuenta de Cotización) with INVALID control digits.
 
@@ -305,22 +313,22 @@ def generate_invalid_employer_id() -> str:
     We intentionally use wrong control digits.
     """
     # Random province (01-52)
-    province = f"{random.randint(1, 52):02d}"
+    province = f"{rng.randint(1, 52):02d}"
     # Random regime (usually 11 for general)
-    regime = f"{random.randint(10, 99):02d}"
+    regime = f"{rng.randint(10, 99):02d}"
     # Random employer number
-    number = f"{random.randint(1000000, 9999999):07d}"
+    number = f"{rng.randint(1000000, 9999999):07d}"
     # Calculate what would be valid control
     full_num = int(f"{province}{number}")
     valid_control = full_num % 97
     # Use invalid control (add offset)
-    invalid_control = (valid_control + random.randint(1, 96)) % 97
+    invalid_control = (valid_control + rng.randint(1, 96)) % 97
     return f"{province}/{regime}/{number}/{invalid_control:02d}"
 
 
 # Categories that use CODE generators (guaranteed invalid checksums)
 CODE_GENERATORS = {
-    "DNI_NIE": lambda: random.choice([generate_invalid_dni, generate_invalid_nie])(),
+    "DNI_NIE": lambda rng=_RNG: rng.choice([generate_invalid_dni, generate_invalid_nie])(rng),
     "IBAN": generate_invalid_iban,
     "BANK_ACCOUNT": generate_invalid_iban,
     "SOCIAL_SECURITY": generate_invalid_nss,
@@ -347,6 +355,103 @@ LLM_CATEGORIES = {
 }
 
 
+# =============================================================================
+# SYNTHETIC VALUE POOLS (code-generated categories)
+# =============================================================================
+
+# Values generated per pool refill
+POOL_BLOCK_SIZE = 64
+
+
+def project_seed(project_id: str, category: str) -> int:
+    """RNG seed for a project's category (stable across processes, unlike hash())."""
+    digest = hashlib.sha256(f"{project_id}:{category}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+class SyntheticValuePool:
+    """
+    Unique code-generated values for one project and category.
+
+    The generator is driven by an RNG seeded per project, so a project gets
+    the same sequence on every run. Values are produced in blocks (skipping
+    duplicates and values already issued) and handed out in order, O(1)
+    per value.
+    """
+
+    def __init__(
+        self,
+        generator: Callable[[random.Random], str],
+        seed: int,
+        issued: Iterable[str] = (),
+    ) -> None:
+        """
+        Initialize the pool.
+
+        Args:
+            generator: Value generator taking the RNG to use
+            seed: RNG seed
+            issued: Values already in use (never handed out again)
+        """
+        self._generator = generator
+        self._rng = random.Random(seed)
+        self._issued: set[str] = set(issued)
+        self._ready: deque[str] = deque()
+
+    def take(self) -> str:
+        """
+        Next unused value.
+
+        Raises:
+            RuntimeError: If the generator cannot produce any new value
+        """
+        if not self._ready:
+            self.reserve(POOL_BLOCK_SIZE)
+            if not self._ready:
+                raise RuntimeError("Synthetic value space exhausted")
+        return self._ready.popleft()
+
+    def reserve(self, count: int) -> None:
+        """
+        Try to have at least ``count`` values ready.
+
+        Gives up after a bounded number of draws, so a nearly exhausted value
+        space yields a partial block instead of looping.
+        """
+        missing = count - len(self._ready)
+        attempts = 4 * missing + 100
+        while missing > 0 and attempts > 0:
+            attempts -= 1
+            value = self._generator(self._rng)
+            if value not in self._issued:
+                self._issued.add(value)
+                self._ready.append(value)
+                missing -= 1
+
+
+# Pools per (project_id, category), kept for the process like DateShifter deltas
+_value_pools: dict[tuple[str, str], SyntheticValuePool] = {}
+
+
+def get_value_pool(
+    project_id: str, category: str, issued: Iterable[str] = ()
+) -> SyntheticValuePool:
+    """
+    Get the value pool of a project's code-generated category.
+
+    Args:
+        project_id: Project identifier (seeds the pool)
+        category: A CODE_GENERATORS category
+        issued: Values already used by the project (read only on creation)
+    """
+    key = (project_id, category)
+    if key not in _value_pools:
+        _value_pools[key] = SyntheticValuePool(
+            CODE_GENERATORS[category], project_seed(project_id, category), issued
+        )
+    return _value_pools[key]
+
+
 # =============================================================================
 # GENDER DETECTION FOR NAME CONSISTENCY
 # =============================================================================
@@ -577,21 +682,24 @@ Debe sonar natural y plausible: "María Solana Ruiz", "Carlos Mendive Ortega".
 Solo escribe el nombre, nada más."""
 
 
+def detect_legal_form(name: str) -> str:
+    """Detect the legal form suffix of an organization ("" if none)."""
+    name_lower = name.lower()
+    if "s.l.p" in name_lower or "slp" in name_lower:
+        return "S.L.P."
+    if "s.l.u" in name_lower or "slu" in name_lower:
+        return "S.L.U."
+    if "s.l" in name_lower or " sl" in name_lower:
+        return "S.L."
+    if "s.a" in name_lower or " sa" in name_lower:
+        return "S.A."
+    return ""
+
+
 def get_organization_prompt(original: str) -> str:
     """Generate prompt for organization with sector coherence."""
     sector = detect_organization_sector(original)
-    original_lower = original.lower()
-
-    # Detect legal form suffix
-    legal_form = ""
-    if "s.l.p" in original_lower or "slp" in original_lower:
-        legal_form = "S.L.P."
-    elif "s.l.u" in original_lower or "slu" in original_lower:
-        legal_form = "S.L.U."
-    elif "s.l" in original_lower or " sl" in original_lower:
-        legal_form = "S.L."
-    elif "s.a" in original_lower or " sa" in original_lower:
-        legal_form = "S.A."
+    legal_form = detect_legal_form(original)
 
     # Build examples based on sector
     if "abogado" in sector:
@@ -612,6 +720,71 @@ IMPORTANTE: El nombre debe sonar profesional y coherente con el sector.
 Solo escribe el nombre de la empresa, nada más."""
 
 
+# Categories synthesized several entities per prompt
+BATCH_CATEGORIES = {"PERSON_NAME", "ORGANIZATION"}
+
+GENDER_LABELS = {"female": "femenino", "male": "masculino", "unknown": "cualquiera"}
+
+
+def get_batch_prompt(category: str, originals: list[str]) -> str:
+    """
+    Generate one prompt for several names or organizations.
+
+    Each original is listed with its detected gender (names) or sector and
+    legal form (organizations); the answer must be a JSON array with one
+    value per original, in the same order.
+    """
+    if category == "PERSON_NAME":
+        items = [
+            f"{i}. género {GENDER_LABELS[detect_gender(original)]} (original: {original})"
+            for i, original in enumerate(originals, 1)
+        ]
+        task = f"""Genera {len(originals)} nombres completos españoles INVENTADOS \
+(nombre + dos apellidos), uno por cada persona de la lista, con el género indicado.
+Deben sonar naturales y plausibles: "María Solana Ruiz", "Carlos Mendive Ortega"."""
+    else:
+        items = []
+        for i, original in enumerate(originals, 1):
+            legal_form = detect_legal_form(original)
+            form = f", forma jurídica {legal_form}" if legal_form else ""
+            items.append(
+                f"{i}. sector {detect_organization_sector(original)}{form} (original: {original})"
+            )
+        task = f"""Genera {len(originals)} nombres de empresa españoles INVENTADOS, \
+uno por cada organización de la lista, del sector indicado y con su forma jurídica.
+Deben sonar profesionales: "Roldán Abogados S.L.P.", "Caja del Valle"."""
+
+    listing = "\n".join(items)
+    return f"""{task}
+Cada nombre debe ser DIFERENTE de su original y de los demás.
+
+{listing}
+
+Responde SOLO con un array JSON de {len(originals)} cadenas, en el mismo orden."""
+
+
+def parse_batch_response(response: str, expected: int) -> list[str] | None:
+    """
+    Parse a batch answer into one value per item.
+
+    Returns None if the response is not a JSON array of the expected length;
+    items that are not strings become "".
+    """
+    start, end = response.find("["), response.rfind("]")
+    if start < 0 or end < start:
+        return None
+    try:
+        values = json.loads(response[start : end + 1])
+    except json.JSONDecodeError:
+        return None
+    if not isinstance(values, list) or len(values) != expected:
+        return None
+    return [
+        value.strip().strip("\"'").split("\n")[0] if isinstance(value, str) else ""
+        for value in values
+    ]
+
+
 CATEGORY_PROMPTS = {
     "ADDRESS": """Genera una dirección española plausible pero inventada.
 Usa patrones reales: "Calle del Almendro 15, 3ºB", "Avenida de los Rosales 42".
@@ -629,6 +802,23 @@ Solo escribe el email, nada más.""",
 # SYNTHETIC STRATEGY
 # =============================================================================
 
+# Concurrent Ollama requests per document (also the HTTP connection pool size)
+MAX_CONCURRENT_LLM_CALLS = 4
+
+# Names/organizations per batched prompt (1 = one prompt per entity)
+LLM_BATCH_SIZE = 8
+
+# Tokens allowed per item of a batched answer (a JSON string plus separators)
+BATCH_TOKENS_PER_ITEM = 30
+
+# Individual prompts per entity whose answer is already used in the project
+# (after that, the pseudonym alias is used, which is unique by construction)
+MAX_UNIQUE_ATTEMPTS = 3
+
+# How long an Ollama availability check is trusted. Short, so a restarted
+# Ollama is picked up again, but one check covers a whole batch of entities.
+AVAILABILITY_TTL_SECONDS = 10.0
+
 
 class SyntheticStrategy(AnonymizationStrategy):
     """
@@ -653,6 +843,8 @@ class SyntheticStrategy(AnonymizationStrategy):
         timeout: float = 30.0,
         use_gpu: bool = False,
         adapter: InMemoryAnonymizationAdapter | None = None,
+        max_concurrency: int = MAX_CONCURRENT_LLM_CALLS,
+        batch_size: int = LLM_BATCH_SIZE,
     ):
         """Initialize synthetic strategy."""
         self._ollama_url = ollama_url
@@ -660,47 +852,83 @@ class SyntheticStrategy(AnonymizationStrategy):
         self._timeout = timeout
         self._use_gpu = use_gpu
         self._adapter = adapter
-        # Cache: (category, normalized_original) -> synthetic
+        self._max_concurrency = max(1, max_concurrency)
+        self._batch_size = max(1, batch_size)
+        # Cache: (category, base_alias) -> replacement for this strategy's run
+        # (synthetic values are also kept per project by the adapter, and
+        # persisted with it; Level 2 fallbacks are only cached here)
         self._synthetic_cache: dict[tuple[str, str], str] = {}
         self._http_client: httpx.AsyncClient | None = None
-        # NOTE: Removed _ollama_available cache - was causing silent fallback to Level 2
+        # Availability result and when it expires (monotonic clock)
+        self._ollama_available: bool | None = None
+        self._ollama_checked_until = 0.0
+        self._availability_lock = asyncio.Lock()
 
     async def _get_client(self) -> httpx.AsyncClient:
-        """Get or create HTTP client."""
+        """Get or create the pooled HTTP client."""
         if self._http_client is None:
-            self._http_client = httpx.AsyncClient(timeout=self._timeout)
+            self._http_client = httpx.AsyncClient(
+                timeout=self._timeout,
+                limits=httpx.Limits(
+                    max_connections=self._max_concurrency,
+                    max_keepalive_connections=self._max_concurrency,
+                ),
+            )
         return self._http_client
 
     async def _check_ollama_available(self) -> bool:
         """
         Check if Ollama is available.
 
-        NO CACHE: Always check on each call to handle Ollama restarts.
-        Previous cache caused silent fallback to Level 2 for ALL entities
-        if first check failed, even if Ollama became available later.
+        The result is only trusted for AVAILABILITY_TTL_SECONDS: long enough
+        to cover a batch of entities with one /api/tags request, short enough
+        to pick up an Ollama restart (a permanent cache used to cause silent
+        fallback to Level 2 for ALL entities after one failed check).
         """
-        try:
-            client = await self._get_client()
-            response = await client.get(f"{self._ollama_url}/api/tags", timeout=5.0)
-            available = response.status_code == 200
-            if available:
-                logger.info(f"Ollama available at {self._ollama_url}")
-            else:
-                logger.warning(f"Ollama returned {response.status_code}")
+        async with self._availability_lock:
+            if (
+                self._ollama_available is not None
+                and time.monotonic() < self._ollama_checked_until
+            ):
+                return self._ollama_available
+
+            try:
+                client = await self._get_client()
+                response = await client.get(f"{self._ollama_url}/api/tags", timeout=5.0)
+                available = response.status_code == 200
+                if available:
+                    logger.info(f"Ollama available at {self._ollama_url}")
+                else:
+                    logger.warning(f"Ollama returned {response.status_code}")
+            except Exception as e:
+                logger.warning(f"Ollama not available at {self._ollama_url}: {e}")
+                available = False
+
+            self._ollama_available = available
+            self._ollama_checked_until = time.monotonic() + AVAILABILITY_TTL_SECONDS
             return available
-        except Exception as e:
-            logger.warning(f"Ollama not available at {self._ollama_url}: {e}")
-            return False
 
     async def _generate_with_ollama(self, prompt: str) -> str:
         """Call Ollama API to generate synthetic data."""
+        generated = await self._ollama_generate(prompt)
+
+        # Clean up
+        generated = generated.strip("\"'")
+        generated = generated.split("\n")[0]
+
+        if generated:
+            logger.debug(f"Ollama generated synthetic ({len(generated)} chars)")
+        return generated
+
+    async def _ollama_generate(self, prompt: str, num_predict: int = 50) -> str:
+        """Raw Ollama /api/generate response ("" if unavailable or failed)."""
         if not await self._check_ollama_available():
             return ""
 
         client = await self._get_client()
 
         try:
-            options = {"temperature": 0.7, "num_predict": 50}
+            options = {"temperature": 0.7, "num_predict": num_predict}
             if not self._use_gpu:
                 options["num_gpu"] = 0
 
@@ -715,14 +943,7 @@ class SyntheticStrategy(AnonymizationStrategy):
             )
             response.raise_for_status()
             data = response.json()
-            generated = data.get("response", "").strip()
-
-            # Clean up
-            generated = generated.strip("\"'")
-            generated = generated.split("\n")[0]
-
-            logger.debug(f"Ollama generated synthetic ({len(generated)} chars)")
-            return generated
+            return data.get("response", "").strip()
 
         except Exception as e:
             logger.warning(f"Ollama generation failed: {e}")
@@ -782,15 +1003,22 @@ $response.response
         self,
         category: str,
         original: str,
+        project_id: str | None = None,
     ) -> str:
         """
         Generate synthetic value for a category.
 
+        Code-generated values come from the project's value pool when
+        project_id is given (unique within the project, reproducible).
+
         Returns empty string if generation fails (caller should use pseudonym).
         """
         # Priority 1: Code generators for numbers (INVALID checksums)
         if category in CODE_GENERATORS:
-            synthetic = CODE_GENERATORS[category]()
+            if project_id is not None:
+                synthetic = self._value_pool(project_id, category).take()
+            else:
+                synthetic = CODE_GENERATORS[category]()
             logger.info(f"Code-generated {category}: {synthetic} (invalid checksum)")
             return synthetic
 
@@ -820,7 +1048,7 @@ $response.response
         # Fallback to PowerShell if in WSL and HTTP failed
         if not synthetic and IS_WSL and HAS_POWERSHELL:
             logger.info("Trying PowerShell fallback for Ollama...")
-            synthetic = self._generate_with_powershell(prompt)
+            synthetic = await asyncio.to_thread(self._generate_with_powershell, prompt)
 
         # Validate: don't return if same as original
         if synthetic and synthetic.lower() != original.lower():
@@ -828,6 +1056,171 @@ $response.response
 
         return ""
 
+    async def prepare(
+        self,
+        detections: list[NerDetection],
+        project_id: str,
+    ) -> None:
+        """
+        Synthesize every LLM-backed entity of a document up front.
+
+        Resolves base aliases in replacement order (so numbering is the same
+        as without this step), keeps one original per (category, base_alias)
+        still missing from the cache, and generates them concurrently
+        (at most max_concurrency requests in flight), names and organizations
+        batch_size per prompt. generate_replacement then finds every value
+        in the cache. Values of code-generated categories are reserved from
+        their project pool in one block.
+        """
+        if self._adapter is None:
+            raise RuntimeError("SyntheticStrategy requires adapter reference")
+
+        pending: dict[tuple[str, str], str] = {}
+        codes: dict[str, set[str]] = {}
+        for detection in detections:
+            category = detection.category.value
+            base_alias = await self._adapter.get_or_create_alias(
+                category=category,
+                original_value=detection.value,
+                project_id=project_id,
+                level="ADVANCED",
+            )
+            cache_key = (category, base_alias)
+            if category in LLM_CATEGORIES and self._cached(project_id, cache_key) is None:
+                pending.setdefault(cache_key, detection.value)
+            elif category in CODE_GENERATORS and self._cached(project_id, cache_key) is None:
+                codes.setdefault(category, set()).add(base_alias)
+
+        # Generate the document's code values in one go per category
+        for category, aliases in codes.items():
+            self._value_pool(project_id, category).reserve(len(aliases))
+
+        if not pending:
+            return
+
+        logger.info(f"Synthesizing {len(pending)} unique entities via LLM")
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        # Names and organizations go in batched prompts, the rest one by one
+        groups: list[tuple[str, list[tuple[str, str]]]] = []
+        batches: dict[str, list[tuple[str, str]]] = {}
+        for (category, base_alias), original in pending.items():
+            if self._batch_size > 1 and category in BATCH_CATEGORIES:
+                batches.setdefault(category, []).append((base_alias, original))
+            else:
+                groups.append((category, [(base_alias, original)]))
+        for category, items in batches.items():
+            for i in range(0, len(items), self._batch_size):
+                groups.append((category, items[i : i + self._batch_size]))
+
+        # Values already used in the project, per category (shared by all groups)
+        taken = {category: self._taken_values(project_id, category) for category, _ in groups}
+        results = await asyncio.gather(
+            *(
+                self._synthesize_group(category, items, semaphore, taken[category])
+                for category, items in groups
+            )
+        )
+        for (category, items), values in zip(groups, results):
+            for (base_alias, _), synthetic in zip(items, values):
+                self._remember(project_id, (category, base_alias), synthetic, base_alias)
+
+    def _value_pool(self, project_id: str, category: str) -> SyntheticValuePool:
+        """Value pool of a code-generated category (skips values the project already uses)."""
+        issued: list[str] = []
+        if self._adapter is not None and (project_id, category) not in _value_pools:
+            stored = self._adapter.synthetic_values(project_id)
+            issued = [value for (cat, _), value in stored.items() if cat == category]
+        return get_value_pool(project_id, category, issued)
+
+    def _taken_values(self, project_id: str, category: str) -> set[str]:
+        """Synthetic values (lowercased) already given to entities of a project category."""
+        values = [v for (cat, _), v in self._synthetic_cache.items() if cat == category]
+        if self._adapter is not None:
+            stored = self._adapter.synthetic_values(project_id)
+            values.extend(v for (cat, _), v in stored.items() if cat == category)
+        return {value.lower() for value in values}
+
+    async def _unique_synthetic(self, category: str, original: str, taken: set[str]) -> str:
+        """
+        Individual synthesis whose answer is not in ``taken`` (then added to it).
+
+        Returns empty string if no new value was obtained (caller uses pseudonym).
+        """
+        for _ in range(MAX_UNIQUE_ATTEMPTS):
+            synthetic = await self._get_synthetic_for_category(category, original)
+            if not synthetic:
+                return ""
+            if synthetic.lower() not in taken:
+                taken.add(synthetic.lower())
+                return synthetic
+        logger.warning(f"No unused synthetic {category} after {MAX_UNIQUE_ATTEMPTS} attempts")
+        return ""
+
+    def _cached(self, project_id: str, cache_key: tuple[str, str]) -> str | None:
+        """Cached replacement for (category, base_alias), or None."""
+        if cache_key in self._synthetic_cache:
+            return self._synthetic_cache[cache_key]
+        if self._adapter is None:
+            return None
+        stored = self._adapter.synthetic_values(project_id).get(cache_key)
+        if stored is not None:
+            self._synthetic_cache[cache_key] = stored
+        return stored
+
+    def _remember(
+        self, project_id: str, cache_key: tuple[str, str], synthetic: str, base_alias: str
+    ) -> None:
+        """Cache a replacement; real synthetic values are kept for the project too."""
+        self._synthetic_cache[cache_key] = synthetic or base_alias
+        if synthetic and self._adapter is not None:
+            self._adapter.synthetic_values(project_id)[cache_key] = synthetic
+
+    async def _synthesize_group(
+        self,
+        category: str,
+        items: list[tuple[str, str]],
+        semaphore: asyncio.Semaphore,
+        taken: set[str],
+    ) -> list[str]:
+        """
+        Synthesize (base_alias, original) items of one category.
+
+        Several items are asked for in one batched prompt; items whose answer
+        is missing, equal to the original or already used (in the project,
+        another batch or this one, see ``taken``) are retried with their
+        individual prompt (as is the whole group if the batched answer cannot
+        be parsed). Accepted values are added to ``taken``.
+        """
+        values: list[str] | None = None
+        if len(items) > 1:
+            prompt = get_batch_prompt(category, [original for _, original in items])
+            async with semaphore:
+                response = await self._ollama_generate(
+                    prompt, num_predict=BATCH_TOKENS_PER_ITEM * len(items)
+                )
+            values = parse_batch_response(response, len(items)) if response else None
+            if values is None:
+                logger.warning(f"Batched {category} synthesis failed, using one prompt per item")
+
+        values = values or [""] * len(items)
+        retry: list[int] = []
+        for i, ((_, original), value) in enumerate(zip(items, values)):
+            key = value.lower()
+            if not value or key == original.lower() or key in taken:
+                retry.append(i)
+            else:
+                taken.add(key)
+
+        async def synthesize(original: str) -> str:
+            async with semaphore:
+                return await self._unique_synthetic(category, original, taken)
+
+        retried = await asyncio.gather(*(synthesize(items[i][1]) for i in retry))
+        for i, synthetic in zip(retry, retried):
+            values[i] = synthetic
+        return values
+
     async def generate_replacement(
         self,
         detection: NerDetection,
@@ -878,8 +1271,8 @@ $response.response
         cache_key = (category, base_alias)
 
         # Check cache first (AFTER getting base_alias)
-        if cache_key in self._synthetic_cache:
-            synthetic = self._synthetic_cache[cache_key]
+        synthetic = self._cached(project_id, cache_key)
+        if synthetic is not None:
             logger.debug(f"Cache hit for {base_alias}: {synthetic}")
             return ReplacementResult(
                 original=original,
@@ -895,7 +1288,11 @@ $response.response
         # ================================================================
         # STEP 2: Try to transform into synthetic value
         # ================================================================
-        synthetic = await self._get_synthetic_for_category(category, original)
+        if category in LLM_CATEGORIES:
+            taken = self._taken_values(project_id, category)
+            synthetic = await self._unique_synthetic(category, original, taken)
+        else:
+            synthetic = await self._get_synthetic_for_category(category, original, project_id)
 
         # ================================================================
         # STEP 3: Use synthetic if available, else fall back to Level 2
@@ -908,7 +1305,7 @@ $response.response
             logger.debug(f"Level 3 fallback to Level 2: [REDACTED] → {base_alias}")
 
         # Cache for consistency (keyed by base_alias)
-        self._synthetic_cache[cache_key] = final_replacement
+        self._remember(project_id, cache_key, synthetic, base_alias)
 
         return ReplacementResult(
             original=original,
@@ -10,9 +10,9 @@ Standalone tests: ml/scripts/preprocess/text_normalizer.py
 
 import re
 import unicodedata
+from array import array
 
 from contextsafe.application.ports.text_preprocessor import OffsetMapping
-from contextsafe.infrastructure.text_processing.offset_tracker import OffsetTracker
 
 
 # Zero-width and invisible characters to remove
@@ -48,6 +48,39 @@ HOMOGLYPHS = {
 SOFT_HYPHEN = "­"
 
 
+def _build_special_pattern() -> re.Pattern:
+    """
+    Match runs that need per-character normalization.
+
+    A character is "plain" if it is not a space and normalization leaves it
+    unchanged (NFKC-stable, not a homoglyph, zero-width or soft hyphen).
+    Only BMP characters are checked; anything else is treated as special.
+    Special runs absorb adjacent spaces, and runs of 2+ spaces are special
+    too, so space collapsing sees the same neighbours as a per-character
+    pass over the whole text.
+    """
+    excluded = set(ZERO_WIDTH_CHARS) | set(HOMOGLYPHS) | {SOFT_HYPHEN, " "}
+    ranges: list[tuple[int, int]] = []
+    for code in range(0x10000):
+        ch = chr(code)
+        if ch in excluded or not unicodedata.is_normalized("NFKC", ch):
+            continue
+        if ranges and ranges[-1][1] == code - 1:
+            ranges[-1] = (ranges[-1][0], code)
+        else:
+            ranges.append((code, code))
+
+    plain = "".join(
+        re.escape(chr(lo)) if lo == hi else f"{re.escape(chr(lo))}-{re.escape(chr(hi))}"
+        for lo, hi in ranges
+    )
+    return re.compile(f" *(?:[^ {plain}] *)+| {{2,}}")
+
+
+# Runs needing per-character normalization (see _build_special_pattern)
+SPECIAL_RUN_PATTERN = _build_special_pattern()
+
+
 class TextNormalizer:
     """
     Text normalizer for NER preprocessing in Spanish legal documents.
@@ -82,12 +115,44 @@ class TextNormalizer:
         if not text:
             return OffsetMapping.identity(text)
 
-        tracker = OffsetTracker(text)
+        if SPECIAL_RUN_PATTERN.search(text) is None:
+            return OffsetMapping(
+                source_text=text, normalized_text=text, char_map=array("I", range(len(text)))
+            )
+
+        pieces: list[str] = []
+        char_map = array("I")
+        position = 0
+
+        # Plain stretches are copied wholesale; only special runs go char by char
+        for match in SPECIAL_RUN_PATTERN.finditer(text):
+            start, end = match.span()
+            if start > position:
+                pieces.append(text[position:start])
+                char_map.extend(range(position, start))
+            self._normalize_run(text, start, end, pieces, char_map)
+            position = end
+
+        if position < len(text):
+            pieces.append(text[position:])
+            char_map.extend(range(position, len(text)))
+
+        return OffsetMapping(
+            source_text=text,
+            normalized_text="".join(pieces),
+            char_map=char_map,
+        )
+
+    @staticmethod
+    def _normalize_run(
+        text: str, start: int, end: int, pieces: list[str], char_map: array
+    ) -> None:
+        """Normalize text[start:end] character by character."""
         prev_was_space = False
 
-        for i, ch in enumerate(text):
+        for i in range(start, end):
+            ch = text[i]
             if ZERO_WIDTH_PATTERN.match(ch):
-                tracker.skip_char(i)
                 continue
 
             nfkc = unicodedata.normalize("NFKC", ch)
@@ -95,21 +160,18 @@ class TextNormalizer:
             nfkc = nfkc.replace(SOFT_HYPHEN, "")
 
             if not nfkc:
-                tracker.skip_char(i)
                 prev_was_space = False
                 continue
 
             if nfkc == " ":
                 if prev_was_space:
-                    tracker.skip_char(i)
                     continue
                 prev_was_space = True
             else:
                 prev_was_space = False
 
-            tracker.replace_char(i, nfkc)
-
-        return tracker.build()
+            pieces.append(nfkc)
+            char_map.extend([i] * len(nfkc))
 
 
 # Module-level instance for convenience
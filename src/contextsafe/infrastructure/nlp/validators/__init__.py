@@ -9,7 +9,8 @@ Based on:
 - CEPTNER (Knowledge-Based Systems, 2024)
 """
 
+from .embedding_cache import EmbeddingCache
 from .entity_type_validator import EntityTypeValidator, ValidationResult
 
 
-__all__ = ["EntityTypeValidator", "ValidationResult"]
+__all__ = ["EmbeddingCache", "EntityTypeValidator", "ValidationResult"]
@@ -0,0 +1,184 @@
+"""
+Embedding cache for entity type validation.
+
+Legal documents repeat the same parties, courts and addresses many times,
+so the same "query: ..." inputs are embedded over and over. This cache
+keeps embeddings in a bounded in-memory LRU, optionally backed by a
+SQLite file so they survive restarts.
+
+Keys are a SHA-256 of the model name plus the exact model input, so
+embeddings from different models never mix.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCache:
+    """
+    Bounded LRU of float32 embeddings with an optional SQLite store.
+
+    Thread-safe: validation runs in executor threads.
+
+    Args:
+        max_entries: Maximum embeddings kept in memory.
+        db_path: Optional SQLite file for persistent storage (None = memory only).
+    """
+
+    def __init__(self, max_entries: int = 20_000, db_path: Path | None = None) -> None:
+        self.max_entries = max(1, max_entries)
+        self.db_path = Path(db_path) if db_path else None
+
+        self._memory: OrderedDict[str, NDArray[np.float32]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+
+        if self.db_path is not None:
+            self._open_store()
+
+    @staticmethod
+    def make_key(model_name: str, model_input: str) -> str:
+        """Cache key for an embedding of ``model_input`` produced by ``model_name``."""
+        digest = hashlib.sha256(f"{model_name}\0{model_input}".encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def get_many(self, keys: list[str]) -> dict[str, NDArray[np.float32]]:
+        """
+        Look up several embeddings (memory first, then disk).
+
+        Args:
+            keys: Cache keys (see make_key)
+
+        Returns:
+            Mapping of found keys to embeddings; missing keys are absent
+        """
+        found: dict[str, NDArray[np.float32]] = {}
+        with self._lock:
+            missing: list[str] = []
+            for key in keys:
+                embedding = self._memory.get(key)
+                if embedding is None:
+                    missing.append(key)
+                else:
+                    self._memory.move_to_end(key)
+                    found[key] = embedding
+
+            if missing and self._conn is not None:
+                for key, embedding in self._load(missing).items():
+                    found[key] = embedding
+                    self._remember(key, embedding)
+                    self.disk_hits += 1
+
+            self.hits += sum(1 for key in keys if key in found)
+            self.misses += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, items: dict[str, NDArray[np.float32]]) -> None:
+        """
+        Store embeddings in memory and, if configured, on disk.
+
+        Args:
+            items: Mapping of cache keys to embeddings
+        """
+        if not items:
+            return
+        with self._lock:
+            for key, embedding in items.items():
+                self._remember(key, np.asarray(embedding, dtype=np.float32))
+
+            if self._conn is not None:
+                try:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO embeddings (key, vector) VALUES (?, ?)",
+                        [
+                            (key, np.asarray(vec, dtype=np.float32).tobytes())
+                            for key, vec in items.items()
+                        ],
+                    )
+                    self._conn.commit()
+                except sqlite3.Error as e:
+                    logger.warning(f"Embedding cache write failed: {e}")
+
+    def stats(self) -> dict[str, int | float | str | None]:
+        """Get hit/miss counters."""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "disk_hits": self.disk_hits,
+            "hit_rate": (self.hits / lookups) if lookups else 0.0,
+            "memory_entries": len(self._memory),
+            "max_entries": self.max_entries,
+            "db_path": str(self.db_path) if self.db_path else None,
+        }
+
+    def clear(self) -> None:
+        """Drop in-memory entries and reset counters (disk store is kept)."""
+        with self._lock:
+            self._memory.clear()
+            self.hits = self.misses = self.disk_hits = 0
+
+    def close(self) -> None:
+        """Close the SQLite store."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, embedding: NDArray[np.float32]) -> None:
+        """Insert into the LRU, evicting the least recently used entries."""
+        self._memory[key] = embedding
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+    def _open_store(self) -> None:
+        """Open (and create) the SQLite store; fall back to memory-only on error."""
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key TEXT PRIMARY KEY, vector BLOB NOT NULL)"
+            )
+            self._conn.commit()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f"Embedding cache store unavailable ({self.db_path}): {e}")
+            self._conn = None
+
+    def _load(self, keys: list[str]) -> dict[str, NDArray[np.float32]]:
+        """Read embeddings for ``keys`` from the SQLite store."""
+        loaded: dict[str, NDArray[np.float32]] = {}
+        # Stay below SQLite's default host-parameter limit
+        for i in range(0, len(keys), 500):
+            batch = keys[i : i + 500]
+            placeholders = ",".join("?" * len(batch))
+            try:
+                rows = self._conn.execute(
+                    f"SELECT key, vector FROM embeddings WHERE key IN ({placeholders})",
+                    batch,
+                ).fetchall()
+            except sqlite3.Error as e:
+                logger.warning(f"Embedding cache read failed: {e}")
+                return loaded
+            for key, blob in rows:
+                loaded[key] = np.frombuffer(blob, dtype=np.float32).copy()
+        return loaded
@@ -20,6 +20,7 @@ from __future__ import annotations
 
 import json
 import logging
+import threading
 import time
 from dataclasses import dataclass
 from enum import Enum
@@ -28,6 +29,8 @@ from typing import TYPE_CHECKING
 
 import numpy as np
 
+from .embedding_cache import EmbeddingCache
+
 
 if TYPE_CHECKING:
     from numpy.typing import NDArray
@@ -35,6 +38,15 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+# Pre-computed type centroids (ml/scripts/build_type_centroids.py)
+DEFAULT_CENTROIDS_PATH = (
+    Path(__file__).parent.parent.parent.parent.parent.parent
+    / "ml"
+    / "models"
+    / "type_centroids.json"
+)
+
+
 class ValidationAction(str, Enum):
     """Action taken by the validator."""
 
@@ -172,6 +184,8 @@ class EntityTypeValidator:
         margin_threshold: Minimum margin over original type to reclassify.
         hitl_margin: When margin is below this, flag for human review.
         context_window: Number of characters around entity to include.
+        encode_batch_size: Texts per forward pass in batched validation.
+        embedding_cache: Cache for computed embeddings (default: in-memory LRU).
     """
 
     def __init__(
@@ -182,33 +196,40 @@ class EntityTypeValidator:
         margin_threshold: float = 0.10,
         hitl_margin: float = 0.05,
         context_window: int = 50,
+        encode_batch_size: int = 64,
+        embedding_cache: EmbeddingCache | None = None,
     ) -> None:
         self.model_name = model_name
         self.reclassify_threshold = reclassify_threshold
         self.margin_threshold = margin_threshold
         self.hitl_margin = hitl_margin
         self.context_window = context_window
+        self.encode_batch_size = encode_batch_size
+        self.embedding_cache = embedding_cache if embedding_cache is not None else EmbeddingCache()
 
         self._model = None
         self._centroids: dict[str, NDArray[np.float32]] = {}
+        # Stacked centroids (one row per label) for matrix similarity
+        self._centroid_labels: list[str] = []
+        self._centroid_matrix: NDArray[np.float32] | None = None
         self._initialized = False
+        # Documents are merged on executor threads: load the model only once
+        self._init_lock = threading.Lock()
 
-        # Default centroids path
-        if centroids_path is None:
-            self._centroids_path = (
-                Path(__file__).parent.parent.parent.parent.parent.parent
-                / "ml"
-                / "models"
-                / "type_centroids.json"
-            )
-        else:
-            self._centroids_path = centroids_path
+        self._centroids_path = centroids_path or DEFAULT_CENTROIDS_PATH
 
     def _ensure_initialized(self) -> bool:
-        """Lazy initialization of model and centroids."""
+        """Lazy initialization of model and centroids (thread-safe)."""
         if self._initialized:
             return True
 
+        with self._init_lock:
+            if self._initialized:
+                return True
+            return self._initialize()
+
+    def _initialize(self) -> bool:
+        """Load the embedding model and centroids (caller holds the init lock)."""
         try:
             from sentence_transformers import SentenceTransformer
 
@@ -247,18 +268,48 @@ class EntityTypeValidator:
         for category, centroid_list in data.items():
             self._centroids[category] = np.array(centroid_list, dtype=np.float32)
 
+        self._centroid_labels = list(self._centroids)
+        self._centroid_matrix = np.stack([self._centroids[c] for c in self._centroid_labels])
+
         logger.info(f"Loaded centroids for {len(self._centroids)} categories")
 
     def _embed(self, text: str) -> NDArray[np.float32]:
         """Generate embedding for text with E5 query prefix."""
+        return self._embed_batch([text])[0]
+
+    def _embed_batch(self, texts: list[str]) -> NDArray[np.float32]:
+        """
+        Generate embeddings for several texts in one batched encode call.
+
+        Cached embeddings are reused; only cache misses reach the model.
+        """
         # E5 models require "query:" prefix for semantic search
-        input_text = f"query: {text}"
-        embedding = self._model.encode(
-            [input_text],
-            normalize_embeddings=True,
-            show_progress_bar=False,
-        )[0]
-        return embedding.astype(np.float32)
+        inputs = [f"query: {text}" for text in texts]
+        keys = [EmbeddingCache.make_key(self.model_name, model_input) for model_input in inputs]
+        cached = self.embedding_cache.get_many(keys)
+
+        missing = [i for i, key in enumerate(keys) if key not in cached]
+        # Same input may appear twice in one call; encode it once
+        to_encode: dict[str, str] = {}
+        for i in missing:
+            to_encode.setdefault(keys[i], inputs[i])
+
+        if to_encode:
+            embeddings = self._model.encode(
+                list(to_encode.values()),
+                batch_size=self.encode_batch_size,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            computed = dict(zip(to_encode, np.asarray(embeddings, dtype=np.float32)))
+            self.embedding_cache.put_many(computed)
+            cached.update(computed)
+
+        return np.stack([cached[key] for key in keys]).astype(np.float32, copy=False)
+
+    def cache_stats(self) -> dict[str, int | float | str | None]:
+        """Get embedding cache hit/miss counters."""
+        return self.embedding_cache.stats()
 
     def _extract_context(
         self,
@@ -276,12 +327,19 @@ class EntityTypeValidator:
         embedding: NDArray[np.float32],
     ) -> dict[str, float]:
         """Compute cosine similarity to all centroids."""
-        similarities = {}
-        for category, centroid in self._centroids.items():
-            # Embeddings are normalized, so dot product = cosine similarity
-            similarity = float(np.dot(embedding, centroid))
-            similarities[category] = similarity
-        return similarities
+        return self._compute_similarity_rows(embedding[np.newaxis, :])[0]
+
+    def _compute_similarity_rows(
+        self,
+        embeddings: NDArray[np.float32],
+    ) -> list[dict[str, float]]:
+        """Compute cosine similarities of many embeddings with one matrix product."""
+        if self._centroid_matrix is None:
+            return [{} for _ in range(len(embeddings))]
+        # Embeddings are normalized, so dot product = cosine similarity
+        scores = embeddings @ self._centroid_matrix.T
+        labels = self._centroid_labels
+        return [dict(zip(labels, row.tolist(), strict=True)) for row in scores]
 
     def validate(
         self,
@@ -304,6 +362,28 @@ class EntityTypeValidator:
         Returns:
             ValidationResult with action and corrected type if applicable.
         """
+        precheck = self._precheck(entity_text, entity_type)
+        if precheck is not None:
+            return precheck
+
+        # Step 6: Embed ONLY the entity text (not context)
+        # Entity-only embeddings maximize inter-category separation.
+        # Full-sentence embeddings produce >0.93 similarity because
+        # legal context dominates the embedding space.
+        embedding = self._embed(entity_text)
+
+        # Step 7: Compute similarities
+        similarities = self._compute_similarities(embedding)
+
+        return self._decide(entity_text, entity_type, similarities)
+
+    def _precheck(self, entity_text: str, entity_type: str) -> ValidationResult | None:
+        """
+        Resolve detections that need no embedding (steps 1-5).
+
+        Returns:
+            ValidationResult, or None if the entity must be embedded.
+        """
         # Step 1: Check stopwords (fast, no model needed)
         if entity_text.lower().strip() in SPANISH_STOPWORDS:
             return ValidationResult(
@@ -359,15 +439,15 @@ class EntityTypeValidator:
                 reason="No centroids loaded",
             )
 
-        # Step 6: Embed ONLY the entity text (not context)
-        # Entity-only embeddings maximize inter-category separation.
-        # Full-sentence embeddings produce >0.93 similarity because
-        # legal context dominates the embedding space.
-        embedding = self._embed(entity_text)
-
-        # Step 7: Compute similarities
-        similarities = self._compute_similarities(embedding)
+        return None
 
+    def _decide(
+        self,
+        entity_text: str,
+        entity_type: str,
+        similarities: dict[str, float],
+    ) -> ValidationResult:
+        """Turn centroid similarities into a validation decision (steps 8-9)."""
         if not similarities:
             return ValidationResult(
                 original_type=entity_type,
@@ -500,6 +580,11 @@ class EntityTypeValidator:
         """
         Validate multiple detections efficiently.
 
+        Detections that need an embedding are deduplicated by text and
+        encoded in a single batched call; similarities to all centroids are
+        computed with one matrix product. Results are identical to calling
+        validate() for each detection.
+
         Args:
             detections: List of (entity_text, entity_type, start, end) tuples.
             full_text: The full document text.
@@ -507,8 +592,21 @@ class EntityTypeValidator:
         Returns:
             List of ValidationResult for each detection.
         """
-        results = []
-        for entity_text, entity_type, start, end in detections:
-            result = self.validate(entity_text, entity_type, full_text, start, end)
-            results.append(result)
+        results: list[ValidationResult | None] = [
+            self._precheck(entity_text, entity_type) for entity_text, entity_type, _, _ in detections
+        ]
+
+        pending = [i for i, result in enumerate(results) if result is None]
+        if pending:
+            unique_texts = list(dict.fromkeys(detections[i][0] for i in pending))
+            embeddings = self._embed_batch(unique_texts)
+            similarity_rows = self._compute_similarity_rows(embeddings)
+            similarities_by_text = dict(zip(unique_texts, similarity_rows, strict=True))
+
+            for i in pending:
+                entity_text, entity_type, _, _ = detections[i]
+                results[i] = self._decide(
+                    entity_text, entity_type, similarities_by_text[entity_text]
+                )
+
         return results
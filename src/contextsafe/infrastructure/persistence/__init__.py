@@ -9,7 +9,9 @@ from contextsafe.infrastructure.persistence.sqlite import (
     SQLiteDocumentRepository,
     SQLiteGlossaryRepository,
     SQLiteProjectRepository,
+    SQLiteSyntheticStore,
     SQLiteUnitOfWork,
+    SyntheticProjectState,
 )
 
 
@@ -18,5 +20,7 @@ __all__ = [
     "SQLiteDocumentRepository",
     "SQLiteGlossaryRepository",
     "SQLiteProjectRepository",
+    "SQLiteSyntheticStore",
     "SQLiteUnitOfWork",
+    "SyntheticProjectState",
 ]
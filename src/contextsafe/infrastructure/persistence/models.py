@@ -9,6 +9,7 @@ from contextsafe.infrastructure.persistence.sqlite.models import (
     DocumentModel,
     GlossaryModel,
     ProjectModel,
+    SyntheticStateModel,
 )
 
 
@@ -17,4 +18,5 @@ __all__ = [
     "DocumentModel",
     "GlossaryModel",
     "ProjectModel",
+    "SyntheticStateModel",
 ]
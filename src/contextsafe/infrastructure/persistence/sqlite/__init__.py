@@ -9,6 +9,10 @@ from contextsafe.infrastructure.persistence.sqlite.repositories import (
     SQLiteGlossaryRepository,
     SQLiteProjectRepository,
 )
+from contextsafe.infrastructure.persistence.sqlite.synthetic_store import (
+    SQLiteSyntheticStore,
+    SyntheticProjectState,
+)
 from contextsafe.infrastructure.persistence.sqlite.unit_of_work import (
     SQLiteUnitOfWork,
 )
@@ -18,5 +22,7 @@ __all__ = [
     "SQLiteDocumentRepository",
     "SQLiteGlossaryRepository",
     "SQLiteProjectRepository",
+    "SQLiteSyntheticStore",
     "SQLiteUnitOfWork",
+    "SyntheticProjectState",
 ]
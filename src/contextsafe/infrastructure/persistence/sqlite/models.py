@@ -267,3 +267,26 @@ class GlossaryModel(Base):
             "updated_at": self.updated_at.isoformat(),
             "version": self.version,
         }
+
+
+class SyntheticStateModel(Base):
+    """
+    SQLAlchemy model for the anonymization alias state of a project.
+
+    Maps the anonymization adapter's project glossary (original -> alias),
+    alias counters and synthetic values (category, alias -> synthetic) to
+    the 'synthetic_state' table, so ADVANCED-level values survive restarts.
+    One row per project.
+    """
+
+    __tablename__ = "synthetic_state"
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True)
+    project_id: Mapped[str] = mapped_column(String(36), nullable=False, unique=True, index=True)
+    glossary_json: Mapped[Optional[str]] = mapped_column(JSON, nullable=True, default=None)
+    counters_json: Mapped[Optional[str]] = mapped_column(JSON, nullable=True, default=None)
+    synthetic_json: Mapped[Optional[str]] = mapped_column(JSON, nullable=True, default=None)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime, nullable=False, default=datetime.utcnow, onupdate=datetime.utcnow
+    )
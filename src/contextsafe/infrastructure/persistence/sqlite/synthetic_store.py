@@ -0,0 +1,116 @@
+"""
+SQLite store for anonymization alias state.
+
+Keeps, per project, what the anonymization adapter needs to produce the
+same replacements after a restart: the project glossary (original -> alias),
+the alias counters and the ADVANCED-level synthetic values keyed by
+(category, alias). Without it, every restart regenerates all synthetic
+values through the LLM (and may get different ones).
+
+The adapter loads a project lazily, on its first anonymization, and writes
+the state back once per document (a single upsert), not once per entity.
+The state holds the original PII values: it is deleted with the project.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import TYPE_CHECKING, Optional
+from uuid import uuid4
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert
+
+from contextsafe.infrastructure.persistence.models import SyntheticStateModel
+
+
+if TYPE_CHECKING:
+    from contextsafe.infrastructure.persistence.database import Database
+
+
+@dataclass
+class SyntheticProjectState:
+    """
+    Alias state of one project.
+
+    Attributes:
+        glossary: {category: {original: alias}}, in insertion order
+        counters: {category: next alias number}
+        synthetic: {(category, alias): synthetic value}
+    """
+
+    glossary: dict[str, dict[str, str]] = field(default_factory=dict)
+    counters: dict[str, int] = field(default_factory=dict)
+    synthetic: dict[tuple[str, str], str] = field(default_factory=dict)
+
+
+class SQLiteSyntheticStore:
+    """Loads and saves SyntheticProjectState rows ('synthetic_state' table)."""
+
+    def __init__(self, database: Database) -> None:
+        """
+        Initialize the store.
+
+        Args:
+            database: Database whose tables include synthetic_state
+        """
+        self._database = database
+
+    async def load(self, project_id: str) -> Optional[SyntheticProjectState]:
+        """
+        Load the stored state of a project.
+
+        Args:
+            project_id: Project identifier
+
+        Returns:
+            The stored state, or None if the project has none
+        """
+        async with self._database.session() as session:
+            stmt = select(SyntheticStateModel).where(SyntheticStateModel.project_id == project_id)
+            result = await session.execute(stmt)
+            model = result.scalar_one_or_none()
+
+        if model is None:
+            return None
+        return SyntheticProjectState(
+            glossary=model.glossary_json or {},
+            counters=model.counters_json or {},
+            synthetic={
+                (category, alias): value for category, alias, value in model.synthetic_json or []
+            },
+        )
+
+    async def save(self, project_id: str, state: SyntheticProjectState) -> None:
+        """
+        Insert or replace the stored state of a project.
+
+        Args:
+            project_id: Project identifier
+            state: Full state to store
+        """
+        values = {
+            "glossary_json": state.glossary,
+            "counters_json": state.counters,
+            "synthetic_json": [
+                [category, alias, value] for (category, alias), value in state.synthetic.items()
+            ],
+            "updated_at": datetime.utcnow(),
+        }
+        stmt = insert(SyntheticStateModel).values(id=str(uuid4()), project_id=project_id, **values)
+        stmt = stmt.on_conflict_do_update(index_elements=["project_id"], set_=values)
+
+        async with self._database.session() as session:
+            await session.execute(stmt)
+
+    async def delete(self, project_id: str) -> None:
+        """
+        Delete the stored state of a project (no-op if it has none).
+
+        Args:
+            project_id: Project identifier
+        """
+        stmt = delete(SyntheticStateModel).where(SyntheticStateModel.project_id == project_id)
+        async with self._database.session() as session:
+            await session.execute(stmt)
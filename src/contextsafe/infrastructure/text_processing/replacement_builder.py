@@ -0,0 +1,127 @@
+"""
+ReplacementBuilder for applying many span replacements in one pass.
+
+Collects (start, end, replacement) edits against the original text and
+materializes the result with a single join, instead of rebuilding the
+whole string once per replacement. The original <-> anonymized offset
+map falls out of the same pass.
+
+Traceability:
+- Port: AnonymizationService (AnonymizationResult.offset_map)
+"""
+from __future__ import annotations
+
+from array import array
+
+from contextsafe.application.ports.anonymization_service import ReplacementOffsetMap
+
+
+class ReplacementBuilder:
+    """
+    Builder for replacing spans of a source text.
+
+    Edits are always expressed in source coordinates. A space is inserted
+    after a replacement that would otherwise run into an alphanumeric
+    character (same rule as the former sequential replacement loop).
+    Overlapping edits are resolved in favour of the earliest start (the
+    longest on ties); the others are dropped.
+
+    Usage:
+        builder = ReplacementBuilder(text)
+        builder.replace(0, 4, "Persona_A")
+        builder.replace(10, 19, "DNI_001")
+        anonymized, offset_map = builder.build()
+    """
+
+    def __init__(self, source_text: str):
+        """
+        Initialize builder with source text.
+
+        Args:
+            source_text: The original text
+        """
+        self._source = source_text
+        self._edits: list[tuple[int, int, str]] = []
+
+    def __len__(self) -> int:
+        return len(self._edits)
+
+    def replace(self, start: int, end: int, replacement: str) -> None:
+        """
+        Replace source characters [start:end] with replacement.
+
+        Args:
+            start: Start position in source (inclusive)
+            end: End position in source (exclusive)
+            replacement: String to insert instead
+        """
+        self._edits.append((start, end, replacement))
+
+    def build(self) -> tuple[str, ReplacementOffsetMap]:
+        """
+        Apply all edits.
+
+        Returns:
+            Tuple of (new text, offset map from source to new text)
+        """
+        source = self._source
+        edits = self._select_edits()
+
+        # Right to left: whether each replacement needs a separating space
+        # depends on the first character of whatever follows it
+        suffixes: list[str] = [""] * len(edits)
+        cursor = len(source)
+        head = ""
+        for k in range(len(edits) - 1, -1, -1):
+            start, end, replacement = edits[k]
+            if end < cursor:
+                head = source[end]
+            suffixes[k] = " " if head.isalnum() else ""
+            piece = replacement + suffixes[k]
+            if piece:
+                head = piece[0]
+            cursor = start
+
+        pieces: list[str] = []
+        original_starts = array("I")
+        original_ends = array("I")
+        anonymized_starts = array("I")
+        anonymized_ends = array("I")
+        position = 0
+        length = 0
+        for (start, end, replacement), suffix in zip(edits, suffixes):
+            pieces.append(source[position:start])
+            length += start - position
+
+            original_starts.append(start)
+            original_ends.append(end)
+            anonymized_starts.append(length)
+            anonymized_ends.append(length + len(replacement))
+
+            pieces.append(replacement)
+            pieces.append(suffix)
+            length += len(replacement) + len(suffix)
+            position = end
+
+        pieces.append(source[position:])
+        length += len(source) - position
+
+        offset_map = ReplacementOffsetMap(
+            original_length=len(source),
+            anonymized_length=length,
+            original_starts=original_starts,
+            original_ends=original_ends,
+            anonymized_starts=anonymized_starts,
+            anonymized_ends=anonymized_ends,
+        )
+        return "".join(pieces), offset_map
+
+    def _select_edits(self) -> list[tuple[int, int, str]]:
+        """Sort edits by start and drop the ones overlapping an earlier edit."""
+        ordered = sorted(self._edits, key=lambda e: (e[0], -e[1]))
+        selected: list[tuple[int, int, str]] = []
+        for edit in ordered:
+            if selected and edit[0] < selected[-1][1]:
+                continue
+            selected.append(edit)
+        return selected
@@ -27,10 +27,14 @@ from contextsafe.api.routes import (
     export_router,
     glossary_router,
     health_router,
+    jobs_router,
     projects_router,
     system_router,
 )
-from contextsafe.api.websocket import handle_progress_websocket
+from contextsafe.api.websocket import (
+    handle_progress_websocket,
+    handle_project_progress_websocket,
+)
 
 
 @asynccontextmanager
@@ -71,6 +75,9 @@ async def lifespan(app: FastAPI) -> AsyncIterator[None]:
     yield
 
     # Shutdown
+    from contextsafe.api.services.job_scheduler import get_job_scheduler
+
+    await get_job_scheduler().close()
     await database.close()
 
 
@@ -112,6 +119,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     app.include_router(glossary_router)
     app.include_router(export_router)
     app.include_router(system_router)
+    app.include_router(jobs_router)
 
     # Register WebSocket endpoint (matches frontend: /ws/documents/{id}/progress)
     @app.websocket("/ws/documents/{document_id}/progress")
@@ -120,6 +128,11 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         await handle_progress_websocket(websocket, document_id)
         print(f"[WS] WebSocket disconnected for document {document_id}")
 
+    # One socket for every document of a project (batch runs)
+    @app.websocket("/ws/projects/{project_id}/progress")
+    async def project_progress_websocket(websocket: WebSocket, project_id: UUID) -> None:
+        await handle_project_progress_websocket(websocket, project_id)
+
     return app
 
 
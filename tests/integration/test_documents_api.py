@@ -20,12 +20,18 @@ from fastapi.testclient import TestClient
 
 
 @pytest.fixture(scope="module")
-def client():
-    """Create test client for the API."""
+def client(tmp_path_factory):
+    """Create test client for the API, on a throwaway database."""
+    from contextsafe.api.config import get_settings
     from contextsafe.api.main import app
 
-    with TestClient(app) as c:
-        yield c
+    db_path = tmp_path_factory.mktemp("data") / "contextsafe.db"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("DATABASE_URL", f"sqlite+aiosqlite:///{db_path}")
+        get_settings.cache_clear()
+        with TestClient(app) as c:
+            yield c
+    get_settings.cache_clear()
 
 
 @pytest.fixture()
@@ -351,3 +357,29 @@ class TestDocumentDeletion:
         """Should return 404 when deleting nonexistent document."""
         response = client.delete("/v1/documents/00000000-0000-0000-0000-000000000000")
         assert response.status_code == 404
+
+
+class TestProjectDeletion:
+    """Tests for project deletion functionality."""
+
+    def test_delete_project_removes_stored_glossary(self, client, project_id):
+        """The stored alias glossary (original PII values) goes with the project."""
+        from contextsafe.api.dependencies import get_container
+        from contextsafe.application.ports import NerDetection
+        from contextsafe.domain.shared.value_objects import ConfidenceScore, PiiCategory, TextSpan
+
+        service = get_container().anonymization_service
+        detection = NerDetection(
+            category=PiiCategory("PERSON_NAME"),
+            value="Juan Gomez",
+            span=TextSpan.create(0, 10, "Juan Gomez").value,
+            confidence=ConfidenceScore(0.9),
+        )
+        client.portal.call(service.anonymize_text, "Juan Gomez", [detection], project_id)
+        assert client.portal.call(service._store.load, project_id) is not None
+
+        response = client.delete(f"/v1/projects/{project_id}")
+        assert response.status_code == 204
+
+        assert client.portal.call(service._store.load, project_id) is None
+        assert client.get(f"/v1/projects/{project_id}").status_code == 404
@@ -0,0 +1,93 @@
+"""
+Parity tests: ONNX Runtime backend vs PyTorch RoBERTa NER.
+
+Runs both adapters over the adversarial test set and compares the
+entities they return. Requires the local model and its ONNX export:
+
+    contextsafe export-onnx ml/models/legal_ner_v2 --output-dir ml/models/legal_ner_v2_onnx
+
+Skipped when the models or the optional dependencies are missing.
+"""
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+
+
+pytest.importorskip("torch")
+pytest.importorskip("transformers")
+pytest.importorskip("onnxruntime")
+
+from contextsafe.infrastructure.nlp import OnnxNerAdapter, RobertaNerAdapter
+
+
+pytestmark = pytest.mark.slow
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+MODEL_DIR = PROJECT_ROOT / "ml" / "models" / "legal_ner_v2"
+ONNX_DIR = PROJECT_ROOT / "ml" / "models" / "legal_ner_v2_onnx"
+ADVERSARIAL_SCRIPT = (
+    PROJECT_ROOT / "ml" / "scripts" / "evaluate" / "test_ner_predictor_adversarial_v2.py"
+)
+
+# Minimum entity-level agreement (F1) between int8 and fp32 outputs
+INT8_MIN_AGREEMENT = 0.95
+
+
+def _load_adversarial_texts() -> list[str]:
+    spec = importlib.util.spec_from_file_location("adversarial_v2", ADVERSARIAL_SCRIPT)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [test["text"] for test in module.ADVERSARIAL_TESTS]
+
+
+def _entity_set(detections) -> set[tuple[str, int, int]]:
+    return {(d.category.value, d.span.start, d.span.end) for d in detections}
+
+
+def _agreement(expected: set, actual: set) -> float:
+    if not expected and not actual:
+        return 1.0
+    common = len(expected & actual)
+    return 2 * common / (len(expected) + len(actual))
+
+
+@pytest.fixture(scope="module")
+def adversarial_texts() -> list[str]:
+    return _load_adversarial_texts()
+
+
+@pytest.fixture(scope="module")
+def torch_adapter() -> RobertaNerAdapter:
+    if not (MODEL_DIR / "config.json").exists():
+        pytest.skip(f"Local model not found: {MODEL_DIR}")
+    return RobertaNerAdapter(model_name=str(MODEL_DIR), chunking="tokens")
+
+
+def _onnx_adapter(quantized: bool) -> OnnxNerAdapter:
+    adapter = OnnxNerAdapter(model_dir=ONNX_DIR, quantized=quantized)
+    if not adapter.onnx_path.exists():
+        pytest.skip(f"ONNX export not found: {adapter.onnx_path}")
+    return adapter
+
+
+async def test_fp32_onnx_matches_pytorch(adversarial_texts, torch_adapter):
+    onnx_adapter = _onnx_adapter(quantized=False)
+
+    for text in adversarial_texts:
+        expected = _entity_set(await torch_adapter.detect_entities(text))
+        actual = _entity_set(await onnx_adapter.detect_entities(text))
+        assert actual == expected, text
+
+
+async def test_int8_onnx_agrees_with_pytorch(adversarial_texts, torch_adapter):
+    onnx_adapter = _onnx_adapter(quantized=True)
+
+    expected: set = set()
+    actual: set = set()
+    for index, text in enumerate(adversarial_texts):
+        expected |= {(index, *e) for e in _entity_set(await torch_adapter.detect_entities(text))}
+        actual |= {(index, *e) for e in _entity_set(await onnx_adapter.detect_entities(text))}
+
+    assert _agreement(expected, actual) >= INT8_MIN_AGREEMENT
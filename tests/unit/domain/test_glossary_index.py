@@ -0,0 +1,60 @@
+"""
+Tests for GlossaryIndex.
+
+Lookups must return the same entry as the linear find_matching_value scan
+(exact, partial and fuzzy passes, first match in insertion order).
+"""
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from contextsafe.domain.anonymization.services.glossary_index import GlossaryIndex
+from contextsafe.domain.anonymization.services.normalization import find_matching_value
+
+
+WORDS = ["Juan", "García", "Garcia", "Tapia", "Tapias", "Ana", "Pérez", "D.", "Sr.", "łukasz", "-"]
+
+names = st.lists(
+    st.one_of(st.sampled_from(WORDS), st.text(alphabet="abcñé .", max_size=6)),
+    max_size=4,
+).map(" ".join)
+
+
+def _lookup(values: list[str], target: str, category: str):
+    glossary = {value: f"Alias_{i:03d}" for i, value in enumerate(values)}
+    found = GlossaryIndex(category, glossary).find(target)
+    return glossary[found] if found is not None else None, glossary
+
+
+class TestGlossaryIndex:
+    @settings(max_examples=500, deadline=None)
+    @given(values=st.lists(names, max_size=10), target=names)
+    def test_person_name_matches_linear_scan(self, values, target):
+        alias, glossary = _lookup(values, target, "PERSON_NAME")
+
+        assert alias == find_matching_value(target, glossary, "PERSON_NAME")
+
+    @settings(max_examples=200, deadline=None)
+    @given(values=st.lists(names, max_size=10), target=names)
+    def test_other_category_matches_linear_scan(self, values, target):
+        alias, glossary = _lookup(values, target, "ORGANIZATION")
+
+        assert alias == find_matching_value(target, glossary, "ORGANIZATION")
+
+    def test_earlier_pass_wins_over_earlier_entry(self):
+        # The typo entry comes first, but partial matches are checked before fuzzy ones
+        values = ["Juan Garcíaa", "Juan García López"]
+
+        alias, glossary = _lookup(values, "Juan García", "PERSON_NAME")
+
+        assert alias == "Alias_001"
+        assert alias == find_matching_value("Juan García", glossary, "PERSON_NAME")
+
+    def test_grows_incrementally(self):
+        index = GlossaryIndex("PERSON_NAME")
+        assert index.find("Alberto Baxeras") is None
+
+        index.add("Alberto Baxeras Aizpún")
+        index.add("Alberto Baxeras Aizpún")
+
+        assert len(index) == 1
+        assert index.find("D. Alberto Baxeras") == "Alberto Baxeras Aizpún"
@@ -0,0 +1,93 @@
+"""
+Tests for GlossaryMatcher.
+
+The trie-compiled matcher must return leftmost-longest, non-overlapping
+matches with re.IGNORECASE semantics.
+"""
+import re
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from contextsafe.domain.anonymization.services.glossary_matcher import (
+    GlossaryMatcher,
+    get_glossary_matcher,
+)
+
+
+def reference_matches(text: str, values: list[str]) -> list[tuple[int, int]]:
+    """Naive leftmost-longest scan with one IGNORECASE regex per value."""
+    patterns = [re.compile(re.escape(v), re.IGNORECASE) for v in values if v]
+    matches = []
+    position = 0
+    while position <= len(text):
+        best = None
+        for pattern in patterns:
+            match = pattern.match(text, position)
+            if match and (best is None or match.end() > best):
+                best = match.end()
+        if best is None:
+            position += 1
+            continue
+        matches.append((position, best))
+        position = best
+    return matches
+
+
+class TestGlossaryMatcher:
+    @settings(max_examples=400, deadline=None)
+    @given(
+        values=st.lists(st.text(alphabet="abAB ñÑ.", min_size=0, max_size=5), max_size=8),
+        text=st.text(alphabet="abAB ñÑ.x", max_size=40),
+    )
+    def test_leftmost_longest_matches(self, values, text):
+        matcher = GlossaryMatcher((v, v) for v in values)
+
+        assert [(s, e) for s, e, _ in matcher.find_all(text)] == reference_matches(text, values)
+
+    def test_longest_value_wins_over_prefix(self):
+        matcher = GlossaryMatcher(
+            [("Juan García", "Persona_A"), ("Juan García López", "Persona_B")]
+        )
+
+        assert matcher.replace("D. JUAN GARCÍA LÓPEZ y juan garcía") == (
+            "D. Persona_B y Persona_A"
+        )
+
+    def test_aliases_are_not_rematched(self):
+        # Chained re.sub calls would then replace "Pérez" inside the alias
+        matcher = GlossaryMatcher([("Ana Pérez", "Persona_Ana Pérez"), ("Pérez", "X")])
+
+        assert matcher.replace("Ana Pérez") == "Persona_Ana Pérez"
+
+    def test_alias_inserted_literally(self):
+        matcher = GlossaryMatcher([("Acme", r"Org_\1")])
+
+        assert matcher.replace("Acme S.L.") == r"Org_\1 S.L."
+
+    def test_first_duplicate_wins(self):
+        matcher = GlossaryMatcher([("Madrid", "Lugar_1"), ("MADRID", "Lugar_2")])
+
+        assert len(matcher) == 1
+        assert matcher.replace("madrid") == "Lugar_1"
+
+    def test_find_outside_skips_excluded_spans(self):
+        text = "Rafael Durán firmó. Rafael Durán consta."
+        matcher = GlossaryMatcher([("Rafael Durán", "Persona_A")])
+
+        assert matcher.find_outside(text, [(0, 12)]) == [(20, 32, "Persona_A")]
+        assert matcher.find_outside(text, [(5, 25)]) == []
+
+    def test_empty_glossary(self):
+        matcher = GlossaryMatcher([])
+
+        assert matcher.find_all("texto") == []
+        assert matcher.replace("texto") == "texto"
+
+    def test_cached_by_content(self):
+        entries = [("Rafael Durán", "Persona_A")]
+
+        assert get_glossary_matcher(entries) is get_glossary_matcher(list(entries))
+        assert get_glossary_matcher(entries) is not get_glossary_matcher(
+            [("Rafael Durán", "Persona_B")]
+        )
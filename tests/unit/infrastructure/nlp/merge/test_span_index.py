@@ -0,0 +1,194 @@
+"""Tests for the merge span index.
+
+The indexed merge stages must return exactly what the original pairwise
+implementations returned (same detections, same order). The reference
+implementations below are the pre-index versions.
+"""
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from contextsafe.application.ports import NerDetection
+from contextsafe.domain.shared.value_objects import ConfidenceScore, PiiCategory, TextSpan
+from contextsafe.infrastructure.nlp.anonymization_adapter import InMemoryAnonymizationAdapter
+from contextsafe.infrastructure.nlp.composite_adapter import CompositeNerAdapter
+from contextsafe.infrastructure.nlp.merge.span_index import SpanIndex
+
+
+CATEGORIES = [
+    "PERSON_NAME",
+    "ORGANIZATION",
+    "LOCATION",
+    "ADDRESS",
+    "POSTAL_CODE",
+    "DATE",
+    "DNI_NIE",
+    "PASSPORT",
+    "IBAN",
+]
+
+
+@st.composite
+def detections(draw) -> list[NerDetection]:
+    result = []
+    for _ in range(draw(st.integers(min_value=0, max_value=40))):
+        start = draw(st.integers(min_value=0, max_value=150))
+        length = draw(st.integers(min_value=1, max_value=30))
+        result.append(
+            NerDetection(
+                category=PiiCategory.from_string(draw(st.sampled_from(CATEGORIES))).unwrap(),
+                value="x" * length,
+                span=TextSpan(start, start + length, "x" * length),
+                confidence=ConfidenceScore(draw(st.sampled_from([0.5, 0.7, 0.9, 1.0]))),
+                source=draw(st.sampled_from(["roberta", "spacy", "regex"])),
+            )
+        )
+    return result
+
+
+def _ids(items: list[NerDetection]) -> list[int]:
+    return [id(d) for d in items]
+
+
+# =============================================================================
+# Reference (pairwise) implementations
+# =============================================================================
+
+
+def reference_group(adapter: CompositeNerAdapter, dets: list[NerDetection]):
+    if not dets:
+        return []
+    sorted_dets = sorted(dets, key=lambda d: d.span.start)
+    groups = []
+    used: set[int] = set()
+    for i, det in enumerate(sorted_dets):
+        if i in used:
+            continue
+        group = [det]
+        used.add(i)
+        changed = True
+        while changed:
+            changed = False
+            for j, other in enumerate(sorted_dets):
+                if j in used:
+                    continue
+                for member in group:
+                    if adapter._calculate_overlap(other, member) >= adapter._dedup_threshold:
+                        group.append(other)
+                        used.add(j)
+                        changed = True
+                        break
+        groups.append(group)
+    return groups
+
+
+def reference_nested(adapter: CompositeNerAdapter, dets: list[NerDetection]):
+    if len(dets) <= 1:
+        return dets
+    kept: list[NerDetection] = []
+    for detection in sorted(dets, key=lambda d: -(d.span.end - d.span.start)):
+        is_nested = any(
+            adapter._is_fully_contained(detection, larger)
+            and adapter._are_compatible_categories(detection.category, larger.category)
+            and larger.confidence.value >= 0.7
+            for larger in kept
+        )
+        if not is_nested:
+            kept.append(detection)
+    return kept
+
+
+CATEGORY_PRIORITY = {
+    "PERSON_NAME": 100,
+    "DNI_NIE": 95,
+    "SOCIAL_SECURITY": 90,
+    "PHONE": 85,
+    "EMAIL": 80,
+    "IBAN": 75,
+    "CREDIT_CARD": 70,
+    "ADDRESS": 65,
+    "LOCATION": 60,
+    "PASSPORT": 55,
+    "ORGANIZATION": 50,
+    "DATE": 40,
+    "POSTAL_CODE": 35,
+    "LICENSE_PLATE": 30,
+    "CASE_NUMBER": 20,
+}
+
+
+def reference_remove_overlapping(
+    adapter: InMemoryAnonymizationAdapter, dets: list[NerDetection]
+) -> list[NerDetection]:
+    sorted_dets = sorted(
+        dets,
+        key=lambda d: (
+            -CATEGORY_PRIORITY.get(d.category.value, 0),
+            -d.confidence.value,
+            -(d.span.end - d.span.start),
+        ),
+    )
+    result: list[NerDetection] = []
+    for detection in sorted_dets:
+        if not any(
+            adapter._spans_overlap(detection.span, selected.span)
+            or adapter._should_merge_adjacent(detection, selected)
+            for selected in result
+        ):
+            result.append(detection)
+    return result
+
+
+# =============================================================================
+# Properties
+# =============================================================================
+
+
+@settings(max_examples=300, deadline=None)
+@given(dets=detections(), threshold=st.sampled_from([0.0, 0.3, 0.5, 0.8, 1.0]))
+def test_grouping_matches_pairwise_implementation(dets, threshold):
+    adapter = CompositeNerAdapter(adapters=[], dedup_overlap_threshold=threshold)
+
+    expected = reference_group(adapter, dets)
+    actual = adapter._group_overlapping_detections(dets)
+
+    assert [_ids(g) for g in actual] == [_ids(g) for g in expected]
+
+
+@settings(max_examples=300, deadline=None)
+@given(dets=detections())
+def test_nested_filter_matches_pairwise_implementation(dets):
+    adapter = CompositeNerAdapter(adapters=[])
+
+    assert _ids(adapter._filter_nested_entities(dets)) == _ids(reference_nested(adapter, dets))
+
+
+@settings(max_examples=300, deadline=None)
+@given(dets=detections())
+def test_remove_overlapping_matches_pairwise_implementation(dets):
+    adapter = InMemoryAnonymizationAdapter()
+
+    expected = reference_remove_overlapping(adapter, dets)
+    actual = adapter._remove_overlapping_detections(dets)
+
+    assert _ids(actual) == _ids(expected)
+
+
+class TestSpanIndex:
+    def test_query_returns_overlapping_and_touching_spans(self):
+        index: SpanIndex[str] = SpanIndex()
+        index.add(0, 5, "a")
+        index.add(10, 20, "b")
+        index.add(4, 12, "c")
+        index.add(30, 31, "d")
+
+        assert index.query(5, 10) == ["a", "c", "b"]
+        assert index.query(21, 29) == []
+        assert index.query(31, 40) == ["d"]
+        assert len(index) == 4
+
+    def test_long_span_found_from_far_start(self):
+        index: SpanIndex[str] = SpanIndex()
+        index.add(0, 1000, "long")
+        index.add(500, 501, "short")
+
+        assert index.query(900, 905) == ["long"]
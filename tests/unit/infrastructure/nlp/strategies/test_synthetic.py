@@ -4,10 +4,32 @@ TF-005: DNI/IBAN/NSS generated in ADVANCED level must have mathematically
 invalid checksums, so they cannot correspond to real data.
 """
 
+import asyncio
+import json
+import re
+
+import httpx
+import pytest
+
+from contextsafe.application.ports import NerDetection
+from contextsafe.domain.anonymization.services import date_shifter
+from contextsafe.domain.anonymization.services.date_shifter import parse_spanish_date
+from contextsafe.domain.shared.value_objects import ConfidenceScore, PiiCategory, TextSpan
+from contextsafe.infrastructure.nlp.anonymization_adapter import InMemoryAnonymizationAdapter
+from contextsafe.infrastructure.nlp.strategies import synthetic
 from contextsafe.infrastructure.nlp.strategies.synthetic import (
     DNI_LETTERS,
+    SyntheticStrategy,
+    SyntheticValuePool,
     generate_invalid_dni,
     generate_invalid_nie,
+    generate_phone,
+    parse_batch_response,
+)
+from contextsafe.infrastructure.persistence import (
+    Database,
+    SQLiteSyntheticStore,
+    SyntheticProjectState,
 )
 
 
@@ -47,3 +69,475 @@ def test_synthetic_nie_format():
     assert nie[0] in "XYZ"
     assert nie[1:-1].isdigit()
     assert nie[-1].isalpha()
+
+
+def test_value_pool_is_reproducible_and_unique():
+    """Same seed, same sequence; values already issued are never handed out."""
+    first = SyntheticValuePool(generate_phone, seed=7)
+    values = [first.take() for _ in range(200)]
+
+    again = SyntheticValuePool(generate_phone, seed=7, issued=values[:3])
+
+    assert len(set(values)) == len(values)
+    assert [again.take() for _ in range(197)] == values[3:]
+
+
+def test_value_pool_reports_exhausted_space():
+    pool = SyntheticValuePool(lambda rng: "600000000", seed=1)
+    pool.take()
+
+    with pytest.raises(RuntimeError):
+        pool.take()
+
+
+# =============================================================================
+# LLM synthesis against a local Ollama stand-in
+# =============================================================================
+
+
+class FakeOllama:
+    """Ollama stand-in (httpx MockTransport) recording requests and concurrency.
+
+    Batched prompts get a JSON array with one value per listed original;
+    originals in ``echo`` are answered with themselves (invalid),
+    ``broken_batches`` makes batched answers unparseable and
+    ``repeat_batches`` answers every batch with the same values.
+    """
+
+    def __init__(self, delay: float = 0.01):
+        self.delay = delay
+        self.tags_calls = 0
+        self.prompts: list[str] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.echo: set[str] = set()
+        self.broken_batches = False
+        self.repeat_batches = False
+
+    async def handler(self, request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/api/tags":
+            self.tags_calls += 1
+            return httpx.Response(200, json={"models": []})
+
+        prompt = json.loads(request.content)["prompt"]
+        self.prompts.append(prompt)
+        number = len(self.prompts)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+
+        if "array JSON" not in prompt:
+            return httpx.Response(200, json={"response": f"Sintético {number}"})
+        if self.broken_batches:
+            return httpx.Response(200, json={"response": "Claro, aquí tienes los nombres:"})
+        originals = re.findall(r"^\d+\. .*\(original: (.*)\)$", prompt, re.MULTILINE)
+        batch = 0 if self.repeat_batches else number
+        values = [
+            original if original in self.echo else f"Lote {batch}-{i}"
+            for i, original in enumerate(originals)
+        ]
+        return httpx.Response(200, json={"response": json.dumps(values, ensure_ascii=False)})
+
+    @property
+    def batch_prompts(self) -> list[str]:
+        return [p for p in self.prompts if "array JSON" in p]
+
+    def strategy(self, **kwargs) -> SyntheticStrategy:
+        strategy = SyntheticStrategy(adapter=InMemoryAnonymizationAdapter(), **kwargs)
+        strategy._http_client = httpx.AsyncClient(transport=httpx.MockTransport(self.handler))
+        return strategy
+
+
+def _detection(category: str, value: str, start: int = 0) -> NerDetection:
+    return NerDetection(
+        category=PiiCategory(category),
+        value=value,
+        span=TextSpan.create(start, start + len(value), value).value,
+        confidence=ConfidenceScore(0.9),
+    )
+
+
+@pytest.fixture()
+def no_wsl(monkeypatch):
+    monkeypatch.setattr(synthetic, "IS_WSL", False)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_prepare_synthesizes_each_entity_once_concurrently():
+    """One availability check, one LLM call per unique entity, bounded concurrency."""
+    ollama = FakeOllama()
+    strategy = ollama.strategy(max_concurrency=2, batch_size=1)
+    values = [
+        ("PERSON_NAME", "Rafael Durán Calvente"),
+        ("PERSON_NAME", "Rafael Durán"),
+        ("ORGANIZATION", "Acme Abogados S.L."),
+        ("PERSON_NAME", "María López"),
+        ("ORGANIZATION", "Acme Abogados S.L."),
+        ("LOCATION", "Villanueva del Prado"),
+        ("DNI_NIE", "12345678Z"),
+    ]
+    detections = [_detection(category, value, i * 40) for i, (category, value) in enumerate(values)]
+
+    await strategy.prepare(detections, "project-1")
+    results = [await strategy.generate_replacement(d, "project-1") for d in detections]
+    await strategy.close()
+
+    assert ollama.tags_calls == 1
+    assert len(ollama.prompts) == 4
+    assert ollama.max_in_flight == 2
+    assert results[0].replacement == results[1].replacement
+    assert results[2].replacement == results[4].replacement
+    assert len({r.replacement for r in results}) == 5
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_availability_rechecked_after_ttl(monkeypatch):
+    """An expired availability check is repeated (Ollama restarts are picked up)."""
+    ollama = FakeOllama(delay=0)
+    strategy = ollama.strategy()
+
+    await strategy.generate_replacement(_detection("PERSON_NAME", "Ana Pérez"), "project-1")
+    await strategy.generate_replacement(_detection("PERSON_NAME", "Luis Gómez"), "project-1")
+    assert ollama.tags_calls == 1
+
+    monkeypatch.setattr(synthetic, "AVAILABILITY_TTL_SECONDS", 0.0)
+    strategy._ollama_checked_until = 0.0
+    await strategy.generate_replacement(_detection("PERSON_NAME", "Eva Ruiz"), "project-1")
+    await strategy.close()
+
+    assert ollama.tags_calls == 2
+
+
+NAMES = [
+    "Rafael Durán Calvente",
+    "Dña. María López",
+    "Pedro Gómez",
+    "Lucía Navarro",
+    "Elena Ruiz",
+]
+ORGS = ["Acme Abogados S.L.P.", "Banco del Norte S.A.", "Clínica Dental Sur"]
+
+
+def _name_and_org_detections() -> list[NerDetection]:
+    values = [("PERSON_NAME", v) for v in NAMES] + [("ORGANIZATION", v) for v in ORGS]
+    return [_detection(category, value, i * 40) for i, (category, value) in enumerate(values)]
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_prepare_batches_names_and_organizations():
+    """Names and orgs are synthesized batch_size per prompt, with gender and sector hints."""
+    ollama = FakeOllama()
+    strategy = ollama.strategy(batch_size=4)
+    detections = _name_and_org_detections()
+
+    await strategy.prepare(detections, "project-1")
+    results = [await strategy.generate_replacement(d, "project-1") for d in detections]
+    await strategy.close()
+
+    # 5 names -> batch of 4 + single prompt; 3 orgs -> one batch
+    assert len(ollama.batch_prompts) == 2
+    assert len(ollama.prompts) == 3
+    prompts = "\n".join(ollama.batch_prompts)
+    assert "género femenino (original: Dña. María López)" in prompts
+    assert "forma jurídica S.L.P. (original: Acme Abogados S.L.P.)" in prompts
+    assert len({r.replacement for r in results}) == len(detections)
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_invalid_batch_items_retried_individually():
+    """An item echoing its original is re-asked with its own prompt."""
+    ollama = FakeOllama()
+    ollama.echo = {"Pedro Gómez"}
+    strategy = ollama.strategy(batch_size=8)
+    detections = _name_and_org_detections()
+
+    await strategy.prepare(detections, "project-1")
+    result = await strategy.generate_replacement(detections[2], "project-1")
+    await strategy.close()
+
+    assert len(ollama.batch_prompts) == 2
+    assert len(ollama.prompts) == 3
+    assert result.replacement.startswith("Sintético")
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_values_repeated_across_batches_and_documents_are_retried():
+    """A value already given to another batch or document is re-asked individually."""
+    ollama = FakeOllama()
+    ollama.repeat_batches = True
+    strategy = ollama.strategy(batch_size=2)
+    first = [_detection("PERSON_NAME", v, i * 40) for i, v in enumerate(NAMES[:4])]
+    second = [
+        _detection("PERSON_NAME", v, i * 40) for i, v in enumerate([*NAMES[4:], "Lucía Ortega"])
+    ]
+
+    results = []
+    for detections in (first, second):
+        await strategy.prepare(detections, "project-1")
+        results += [await strategy.generate_replacement(d, "project-1") for d in detections]
+    await strategy.close()
+
+    replacements = [r.replacement for r in results]
+    assert len(set(replacements)) == len(replacements)
+    assert sum(r.startswith("Sintético") for r in replacements) == 4
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_unparseable_batch_falls_back_to_single_prompts():
+    """A batched answer that is not a JSON array falls back to per-item prompts."""
+    ollama = FakeOllama()
+    ollama.broken_batches = True
+    strategy = ollama.strategy(batch_size=8)
+    detections = _name_and_org_detections()
+
+    await strategy.prepare(detections, "project-1")
+    results = [await strategy.generate_replacement(d, "project-1") for d in detections]
+    await strategy.close()
+
+    assert len(ollama.prompts) == 2 + len(detections)
+    assert all(r.replacement.startswith("Sintético") for r in results)
+
+
+def test_parse_batch_response():
+    """The JSON array is found inside surrounding chatter and checked for length."""
+    response = 'Aquí: ["Ana Sol", 3, "\\"Eva\\""] fin'
+
+    assert parse_batch_response(response, 3) == ["Ana Sol", "", "Eva"]
+    assert parse_batch_response('["Ana Sol"]', 2) is None
+    assert parse_batch_response("Ana Sol", 1) is None
+
+
+# =============================================================================
+# Persistent synthetic values (warm restarts)
+# =============================================================================
+
+
+@pytest.fixture()
+async def database(tmp_path):
+    db = Database(f"sqlite+aiosqlite:///{tmp_path / 'contextsafe.db'}")
+    await db.create_all()
+    yield db
+    await db.close()
+
+
+async def _anonymize(adapter, ollama: FakeOllama, text: str, detections, project_id: str):
+    strategy = ollama.strategy()
+    strategy._adapter = adapter
+    adapter._get_strategy = lambda level, compute_mode=None: strategy
+    return await adapter.anonymize_text(text, detections, project_id, level="ADVANCED")
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_warm_restart_reuses_stored_synthetic_values(database):
+    """A new adapter on the same database replays aliases without calling the LLM."""
+    text = "Rafael Durán Calvente y Acme Abogados S.L. Rafael Durán firma."
+    values = [
+        ("PERSON_NAME", "Rafael Durán Calvente", 0),
+        ("ORGANIZATION", "Acme Abogados S.L.", 24),
+        ("PERSON_NAME", "Rafael Durán", 43),
+    ]
+    detections = [_detection(category, value, start) for category, value, start in values]
+
+    first = await _anonymize(
+        InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database)),
+        FakeOllama(),
+        text,
+        detections,
+        "project-1",
+    )
+
+    restarted = InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database))
+    ollama = FakeOllama()
+    second = await _anonymize(restarted, ollama, text, detections, "project-1")
+
+    assert second.anonymized_text == first.anonymized_text
+    assert "Sintético" in second.anonymized_text
+    assert ollama.prompts == []
+    assert await restarted.get_or_create_alias("PERSON_NAME", "Rafael Durán", "project-1") == (
+        "Persona_001"
+    )
+    assert await restarted.get_or_create_alias("PERSON_NAME", "Ana Ruiz", "project-1") == (
+        "Persona_002"
+    )
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_date_shift_survives_a_restart(database, monkeypatch):
+    """A date shifted after a restart keeps its interval to the stored ones."""
+    first = await _anonymize(
+        InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database)),
+        FakeOllama(),
+        "01/03/2024",
+        [_detection("DATE", "01/03/2024")],
+        "project-1",
+    )
+
+    # New process: fresh shifter, and str hashes salted differently
+    monkeypatch.setattr(date_shifter, "_date_shifter", None)
+    monkeypatch.setattr(date_shifter, "hash", lambda value: 12345, raising=False)
+    restarted = InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database))
+    second = await _anonymize(
+        restarted,
+        FakeOllama(),
+        "01/03/2024 y 11/03/2024",
+        [_detection("DATE", "01/03/2024"), _detection("DATE", "11/03/2024", 13)],
+        "project-1",
+    )
+
+    before, after = second.anonymized_text.split(" y ")
+    assert before == first.anonymized_text
+    assert (parse_spanish_date(after) - parse_spanish_date(before)).days == 10
+
+
+@pytest.mark.asyncio()
+async def test_store_roundtrip_keeps_entry_order(database):
+    """Glossary order matters for matching, so it must survive storage."""
+    store = SQLiteSyntheticStore(database)
+    state = SyntheticProjectState(
+        glossary={"PERSON_NAME": {"Zoe Paz": "Persona_001", "Ana Paz": "Persona_002"}},
+        counters={"PERSON_NAME": 3},
+        synthetic={("PERSON_NAME", "Persona_001"): "Eva Sol"},
+    )
+
+    await store.save("project-1", state)
+    state.counters["PERSON_NAME"] = 4
+    await store.save("project-1", state)
+
+    loaded = await store.load("project-1")
+    assert list(loaded.glossary["PERSON_NAME"]) == ["Zoe Paz", "Ana Paz"]
+    assert loaded.counters == {"PERSON_NAME": 4}
+    assert loaded.synthetic == state.synthetic
+    assert await store.load("project-2") is None
+
+
+@pytest.mark.asyncio()
+@pytest.mark.usefixtures("no_wsl")
+async def test_code_values_are_unique_per_project_across_restarts(database):
+    """Phones come from the project pool: distinct, and not reissued after a restart."""
+    phones = [f"6{i:08d}" for i in range(20)]
+    text = "; ".join(phones)
+    detections = [_detection("PHONE", phone, 11 * i) for i, phone in enumerate(phones)]
+
+    first = await _anonymize(
+        InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database)),
+        FakeOllama(),
+        text,
+        detections[:10],
+        "project-pool",
+    )
+    synthetic._value_pools.clear()
+    second = await _anonymize(
+        InMemoryAnonymizationAdapter(SQLiteSyntheticStore(database)),
+        FakeOllama(),
+        text,
+        detections,
+        "project-pool",
+    )
+
+    replaced = second.anonymized_text.split("; ")
+    assert len(set(replaced)) == len(phones)
+    assert replaced[:10] == first.anonymized_text.split("; ")[:10]
+
+
+class SlowStore:
+    """Wraps a store: load waits first, and raises while ``fail_loads`` > 0."""
+
+    def __init__(self, store: SQLiteSyntheticStore, delay: float = 0.0) -> None:
+        self.store = store
+        self.delay = delay
+        self.fail_loads = 0
+        self.saves = 0
+
+    async def load(self, project_id: str):
+        await asyncio.sleep(self.delay)
+        if self.fail_loads:
+            self.fail_loads -= 1
+            raise RuntimeError("database is locked")
+        return await self.store.load(project_id)
+
+    async def save(self, project_id: str, state) -> None:
+        self.saves += 1
+        await self.store.save(project_id, state)
+
+
+async def _store_pedro(database) -> SQLiteSyntheticStore:
+    store = SQLiteSyntheticStore(database)
+    await store.save(
+        "project-1",
+        SyntheticProjectState(
+            glossary={"PERSON_NAME": {"Pedro Ruiz": "Persona_001"}},
+            counters={"PERSON_NAME": 2},
+            synthetic={},
+        ),
+    )
+    return store
+
+
+@pytest.mark.asyncio()
+async def test_concurrent_documents_wait_for_the_project_load(database):
+    """Aliases are never handed out from an empty glossary while the load is running."""
+    adapter = InMemoryAnonymizationAdapter(SlowStore(await _store_pedro(database), delay=0.05))
+
+    def anonymize(name: str):
+        return adapter.anonymize_text(name, [_detection("PERSON_NAME", name, 0)], "project-1")
+
+    pedro, juan = await asyncio.gather(anonymize("Pedro Ruiz"), anonymize("Juan Gomez"))
+
+    assert pedro.anonymized_text == "Persona_001"
+    assert juan.anonymized_text == "Persona_002"
+    glossary = await adapter.get_glossary("project-1")
+    assert glossary["PERSON_NAME"] == {"Pedro Ruiz": "Persona_001", "Juan Gomez": "Persona_002"}
+
+
+@pytest.mark.asyncio()
+async def test_failed_load_fails_the_document_and_is_retried(database):
+    """No alias is handed out (or saved) from an empty glossary while the store fails."""
+    store = SlowStore(await _store_pedro(database))
+    store.fail_loads = 1
+    adapter = InMemoryAnonymizationAdapter(store)
+    detection = _detection("PERSON_NAME", "Juan Gomez", 0)
+
+    with pytest.raises(RuntimeError, match="database is locked"):
+        await adapter.anonymize_text("Juan Gomez", [detection], "project-1")
+    store.fail_loads = 1
+    with pytest.raises(RuntimeError, match="database is locked"):
+        await adapter.get_or_create_alias("PERSON_NAME", "Ana Ruiz", "project-1")
+    assert await adapter.get_glossary("project-1") == {}
+    assert store.saves == 0
+    assert (await store.store.load("project-1")).glossary == {
+        "PERSON_NAME": {"Pedro Ruiz": "Persona_001"}
+    }
+
+    retried = await adapter.anonymize_text("Juan Gomez", [detection], "project-1")
+    assert retried.anonymized_text == "Persona_002"
+    assert (await store.store.load("project-1")).glossary == {
+        "PERSON_NAME": {"Pedro Ruiz": "Persona_001", "Juan Gomez": "Persona_002"}
+    }
+
+
+@pytest.mark.asyncio()
+async def test_clearing_a_project_deletes_its_stored_state(database):
+    """The stored glossary holds original PII: clearing the project removes the row."""
+    store = await _store_pedro(database)
+    adapter = InMemoryAnonymizationAdapter(store)
+    detection = _detection("PERSON_NAME", "Juan Gomez", 0)
+    await adapter.anonymize_text("Juan Gomez", [detection], "project-1")
+    assert (await store.load("project-1")).glossary["PERSON_NAME"]["Juan Gomez"] == "Persona_002"
+
+    await adapter.clear_project_glossary("project-1")
+
+    assert await store.load("project-1") is None
+    assert await adapter.get_glossary("project-1") == {}
+    assert "project-1" not in adapter._loaded_projects
+    assert "project-1" not in adapter._saved_sizes
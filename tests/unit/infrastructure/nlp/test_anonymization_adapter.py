@@ -58,3 +58,22 @@ async def test_longer_span_does_not_override_higher_risk():
 
     assert "612345678" not in result.anonymized_text
     assert "Juan Garcia" not in result.anonymized_text
+
+
+@pytest.mark.asyncio()
+async def test_glossary_scan_replaces_missed_mentions_with_offset_map():
+    """Bare mentions NER missed are replaced; the offset map locates every alias."""
+    adapter = InMemoryAnonymizationAdapter()
+    text = "D. Rafael Durán Calvente firmó. Consta Rafael Durán Calvente en la tabla."
+    detections = [_detection("PERSON_NAME", "Rafael Durán Calvente", 3, 24, 0.95)]
+
+    result = await adapter.anonymize_text(text, detections, "proj")
+
+    assert "Rafael" not in result.anonymized_text
+    alias = result.replacements[0].alias
+    assert result.anonymized_text.count(alias) == 2
+    assert [
+        result.anonymized_text[start:end] for start, end in result.offset_map.anonymized_spans()
+    ] == [alias, alias]
+    consta = result.offset_map.to_anonymized_offset(text.index("Consta"))
+    assert result.anonymized_text[consta:].startswith("Consta")
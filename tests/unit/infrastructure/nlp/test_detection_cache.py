@@ -0,0 +1,163 @@
+"""Tests for the NER detection result cache (DetectionCache, CachedNerAdapter)."""
+import sqlite3
+
+from contextsafe.infrastructure.nlp import (
+    CachedNerAdapter,
+    CompositeNerAdapter,
+    DetectionCache,
+    RegexNerAdapter,
+)
+from contextsafe.infrastructure.nlp.roberta_ner_adapter import RobertaNerAdapter
+
+
+TEXT = "D. Rafael Durán, con DNI 12345678Z y teléfono 612 345 678."
+
+
+class CountingNer(RegexNerAdapter):
+    """Regex detection that counts how often it actually runs."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+
+    async def detect_entities(self, text, categories=None, min_confidence=0.5, callback=None):
+        self.calls += 1
+        return await super().detect_entities(text, categories, min_confidence, callback)
+
+
+class FlakyNer(RegexNerAdapter):
+    """Raises (like a model that failed to load) while ``broken`` is set."""
+
+    broken = True
+
+    async def detect_entities(self, text, categories=None, min_confidence=0.5, callback=None):
+        if self.broken:
+            raise RuntimeError("model failed to load")
+        return []
+
+
+class BrokenPipeline:
+    """transformers pipeline stand-in that fails at inference."""
+
+    def __call__(self, inputs, batch_size: int = 1):
+        raise RuntimeError("CUDA out of memory")
+
+
+class BrokenRoberta(RobertaNerAdapter):
+    """RoBERTa whose model loaded fine but whose inference fails."""
+
+    def __init__(self) -> None:
+        super().__init__(local_files_only=True, chunking="chars")
+        self._pipeline = BrokenPipeline()
+        self._is_loaded = True
+
+    async def is_available(self) -> bool:
+        return True
+
+
+class TestCachedNerAdapter:
+    async def test_hit_returns_same_detections_without_running_ner(self):
+        inner = CountingNer()
+        adapter = CachedNerAdapter(inner, DetectionCache(), fingerprint="config-a")
+        progress = []
+
+        async def callback(current, total, info):
+            progress.append((current, total))
+
+        first = await adapter.detect_entities(TEXT)
+        second = await adapter.detect_entities(TEXT, progress_callback=callback)
+
+        assert first
+        assert second == first
+        assert inner.calls == 1
+        assert progress == [(100, 100)]
+
+    async def test_text_config_and_arguments_are_part_of_the_key(self):
+        inner = CountingNer()
+        cache = DetectionCache()
+
+        await CachedNerAdapter(inner, cache, "config-a").detect_entities(TEXT)
+        await CachedNerAdapter(inner, cache, "config-b").detect_entities(TEXT)
+        await CachedNerAdapter(inner, cache, "config-a").detect_entities(TEXT + " ")
+        await CachedNerAdapter(inner, cache, "config-a").detect_entities(TEXT, min_confidence=0.9)
+        await CachedNerAdapter(inner, cache, "config-a").detect_entities(TEXT)
+
+        assert inner.calls == 4
+        assert cache.stats()["hits"] == 1
+
+    async def test_degraded_composite_result_is_not_cached(self):
+        flaky = FlakyNer()
+        composite = CompositeNerAdapter([RegexNerAdapter(), flaky], enable_type_validation=False)
+        cache = DetectionCache()
+        adapter = CachedNerAdapter(composite, cache, "config-a")
+
+        degraded = await adapter.detect_entities(TEXT)
+
+        assert degraded
+        assert degraded.skipped == ("FlakyNer",)
+        assert cache.stats()["memory_entries"] == 0
+
+        flaky.broken = False
+        complete = await adapter.detect_entities(TEXT)
+        cached = await adapter.detect_entities(TEXT)
+
+        assert complete.complete
+        assert cache.stats()["memory_entries"] == 1
+        assert cached == complete
+
+    async def test_roberta_inference_error_is_not_cached(self):
+        composite = CompositeNerAdapter(
+            [RegexNerAdapter(), BrokenRoberta()], enable_type_validation=False
+        )
+        cache = DetectionCache()
+
+        degraded = await CachedNerAdapter(composite, cache, "config-a").detect_entities(TEXT)
+
+        assert degraded
+        assert degraded.skipped == ("BrokenRoberta",)
+        assert cache.stats()["memory_entries"] == 0
+
+
+class TestDetectionCache:
+    def test_memory_is_bounded_by_bytes(self):
+        cache = DetectionCache(max_bytes=25)
+        for key in "abc":
+            cache.put(key, b"x" * 10)
+
+        assert cache.get("a") is None
+        assert cache.get("c") == b"x" * 10
+        assert cache.stats()["memory_bytes"] == 20
+
+    def test_sqlite_store_survives_restart_and_evicts_least_recently_used(self, tmp_path):
+        db_path = tmp_path / "detections.db"
+        cache = DetectionCache(max_bytes=25, db_path=db_path)
+        cache.put("a", b"a" * 10)
+        cache.put("b", b"b" * 10)
+        cache.close()
+
+        reopened = DetectionCache(max_bytes=25, db_path=db_path)
+        assert reopened.get("a") == b"a" * 10  # from disk, now most recently used
+        reopened.put("c", b"c" * 10)
+
+        assert reopened.get("b") is None
+        assert reopened.stats()["disk_hits"] == 1
+        assert reopened.stats()["disk_bytes"] == 20
+        reopened.close()
+
+    def test_disk_hits_update_last_use_without_a_commit_each(self, tmp_path):
+        db_path = tmp_path / "detections.db"
+        cache = DetectionCache(db_path=db_path)
+        cache.put("a", b"a" * 10)
+        cache.close()
+
+        def last_use() -> float:
+            with sqlite3.connect(db_path) as conn:
+                return conn.execute("SELECT used FROM detections WHERE key = 'a'").fetchone()[0]
+
+        stored = last_use()
+        reopened = DetectionCache(db_path=db_path)
+        assert reopened.get("a") == b"a" * 10
+        assert reopened._conn.total_changes == 0
+        reopened.close()
+
+        assert last_use() > stored
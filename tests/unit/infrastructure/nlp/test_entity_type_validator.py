@@ -0,0 +1,179 @@
+"""Tests for batched EntityTypeValidator validation.
+
+Uses a deterministic fake embedding model and hand-made centroids so the
+batched path can be compared with per-detection validate() calls.
+"""
+import hashlib
+import sys
+import threading
+import time
+import types
+
+import numpy as np
+
+from contextsafe.infrastructure.nlp.validators.embedding_cache import EmbeddingCache
+from contextsafe.infrastructure.nlp.validators.entity_type_validator import (
+    EntityTypeValidator,
+    ValidationAction,
+)
+
+
+DIM = 16
+LABELS = ["PERSON_NAME", "ORGANIZATION", "LOCATION", "DATE", "NOT_ENTITY"]
+
+
+def _vector(text: str) -> np.ndarray:
+    seed = int.from_bytes(hashlib.sha256(text.encode()).digest()[:4], "little")
+    vec = np.random.default_rng(seed).normal(size=DIM).astype(np.float32)
+    return vec / np.linalg.norm(vec)
+
+
+class FakeEncoder:
+    """Stand-in for SentenceTransformer.encode counting forward passes."""
+
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def encode(self, inputs, batch_size=32, normalize_embeddings=True, show_progress_bar=False):
+        self.calls.append(list(inputs))
+        return np.stack([_vector(text) for text in inputs])
+
+
+def _validator() -> tuple[EntityTypeValidator, FakeEncoder]:
+    validator = EntityTypeValidator(reclassify_threshold=0.2, margin_threshold=0.05)
+    encoder = FakeEncoder()
+    validator._model = encoder
+    validator._initialized = True
+    validator._centroids = {label: _vector(f"centroid:{label}") for label in LABELS}
+    validator._centroid_labels = list(LABELS)
+    validator._centroid_matrix = np.stack([validator._centroids[label] for label in LABELS])
+    return validator, encoder
+
+
+DETECTIONS = [
+    ("Juan García", "PERSON_NAME", 0, 11),
+    ("Banco Santander", "ORGANIZATION", 20, 35),
+    ("Finalmente", "PERSON_NAME", 40, 50),  # stopword -> REJECT without model
+    ("12345678Z", "DNI_NIE", 60, 69),  # regex-validated category
+    ("Madrid", "LOCATION", 70, 76),
+    ("Juan García", "PERSON_NAME", 90, 101),  # repeated entity
+    ("Juan García", "ORGANIZATION", 110, 121),  # same text, different type
+]
+
+
+class TestValidateBatch:
+    def test_batch_matches_individual_validation(self):
+        validator, _ = _validator()
+        expected = [
+            validator.validate(text, category, "", start, end)
+            for text, category, start, end in DETECTIONS
+        ]
+
+        batch_validator, _ = _validator()
+        actual = batch_validator.validate_batch(DETECTIONS, "")
+
+        assert [(r.action, r.validated_type) for r in actual] == [
+            (r.action, r.validated_type) for r in expected
+        ]
+        for got, want in zip(actual, expected):
+            assert got.similarity_scores.keys() == want.similarity_scores.keys()
+            for label, score in want.similarity_scores.items():
+                assert abs(got.similarity_scores[label] - score) < 1e-5
+
+    def test_single_encode_call_with_unique_texts(self):
+        validator, encoder = _validator()
+
+        results = validator.validate_batch(DETECTIONS, "")
+
+        assert len(encoder.calls) == 1
+        assert encoder.calls[0] == ["query: Juan García", "query: Banco Santander", "query: Madrid"]
+        assert results[2].action == ValidationAction.REJECT
+        assert results[3].action == ValidationAction.KEEP
+
+    def test_no_model_call_when_nothing_to_embed(self):
+        validator, encoder = _validator()
+
+        validator.validate_batch([("Finalmente", "PERSON_NAME", 0, 10)], "")
+
+        assert encoder.calls == []
+
+
+class TestEmbeddingCache:
+    def test_repeated_entities_skip_the_model(self):
+        validator, encoder = _validator()
+
+        first = validator.validate_batch(DETECTIONS, "")
+        second = validator.validate_batch(DETECTIONS, "")
+
+        assert len(encoder.calls) == 1
+        assert [(r.action, r.validated_type) for r in first] == [
+            (r.action, r.validated_type) for r in second
+        ]
+        stats = validator.cache_stats()
+        assert stats["misses"] == 3
+        assert stats["hits"] == 3
+
+    def test_only_misses_are_encoded(self):
+        validator, encoder = _validator()
+
+        validator.validate("Juan García", "PERSON_NAME", "", 0, 11)
+        validator.validate_batch(DETECTIONS, "")
+
+        assert encoder.calls == [
+            ["query: Juan García"],
+            ["query: Banco Santander", "query: Madrid"],
+        ]
+
+    def test_keys_depend_on_model_name(self):
+        assert EmbeddingCache.make_key("model-a", "query: x") != EmbeddingCache.make_key(
+            "model-b", "query: x"
+        )
+
+    def test_lru_is_bounded(self):
+        cache = EmbeddingCache(max_entries=2)
+        cache.put_many({k: _vector(k) for k in ("a", "b", "c")})
+
+        assert set(cache.get_many(["a", "b", "c"])) == {"b", "c"}
+        assert cache.stats()["memory_entries"] == 2
+
+    def test_sqlite_store_survives_restart(self, tmp_path):
+        db_path = tmp_path / "embeddings.db"
+        cache = EmbeddingCache(db_path=db_path)
+        cache.put_many({"k": _vector("k")})
+        cache.close()
+
+        reopened = EmbeddingCache(db_path=db_path)
+        found = reopened.get_many(["k", "missing"])
+
+        assert np.allclose(found["k"], _vector("k"))
+        assert reopened.stats()["disk_hits"] == 1
+        assert reopened.stats()["misses"] == 1
+
+
+class TestLazyInitialization:
+    def test_concurrent_threads_load_the_model_once(self, monkeypatch, tmp_path):
+        loads = []
+
+        class SlowSentenceTransformer(FakeEncoder):
+            def __init__(self, model_name: str) -> None:
+                super().__init__()
+                loads.append(model_name)
+                time.sleep(0.05)
+
+        module = types.ModuleType("sentence_transformers")
+        module.SentenceTransformer = SlowSentenceTransformer
+        monkeypatch.setitem(sys.modules, "sentence_transformers", module)
+        validator = EntityTypeValidator(centroids_path=tmp_path / "missing.json")
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(validator._ensure_initialized()))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == [True] * 4
+        assert len(loads) == 1
@@ -0,0 +1,88 @@
+"""Tests for the cross-document micro-batching inference scheduler."""
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from contextsafe.infrastructure.nlp.inference_scheduler import MicroBatchScheduler
+
+
+_EXECUTOR = ThreadPoolExecutor(max_workers=1)
+
+
+class RecordingBatchFn:
+    """Batch function that uppercases items and records batch sizes."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    def __call__(self, items: list[str]) -> list[str]:
+        self.batches.append(list(items))
+        return [item.upper() for item in items]
+
+
+def _scheduler(batch_fn, max_batch_size: int = 8, max_wait_ms: float = 20.0):
+    return MicroBatchScheduler(
+        batch_fn, lambda: _EXECUTOR, max_batch_size=max_batch_size, max_wait_ms=max_wait_ms
+    )
+
+
+class TestMicroBatchScheduler:
+    async def test_results_returned_in_submission_order(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = _scheduler(batch_fn)
+
+        assert await scheduler.submit(["a", "b", "c"]) == ["A", "B", "C"]
+
+    async def test_concurrent_documents_share_a_batch(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = _scheduler(batch_fn, max_batch_size=8)
+
+        results = await asyncio.gather(
+            scheduler.submit(["doc1-a", "doc1-b"]),
+            scheduler.submit(["doc2-a", "doc2-b"]),
+            scheduler.submit(["doc3-a"]),
+        )
+
+        assert results == [["DOC1-A", "DOC1-B"], ["DOC2-A", "DOC2-B"], ["DOC3-A"]]
+        assert len(batch_fn.batches) == 1
+        assert scheduler.stats()["items_run"] == 5
+
+    async def test_batches_capped_at_max_batch_size(self):
+        batch_fn = RecordingBatchFn()
+        scheduler = _scheduler(batch_fn, max_batch_size=3)
+
+        results = await asyncio.gather(*(scheduler.submit([f"x{i}", f"y{i}"]) for i in range(4)))
+
+        assert [r for pair in results for r in pair] == [
+            f"{p}{i}".upper() for i in range(4) for p in ("x", "y")
+        ]
+        assert all(len(batch) <= 3 for batch in batch_fn.batches)
+        assert sum(len(batch) for batch in batch_fn.batches) == 8
+
+    async def test_batch_failure_propagates_to_callers(self):
+        def failing(items):
+            raise RuntimeError("model crashed")
+
+        scheduler = _scheduler(failing)
+
+        with pytest.raises(RuntimeError, match="model crashed"):
+            await scheduler.submit(["a"])
+
+        # Scheduler keeps serving after a failed batch
+        scheduler._batch_fn = RecordingBatchFn()
+        assert await scheduler.submit(["b"]) == ["B"]
+
+    async def test_wrong_result_count_fails_the_batch(self):
+        scheduler = _scheduler(lambda items: items[:-1])
+
+        with pytest.raises(ValueError, match="1 results for 2 items"):
+            await asyncio.wait_for(scheduler.submit(["a", "b"]), timeout=1)
+
+        scheduler._batch_fn = RecordingBatchFn()
+        assert await scheduler.submit(["c"]) == ["C"]
+
+    async def test_empty_submission(self):
+        batch_fn = RecordingBatchFn()
+        assert await _scheduler(batch_fn).submit([]) == []
+        assert batch_fn.batches == []
@@ -0,0 +1,46 @@
+"""Tests for multi-process NER execution (ProcessPoolNerAdapter)."""
+import pytest
+
+from contextsafe.infrastructure.nlp import ProcessPoolNerAdapter, RegexNerAdapter
+
+
+TEXT = (
+    "D. Rafael Durán, con DNI 12345678Z y teléfono 612 345 678, "
+    "cuenta ES91 2100 0418 4502 0005 1332. "
+)
+
+
+@pytest.fixture(scope="module")
+def pool():
+    adapter = ProcessPoolNerAdapter(RegexNerAdapter, workers=2, shared_memory_min_bytes=1024)
+    yield adapter
+    adapter.shutdown()
+
+
+class TestProcessPoolNerAdapter:
+    @pytest.mark.parametrize("repeat", [1, 40], ids=["pickled", "shared_memory"])
+    async def test_matches_in_process_detections(self, pool, repeat):
+        text = TEXT * repeat
+
+        expected = await RegexNerAdapter().detect_entities(text)
+        detections = await pool.detect_entities(text)
+
+        assert detections
+        assert detections == expected
+
+    async def test_reports_start_and_end_progress(self, pool):
+        calls = []
+
+        async def progress(current, total, info):
+            calls.append((current, total))
+
+        await pool.detect_entities(TEXT, progress_callback=progress)
+
+        assert calls == [(0, 100), (100, 100)]
+
+    async def test_model_info_comes_from_a_worker(self, pool):
+        info = await pool.get_model_info()
+
+        assert info["type"] == "process_pool"
+        assert info["workers"] == 2
+        assert info["worker"]["type"] == (await RegexNerAdapter().get_model_info())["type"]
@@ -0,0 +1,171 @@
+"""Tests for regex prefilters and merged alternations.
+
+Prefilters and merged pattern lists are pure optimizations: detections
+must be identical to scanning every pattern sequentially.
+"""
+import re
+
+import pytest
+
+from contextsafe.infrastructure.nlp import regex_engine
+from contextsafe.infrastructure.nlp.composite_adapter import (
+    CONTEXT_EXCLUSION_PATTERNS,
+    FALSE_POSITIVE_PATTERNS,
+    JUDICIAL_LOCATION_CONTEXT,
+    STRUCTURAL_DATE_PATTERNS,
+)
+from contextsafe.infrastructure.nlp.regex_adapter import PII_PATTERNS, RegexNerAdapter
+from contextsafe.infrastructure.nlp.regex_engine import (
+    PatternScanner,
+    combine_patterns,
+    derive_prefilter,
+)
+
+
+CORPUS = [
+    "D. Juan García Pérez, con DNI 12345678Z, reside en Calle Mayor 12, 28013 Madrid.",
+    "Dña. María López de la Fuente comparece ante el JUZGADO DE PRIMERA INSTANCIA Nº 3 DE Sevilla.",
+    "En Madrid, a 28 de octubre de 2025. Procedimiento 548/2025-D7, NIG 28079 42 1 2025 0012345.",
+    "IBAN ES91 2100 0418 4502 0005 1332, teléfono +34 612 345 678, correo juan@example.com.",
+    "Tarjeta 4111111111111111, NAF 28/12345678/40, CCC 28 10 1234567 89.",
+    "Referencia catastral 9872023VH5797S0001WX. CSV: ABCD1234EFGH5678IJ.",
+    "Véase ECLI:ES:TS:2020:1234 y doi.org/10.18239/abc-123 o https://example.com/2020.",
+    "mensaje de WhatsApp enviado por Banco Santander S.A. y Mapfre a Acme Abogados S.L.P.",
+    "SR. D. ALEJANDRO ÁLVAREZ ESPEJO interpone recurso. CIP: ABCD123456789012.",
+    "Texto sin datos personales ni números.",
+    "",
+]
+
+
+class TestDerivePrefilter:
+    def test_digit_patterns(self):
+        prefilter = derive_prefilter(re.compile(r"\b[0-9]{8}[A-Za-z]\b"))
+        assert prefilter.requires_digit
+        assert prefilter.keywords == ()
+
+    def test_superscript_digits_are_not_decimal(self):
+        # "²".isdigit() is True, but \d does not match it
+        pattern = re.compile("m²")
+        prefilter = derive_prefilter(pattern)
+
+        assert not prefilter.requires_digit
+        assert PatternScanner("100 m²").passes(prefilter)
+        assert PatternScanner("cien m²").passes(prefilter)
+
+    def test_keyword_patterns(self):
+        prefilter = derive_prefilter(re.compile(r"(?i)(?:TIS|Osakidetza)[:\s]+(\d{8})"))
+        assert prefilter.requires_digit
+        assert set(prefilter.keywords) == {"TIS", "Osakidetza"}
+        assert PatternScanner("tarjeta OSAKIDETZA 12345678").passes(prefilter)
+        assert not PatternScanner("sin palabra clave 12345678").passes(prefilter)
+
+    def test_irregular_case_folding_falls_back_to_regex(self):
+        # "ı" (dotless i) matches "I" under re.IGNORECASE but lowercases to itself
+        pattern = re.compile(r"IDESP[:\s]+([A-Z0-9]{9})", re.IGNORECASE)
+        text = "ıdesp: ABC123456"
+
+        assert pattern.search(text)
+        assert PatternScanner(text).passes(derive_prefilter(pattern))
+
+    def test_leading_keywords(self):
+        prefilter = derive_prefilter(re.compile(r"(?:Banco|Caja)\s+[A-Z][a-z]+", re.IGNORECASE))
+        assert prefilter.leading == ("banco", "caja")
+
+        # Optional prefix: matches may start anywhere
+        assert not derive_prefilter(re.compile(r"(?:D\.\s+)?Banco\s+\w+")).leading
+
+    @pytest.mark.parametrize("item", PII_PATTERNS, ids=lambda item: item[1])
+    def test_scanner_finditer_matches_finditer(self, item):
+        flags = 0 if (len(item) > 4 and item[4]) else re.IGNORECASE
+        pattern = re.compile(item[0], flags)
+        prefilter = derive_prefilter(pattern)
+
+        for text in CORPUS + ["\n".join(CORPUS) * 2]:
+            expected = [(m.start(), m.end(), m.groups()) for m in pattern.finditer(text)]
+            actual = [
+                (m.start(), m.end(), m.groups())
+                for m in PatternScanner(text).finditer(pattern, prefilter)
+            ]
+            assert actual == expected
+
+    def test_without_sre_internals_prefilters_are_trivial(self, monkeypatch):
+        monkeypatch.setattr(regex_engine, "sre_parse", None)
+
+        assert derive_prefilter(re.compile(r"\b[0-9]{8}[A-Za-z]\b")).is_trivial
+
+    def test_optional_parts_are_not_required(self):
+        prefilter = derive_prefilter(re.compile(r"(?:Banco\s+)?[A-Z][a-z]+"))
+        assert prefilter.is_trivial
+
+    @pytest.mark.parametrize("item", PII_PATTERNS, ids=lambda item: item[1])
+    def test_prefilter_is_sound_on_corpus(self, item):
+        flags = 0 if (len(item) > 4 and item[4]) else re.IGNORECASE
+        pattern = re.compile(item[0], flags)
+        prefilter = derive_prefilter(pattern)
+
+        for text in CORPUS:
+            if pattern.search(text):
+                assert PatternScanner(text).passes(prefilter), text
+
+
+class TestRegexAdapterPrefilters:
+    @pytest.mark.parametrize("text", CORPUS)
+    async def test_same_detections_with_and_without_prefilters(self, text):
+        fast = await RegexNerAdapter().detect_entities(text)
+        full = await RegexNerAdapter(use_prefilters=False).detect_entities(text)
+
+        def key(d):
+            return (d.category, d.value, d.span.start, d.span.end, d.confidence.value)
+
+        assert [key(d) for d in fast] == [key(d) for d in full]
+
+    @pytest.mark.parametrize("min_confidence", [0.5, 0.97])
+    async def test_repeated_regex_with_other_confidence(self, min_confidence):
+        # The social security regex appears twice (0.95 and 0.98); the second
+        # copy must still run when the first is below min_confidence
+        text = "Afiliado 28/12345678/40."
+
+        fast = await RegexNerAdapter().detect_entities(text, min_confidence=min_confidence)
+        full = await RegexNerAdapter(use_prefilters=False).detect_entities(
+            text, min_confidence=min_confidence
+        )
+
+        assert [(d.value, d.confidence.value) for d in fast] == [
+            (d.value, d.confidence.value) for d in full
+        ]
+        assert [d.value for d in fast] == ["28/12345678/40"]
+
+
+class TestCombinePatterns:
+    VALUES = [
+        "FUNDAMENTOS DE DERECHO",
+        "Sentencia 61/2019",
+        "Ley Orgánica 3/2007",
+        "artículo 24.2 CE",
+        "Juan García",
+        "28 de octubre de 2025",
+        "17/10/2025",
+        "Madrid",
+        "",
+    ]
+
+    @pytest.mark.parametrize(
+        "patterns", [FALSE_POSITIVE_PATTERNS, STRUCTURAL_DATE_PATTERNS, CONTEXT_EXCLUSION_PATTERNS]
+    )
+    def test_match_equivalent_to_any(self, patterns):
+        combined = combine_patterns(patterns)
+        for value in self.VALUES + CORPUS:
+            assert bool(combined.match(value)) == any(p.match(value) for p in patterns)
+
+    def test_search_equivalent_to_any_with_scoped_flags(self):
+        combined = combine_patterns(JUDICIAL_LOCATION_CONTEXT)
+        for text in ["Juzgado de lo Social\nnº 3 de ", "AUDIENCIA PROVINCIAL DE ", "Madrid"]:
+            assert bool(combined.search(text)) == any(
+                p.search(text) for p in JUDICIAL_LOCATION_CONTEXT
+            )
+
+    def test_inline_global_flags_become_scoped(self):
+        combined = combine_patterns([re.compile(r"(?im)^abc$"), re.compile(r"xyz")])
+
+        assert combined.search("x\nABC\n")
+        assert not combined.search("XYZ")
@@ -0,0 +1,313 @@
+"""Tests for RobertaNerAdapter chunking and batched inference.
+
+The transformers pipeline is replaced by a fake that tags a fixed set of
+names, so offsets and batching can be checked without loading a model.
+"""
+import asyncio
+import re
+
+import numpy as np
+import pytest
+
+from contextsafe.infrastructure.nlp.onnx_ner_adapter import OnnxNerAdapter, OnnxTokenClassifier
+from contextsafe.infrastructure.nlp.roberta_ner_adapter import RobertaNerAdapter
+
+
+NAMES = ("Juan García Pérez", "María López Ruiz")
+
+
+class FakeNerPipeline:
+    """Stand-in for transformers.pipeline("ner", aggregation_strategy="simple")."""
+
+    def __init__(self) -> None:
+        self.calls: list[int] = []
+
+    def _tag(self, chunk: str) -> list[dict]:
+        entities = []
+        for name in NAMES:
+            for match in re.finditer(re.escape(name), chunk):
+                entities.append(
+                    {
+                        "entity_group": "PER",
+                        "score": 0.99,
+                        "word": match.group(),
+                        "start": match.start(),
+                        "end": match.end(),
+                    }
+                )
+        return entities
+
+    def __call__(self, inputs, batch_size: int = 1):
+        if isinstance(inputs, str):
+            self.calls.append(1)
+            return self._tag(inputs)
+        self.calls.append(len(inputs))
+        return [self._tag(chunk) for chunk in inputs]
+
+
+def _adapter(batch_size: int) -> tuple[RobertaNerAdapter, FakeNerPipeline]:
+    adapter = RobertaNerAdapter(batch_size=batch_size, local_files_only=True, chunking="chars")
+    fake = FakeNerPipeline()
+    adapter._pipeline = fake
+    adapter._is_loaded = True
+    return adapter, fake
+
+
+def _long_text() -> str:
+    paragraph = (
+        "En Madrid, a 3 de marzo, comparece Juan García Pérez ante el tribunal "
+        "y declara que conoce a María López Ruiz desde hace años. "
+    )
+    return paragraph * 80
+
+
+class TestChunkSpans:
+    """Tests for _compute_chunk_spans."""
+
+    def test_spans_cover_whole_text(self):
+        adapter, _ = _adapter(batch_size=4)
+        text = _long_text()
+
+        spans = adapter._compute_chunk_spans(text)
+
+        assert spans[0][0] == 0
+        assert spans[-1][1] == len(text)
+        for (_, prev_end), (next_start, _) in zip(spans, spans[1:]):
+            assert next_start < prev_end  # overlapping, no gaps
+
+    def test_spans_respect_max_chunk_size(self):
+        adapter, _ = _adapter(batch_size=4)
+        spans = adapter._compute_chunk_spans(_long_text())
+        assert all(end - start <= adapter.MAX_CHUNK_CHARS for start, end in spans)
+
+
+class TestBatchedInference:
+    """Batched and unbatched chunking must produce the same detections."""
+
+    async def test_batched_matches_unbatched(self):
+        text = _long_text()
+        single, _ = _adapter(batch_size=1)
+        batched, _ = _adapter(batch_size=8)
+
+        expected = await single.detect_entities(text)
+        actual = await batched.detect_entities(text)
+
+        assert [(d.span.start, d.span.end, d.value) for d in actual] == [
+            (d.span.start, d.span.end, d.value) for d in expected
+        ]
+        for detection in actual:
+            assert text[detection.span.start : detection.span.end] == detection.value
+
+    async def test_pipeline_called_once_per_batch(self):
+        text = _long_text()
+        adapter, fake = _adapter(batch_size=8)
+        total_chunks = len(adapter._compute_chunk_spans(text))
+
+        await adapter.detect_entities(text)
+
+        assert sum(fake.calls) == total_chunks
+        assert len(fake.calls) == (total_chunks + 7) // 8
+
+    async def test_progress_reported_per_batch(self):
+        text = _long_text()
+        adapter, fake = _adapter(batch_size=8)
+        updates: list[tuple[int, str]] = []
+
+        async def on_progress(current: int, total: int, info: str) -> None:
+            updates.append((current, info))
+
+        await adapter.detect_entities(text, progress_callback=on_progress)
+
+        batch_updates = [info for _, info in updates if "lote" in info]
+        assert len(batch_updates) == len(fake.calls)
+        progress = [current for current, _ in updates]
+        assert progress == sorted(progress)
+
+
+ID2LABEL = {0: "O", 1: "B-PER", 2: "I-PER"}
+
+
+class FakeFastTokenizer:
+    """Whitespace tokenizer exposing offsets like a HF fast tokenizer."""
+
+    is_fast = True
+    pad_token_id = 1
+
+    def build_inputs_with_special_tokens(self, ids):
+        return [0, *ids, 2]
+
+    def __call__(self, text, add_special_tokens=False, return_offsets_mapping=False):
+        offsets = [(m.start(), m.end()) for m in re.finditer(r"\S+", text)]
+        return {"input_ids": list(range(len(offsets))), "offset_mapping": offsets}
+
+
+class FakeModelConfig:
+    id2label = ID2LABEL
+
+
+class FakeModel:
+    config = FakeModelConfig()
+
+
+class FakeTokenPipeline:
+    tokenizer = FakeFastTokenizer()
+    model = FakeModel()
+
+
+def _name_token_logits(text: str) -> np.ndarray:
+    """Per-token logits tagging the words of NAMES as PER."""
+    offsets = FakeFastTokenizer()(text)["offset_mapping"]
+    labels = np.zeros(len(offsets), dtype=int)
+    for name in NAMES:
+        for match in re.finditer(re.escape(name), text):
+            inside = [i for i, (s, e) in enumerate(offsets) if match.start() <= s < match.end()]
+            labels[inside[0]] = 1
+            labels[inside[1:]] = 2
+    return np.eye(3, dtype=np.float32)[labels] * 10.0
+
+
+def _token_adapter(text: str, window: int, stride: int, batch_size: int = 4):
+    """Adapter whose forward pass tags the words of NAMES as PER."""
+    adapter = RobertaNerAdapter(
+        local_files_only=True,
+        batch_size=batch_size,
+        window_tokens=window,
+        token_stride=stride,
+    )
+    adapter._pipeline = FakeTokenPipeline()
+    adapter._is_loaded = True
+    token_logits = _name_token_logits(text)
+
+    windows_seen: list[list[int]] = []
+
+    def forward(rows):
+        windows_seen.extend(rows)
+        return [token_logits[row] for row in rows]
+
+    adapter._forward_token_rows = forward
+    return adapter, windows_seen
+
+
+class TestCrossDocumentBatching:
+    """Concurrent documents share forward passes through the scheduler."""
+
+    async def test_concurrent_documents_merged_into_shared_batches(self):
+        text = _long_text()
+        adapter = RobertaNerAdapter(
+            batch_size=4, max_batch_size=16, local_files_only=True, chunking="chars"
+        )
+        fake = FakeNerPipeline()
+        adapter._pipeline = fake
+        adapter._is_loaded = True
+
+        first, second = await asyncio.gather(
+            adapter.detect_entities(text), adapter.detect_entities(text)
+        )
+
+        assert first == second
+        assert max(fake.calls) > 4  # chunks from both documents in one call
+        assert adapter._text_scheduler.stats()["items_run"] == sum(fake.calls)
+
+
+class TestTokenWindows:
+    """Tests for exact token-window chunking."""
+
+    def test_windows_cover_sequence_with_stride(self):
+        adapter = RobertaNerAdapter(local_files_only=True, window_tokens=10, token_stride=3)
+
+        windows = adapter._compute_token_windows(25)
+
+        assert windows == [(0, 10), (7, 17), (14, 24), (21, 25)]
+
+    def test_single_window_for_short_sequence(self):
+        adapter = RobertaNerAdapter(local_files_only=True, window_tokens=10, token_stride=3)
+        assert adapter._compute_token_windows(4) == [(0, 4)]
+
+    def test_invalid_stride_rejected(self):
+        with pytest.raises(ValueError, match="token_stride"):
+            RobertaNerAdapter(local_files_only=True, window_tokens=10, token_stride=10)
+
+    async def test_entities_mapped_to_original_offsets(self):
+        text = _long_text()
+        adapter, windows_seen = _token_adapter(text, window=50, stride=10)
+
+        detections = await adapter.detect_entities(text)
+
+        expected = sorted(
+            (m.start(), m.end())
+            for name in NAMES
+            for m in re.finditer(re.escape(name), text)
+        )
+        assert sorted((d.span.start, d.span.end) for d in detections) == expected
+        assert all(d.value in NAMES for d in detections)
+        assert all(len(row) <= 50 for row in windows_seen)
+
+    async def test_falls_back_to_chars_without_fast_tokenizer(self):
+        text = _long_text()
+        adapter = RobertaNerAdapter(local_files_only=True, chunking="tokens")
+        fake = FakeNerPipeline()
+        adapter._pipeline = fake
+        adapter._is_loaded = True
+
+        detections = await adapter.detect_entities(text)
+
+        assert fake.calls
+        assert detections
+
+
+class FakeOnnxInput:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+
+class FakeOnnxSession:
+    """Stand-in for onnxruntime.InferenceSession over token-id inputs."""
+
+    def __init__(self, token_logits: np.ndarray) -> None:
+        self._token_logits = token_logits
+
+    def get_inputs(self):
+        return [FakeOnnxInput("input_ids"), FakeOnnxInput("attention_mask")]
+
+    def run(self, output_names, feed):
+        ids = feed["input_ids"]
+        logits = np.zeros((*ids.shape, 3), dtype=np.float32)
+        content = ids > 2  # Fake token ids are token indexes offset by 3
+        logits[content] = self._token_logits[ids[content] - 3]
+        logits[~content] = [0.0, 0.0, 50.0]  # Garbage on special/pad tokens
+        return [logits]
+
+
+class TestOnnxNerAdapter:
+    """The ONNX backend must decode exactly like the PyTorch token path."""
+
+    async def test_entities_match_pytorch_path(self):
+        text = _long_text()
+        torch_adapter, _ = _token_adapter(text, window=50, stride=10)
+
+        class ShiftedTokenizer(FakeFastTokenizer):
+            def __call__(self, text, **kwargs):
+                encoding = super().__call__(text, **kwargs)
+                encoding["input_ids"] = [i + 3 for i in encoding["input_ids"]]
+                return encoding
+
+        onnx_adapter = OnnxNerAdapter(model_dir="/nonexistent", window_tokens=50, token_stride=10)
+        onnx_adapter._pipeline = OnnxTokenClassifier(
+            session=FakeOnnxSession(_name_token_logits(text)),
+            tokenizer=ShiftedTokenizer(),
+            config=FakeModelConfig(),
+        )
+        onnx_adapter._is_loaded = True
+
+        expected = await torch_adapter.detect_entities(text)
+        actual = await onnx_adapter.detect_entities(text)
+
+        assert actual
+        assert [(d.span.start, d.span.end, d.category) for d in actual] == [
+            (d.span.start, d.span.end, d.category) for d in expected
+        ]
+
+    def test_missing_export_reports_load_error(self):
+        adapter = OnnxNerAdapter(model_dir="/nonexistent", quantized=True)
+        assert adapter.onnx_path.name == "model.int8.onnx"
+        assert not adapter._check_model_cached()
@@ -0,0 +1,74 @@
+"""Tests for SpacyNerAdapter Doc reuse between detection and tokenization."""
+from types import SimpleNamespace
+
+from contextsafe.infrastructure.nlp.spacy_adapter import SpacyNerAdapter
+
+
+class FakeDoc:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self.ents = [
+            SimpleNamespace(label_="PER", text="Juan García", start_char=0, end_char=11)
+        ]
+
+
+class FakeNlp:
+    """Counts full parses vs tokenizer-only passes."""
+
+    def __init__(self) -> None:
+        self.parses = 0
+        self.tokenizations = 0
+
+    def __call__(self, text: str) -> FakeDoc:
+        self.parses += 1
+        return FakeDoc(text)
+
+    def make_doc(self, text: str) -> FakeDoc:
+        self.tokenizations += 1
+        return FakeDoc(text)
+
+
+def _adapter() -> tuple[SpacyNerAdapter, FakeNlp]:
+    adapter = SpacyNerAdapter()
+    nlp = FakeNlp()
+    adapter._nlp = nlp
+    adapter._is_loaded = True
+    return adapter, nlp
+
+
+TEXT = "Juan García firmó el contrato."
+
+
+async def test_tokenize_reuses_doc_from_detection():
+    adapter, nlp = _adapter()
+
+    detections = await adapter.detect_entities(TEXT)
+    doc = await adapter.tokenize(TEXT)
+
+    assert len(detections) == 1
+    assert doc.text == TEXT
+    assert nlp.parses == 1
+    assert nlp.tokenizations == 0
+
+
+async def test_tokenize_without_detection_runs_tokenizer_only():
+    adapter, nlp = _adapter()
+
+    doc = await adapter.tokenize(TEXT)
+
+    assert doc.text == TEXT
+    assert nlp.parses == 0
+    assert nlp.tokenizations == 1
+
+
+async def test_cached_doc_consumed_once_and_bounded():
+    adapter, nlp = _adapter()
+
+    await adapter.detect_entities(TEXT)
+    await adapter.tokenize(TEXT)
+    await adapter.tokenize(TEXT)
+    assert nlp.tokenizations == 1
+
+    for i in range(adapter.DOC_CACHE_SIZE + 3):
+        await adapter.detect_entities(f"{TEXT} {i}")
+    assert len(adapter._doc_cache) == adapter.DOC_CACHE_SIZE
@@ -0,0 +1,91 @@
+"""Tests for TextNormalizer.
+
+The run-based fast path must produce exactly what the per-character
+implementation produced (normalized text and char map).
+"""
+import unicodedata
+from array import array
+
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from contextsafe.infrastructure.nlp.text_normalizer import (
+    HOMOGLYPHS,
+    SOFT_HYPHEN,
+    ZERO_WIDTH_PATTERN,
+    TextNormalizer,
+)
+
+
+def reference_normalize(text: str) -> tuple[str, tuple[int, ...]]:
+    """Per-character implementation (pre fast path)."""
+    chars: list[str] = []
+    char_map: list[int] = []
+    prev_was_space = False
+
+    for i, ch in enumerate(text):
+        if ZERO_WIDTH_PATTERN.match(ch):
+            continue
+
+        nfkc = unicodedata.normalize("NFKC", ch)
+        nfkc = "".join(HOMOGLYPHS.get(c, c) for c in nfkc)
+        nfkc = nfkc.replace(SOFT_HYPHEN, "")
+
+        if not nfkc:
+            prev_was_space = False
+            continue
+
+        if nfkc == " ":
+            if prev_was_space:
+                continue
+            prev_was_space = True
+        else:
+            prev_was_space = False
+
+        for c in nfkc:
+            chars.append(c)
+            char_map.append(i)
+
+    return "".join(chars), tuple(char_map)
+
+
+# Plain text mixed with every kind of special character
+ALPHABET = st.sampled_from(
+    list("Juan García ÁÉÍÓÚñÑ.,;:-0123456789  \n\t")
+    + list(HOMOGLYPHS)
+    + [SOFT_HYPHEN, "\u200b", "\u2060", "\ufeff", "\xa0", "\u2003", "Ａ", "１"]
+    + ["¨", "Ω", "ﬁ", "½", "\U0001d400", "\U0001f600", "́"]
+)
+
+
+class TestNormalizeWithMapping:
+    @settings(max_examples=500, deadline=None)
+    @given(text=st.text(alphabet=ALPHABET, max_size=60))
+    def test_matches_per_character_implementation(self, text):
+        mapping = TextNormalizer().normalize_with_mapping(text)
+
+        expected_text, expected_map = reference_normalize(text)
+        assert mapping.normalized_text == expected_text
+        assert tuple(mapping.char_map) == expected_map
+
+    @settings(max_examples=200, deadline=None)
+    @given(text=st.text(max_size=40))
+    def test_matches_on_arbitrary_unicode(self, text):
+        mapping = TextNormalizer().normalize_with_mapping(text)
+
+        assert (mapping.normalized_text, tuple(mapping.char_map)) == reference_normalize(text)
+
+    def test_plain_text_is_identity(self):
+        text = "D. Juan García Pérez, con DNI 12345678Z.\nFirmado en Madrid."
+        mapping = TextNormalizer().normalize_with_mapping(text)
+
+        assert mapping.normalized_text == text
+        assert isinstance(mapping.char_map, array)
+        assert list(mapping.char_map) == list(range(len(text)))
+
+    def test_spans_map_back_across_collapsed_spaces(self):
+        text = "Juan\xa0  Garc\u200bía"
+        mapping = TextNormalizer().normalize_with_mapping(text)
+
+        assert mapping.normalized_text == "Juan García"
+        assert mapping.to_original_span(5, 11) == (7, len(text))
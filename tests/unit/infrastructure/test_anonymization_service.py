@@ -11,11 +11,13 @@ Traceability:
 import pytest
 
 from contextsafe.application.ports import NerDetection
+from contextsafe.domain.anonymization.services.date_shifter import parse_spanish_date
 from contextsafe.domain.shared.value_objects import (
     ConfidenceScore,
     PiiCategory,
     TextSpan,
 )
+from contextsafe.infrastructure.nlp import anonymization_adapter
 from contextsafe.infrastructure.nlp.anonymization_adapter import (
     ALIAS_PREFIXES,
     InMemoryAnonymizationAdapter,
@@ -145,6 +147,34 @@ class TestAliasGeneration:
         # Should use first 3 characters
         assert alias == "UNK_001"
 
+    @pytest.mark.asyncio()
+    @pytest.mark.parametrize("level", ["INTERMEDIATE", "ADVANCED"])
+    async def test_same_date_in_other_format_reuses_alias(self, adapter, project_id, level):
+        """Should reuse the alias of an equal date written in another format."""
+        written = "5 de diciembre de 2025"
+        first = await adapter.get_or_create_alias("DATE", written, project_id, level)
+        same = await adapter.get_or_create_alias("DATE", "05/12/2025", project_id, level)
+        other = await adapter.get_or_create_alias("DATE", "06/12/2025", project_id, level)
+
+        assert same == first
+        assert other != first
+
+    @pytest.mark.asyncio()
+    async def test_date_entries_parsed_once(self, adapter, project_id, monkeypatch):
+        """Should not re-parse every stored date for each new date."""
+        calls = []
+
+        def counting_parse(date_str):
+            calls.append(date_str)
+            return parse_spanish_date(date_str)
+
+        monkeypatch.setattr(anonymization_adapter, "parse_spanish_date", counting_parse)
+        dates = [f"{day:02d}/{month:02d}/2024" for month in range(1, 5) for day in range(1, 26)]
+        for date in dates:
+            await adapter.get_or_create_alias("DATE", date, project_id)
+
+        assert len(calls) <= 2 * len(dates)
+
 
 class TestTextAnonymization:
     """Tests for full text anonymization functionality."""
@@ -290,7 +320,7 @@ class TestGlossaryManagement:
         await adapter.get_or_create_alias("EMAIL", "a@b.com", "project-1")
         await adapter.get_or_create_alias("EMAIL", "c@d.com", "project-2")
 
-        adapter.clear_project_glossary("project-1")
+        await adapter.clear_project_glossary("project-1")
 
         # Project 1 should be empty
         glossary1 = await adapter.get_glossary("project-1")
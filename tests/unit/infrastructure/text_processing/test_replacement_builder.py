@@ -0,0 +1,93 @@
+"""
+Tests for ReplacementBuilder and ReplacementOffsetMap.
+
+The single-pass builder must produce exactly what the former sequential
+replacement loop produced for non-overlapping edits.
+"""
+from hypothesis import given, settings
+from hypothesis import strategies as st
+
+from contextsafe.infrastructure.text_processing.replacement_builder import ReplacementBuilder
+
+
+def sequential_replace(text: str, edits: list[tuple[int, int, str]]) -> str:
+    """Former implementation: rebuild the string once per edit, right to left."""
+    for start, end, replacement in sorted(edits, key=lambda e: e[0], reverse=True):
+        after_char = text[end : end + 1] if end < len(text) else ""
+        space_suffix = " " if after_char.isalnum() else ""
+        text = text[:start] + replacement + space_suffix + text[end:]
+    return text
+
+
+@st.composite
+def text_and_edits(draw):
+    text = draw(st.text(alphabet="ab ,.1", min_size=0, max_size=60))
+    cuts = sorted(draw(st.lists(st.integers(0, len(text)), max_size=12)))
+    edits = []
+    position = 0
+    for cut_start, cut_end in zip(cuts[::2], cuts[1::2]):
+        if cut_start < position or cut_start == cut_end:
+            continue
+        replacement = draw(st.sampled_from(["", "X", "Persona_A", " ", "-"]))
+        edits.append((cut_start, cut_end, replacement))
+        position = cut_end
+    return text, draw(st.permutations(edits))
+
+
+class TestReplacementBuilder:
+    @settings(max_examples=400, deadline=None)
+    @given(data=text_and_edits())
+    def test_matches_sequential_replacement(self, data):
+        text, edits = data
+        builder = ReplacementBuilder(text)
+        for edit in edits:
+            builder.replace(*edit)
+
+        anonymized, offset_map = builder.build()
+
+        assert anonymized == sequential_replace(text, edits)
+        assert offset_map.anonymized_length == len(anonymized)
+        assert len(offset_map) == len(edits)
+        for start, end, replacement in edits:
+            anon_start, anon_end = offset_map.to_anonymized_span(start, end)
+            assert anonymized[anon_start:anon_end] == replacement
+
+    @settings(max_examples=200, deadline=None)
+    @given(data=text_and_edits())
+    def test_untouched_offsets_map_to_same_character(self, data):
+        text, edits = data
+        builder = ReplacementBuilder(text)
+        for edit in edits:
+            builder.replace(*edit)
+        anonymized, offset_map = builder.build()
+
+        for offset, char in enumerate(text):
+            if any(start <= offset < end for start, end, _ in edits):
+                continue
+            assert anonymized[offset_map.to_anonymized_offset(offset)] == char
+
+    def test_space_inserted_before_following_word(self):
+        builder = ReplacementBuilder("Juan García declaró")
+        builder.replace(0, 11, "Persona_A")
+        builder.replace(12, 19, "X")
+
+        anonymized, offset_map = builder.build()
+
+        assert anonymized == "Persona_A X"
+        assert offset_map.anonymized_spans() == [(0, 9), (10, 11)]
+
+    def test_overlapping_edits_keep_earliest(self):
+        builder = ReplacementBuilder("Juan García López")
+        builder.replace(5, 17, "B")
+        builder.replace(0, 11, "A")
+
+        anonymized, _ = builder.build()
+
+        assert anonymized == "A López"
+
+    def test_no_edits_is_identity(self):
+        anonymized, offset_map = ReplacementBuilder("texto").build()
+
+        assert anonymized == "texto"
+        assert len(offset_map) == 0
+        assert offset_map.to_anonymized_span(1, 3) == (1, 3)
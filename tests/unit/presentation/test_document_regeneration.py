@@ -0,0 +1,130 @@
+"""
+Tests for incremental document regeneration after glossary edits.
+
+Patched segment lists must render the same text as a full rebuild from
+the original document.
+"""
+from uuid import uuid4
+
+import pytest
+
+from contextsafe.api.services import document_regeneration
+from contextsafe.api.services.document_regeneration import (
+    build_segments,
+    glossary_match_entries,
+    regenerate_documents,
+    release_entries,
+    render_segments,
+)
+from contextsafe.api.session_manager import session_manager
+from contextsafe.domain.anonymization.services.glossary_matcher import get_glossary_matcher
+
+
+TEXTS = [
+    "D. Rafael Durán Calvente y Acme Abogados S.L. firman. Rafael Durán consta.",
+    "Acme Abogados representa a Rafael Durán Calvente.",
+    "Documento sin entidades conocidas.",
+]
+
+
+def _entry(original: str, alias: str) -> dict:
+    return {"id": str(uuid4()), "original_text": original, "alias": alias, "category": "X"}
+
+
+def _full(original: str, entries: list[dict]) -> str:
+    match_entries = glossary_match_entries(entries)
+    segments = build_segments(original, get_glossary_matcher(match_entries))
+    return render_segments(original, segments, {e["id"]: e["alias"] for e in entries})
+
+
+@pytest.fixture()
+def project():
+    session = session_manager.get_or_create_local_session()
+    project_id = str(uuid4())
+    doc_ids = []
+    for text in TEXTS:
+        doc = session_manager.add_document(
+            session.id, "doc.txt", 1, project_id=project_id, content=text
+        )
+        doc_ids.append(doc.id)
+    entries = [
+        _entry("Rafael Durán Calvente", "Persona_001"),
+        _entry("Rafael Durán", "Persona_002"),
+        _entry("Acme Abogados", "Org_001"),
+    ]
+    yield session.id, project_id, doc_ids, entries
+    for doc_id in doc_ids:
+        session.documents.pop(doc_id, None)
+
+
+class TestSegments:
+    def test_release_rescans_only_freed_runs(self):
+        original = TEXTS[0]
+        entries = [_entry("Rafael Durán Calvente", "P1"), _entry("Rafael Durán", "P2")]
+        matcher = get_glossary_matcher(glossary_match_entries(entries))
+        segments = build_segments(original, matcher)
+
+        remaining = entries[1:]
+        released = release_entries(
+            original,
+            segments,
+            {entries[0]["id"]},
+            get_glossary_matcher(glossary_match_entries(remaining)),
+        )
+
+        aliases = {e["id"]: e["alias"] for e in remaining}
+        assert render_segments(original, released, aliases) == _full(original, remaining)
+        assert "P2 Calvente" in render_segments(original, released, aliases)
+
+
+class TestRegenerateDocuments:
+    def test_first_regeneration_matches_full_rebuild(self, project):
+        session_id, project_id, doc_ids, entries = project
+
+        texts = regenerate_documents(session_id, project_id, entries)
+
+        assert [texts[d] for d in doc_ids] == [_full(t, entries) for t in TEXTS]
+
+    def test_rename_patches_only_affected_documents(self, project, monkeypatch):
+        session_id, project_id, doc_ids, entries = project
+        regenerate_documents(session_id, project_id, entries)
+        untouched = session_manager.get_document(session_id, doc_ids[2]).anonymized
+
+        def no_rescan(*args, **kwargs):
+            raise AssertionError("rename must not rescan documents")
+
+        monkeypatch.setattr(document_regeneration, "build_segments", no_rescan)
+        entries[2]["alias"] = "Empresa_A"
+        texts = regenerate_documents(session_id, project_id, entries)
+
+        assert [texts[d] for d in doc_ids] == [_full(t, entries) for t in TEXTS]
+        assert "Empresa_A" in texts[doc_ids[1]]
+        assert session_manager.get_document(session_id, doc_ids[2]).anonymized is untouched
+
+    def test_deletion_reexposes_only_its_segments(self, project):
+        session_id, project_id, doc_ids, entries = project
+        regenerate_documents(session_id, project_id, entries)
+
+        remaining = [e for e in entries if e["alias"] != "Org_001"]
+        texts = regenerate_documents(session_id, project_id, remaining)
+
+        assert [texts[d] for d in doc_ids] == [_full(t, remaining) for t in TEXTS]
+        assert "Acme Abogados" in texts[doc_ids[1]]
+
+    def test_new_entry_triggers_full_rebuild(self, project):
+        session_id, project_id, doc_ids, entries = project
+        regenerate_documents(session_id, project_id, entries)
+
+        extended = entries + [_entry("Documento", "Doc_X")]
+        texts = regenerate_documents(session_id, project_id, extended)
+
+        assert [texts[d] for d in doc_ids] == [_full(t, extended) for t in TEXTS]
+
+    def test_merged_originals_keep_surviving_alias(self, project):
+        session_id, project_id, doc_ids, entries = project
+        survivor = dict(entries[0], merged_originals=["Rafael Durán Calvente", "Acme Abogados"])
+
+        texts = regenerate_documents(session_id, project_id, [survivor])
+
+        assert "Acme" not in texts[doc_ids[1]]
+        assert texts[doc_ids[1]] == "Persona_001 representa a Persona_001."
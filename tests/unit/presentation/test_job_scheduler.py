@@ -0,0 +1,160 @@
+"""
+Tests for the document processing job scheduler.
+
+Covers dispatch order (priority, then project turns), the worker bound,
+backpressure and pause/resume/cancel on queued documents.
+"""
+import asyncio
+from uuid import uuid4
+
+import pytest
+
+from contextsafe.api.services.job_scheduler import (
+    DocumentJobScheduler,
+    JobPriority,
+    QueueFullError,
+)
+from contextsafe.api.session_manager import session_manager
+from contextsafe.domain.document_processing.entities import BatchJobStatus
+
+
+class FakePipeline:
+    """Records processed documents; fails the ones whose content is 'fail'."""
+
+    def __init__(self) -> None:
+        self.order: list[str] = []
+        self.running = 0
+        self.max_running = 0
+        self.gate = asyncio.Event()
+        self.gate.set()
+
+    async def __call__(self, document_id: str, project_id: str, session_id: str) -> None:
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        self.order.append(document_id)
+        await self.gate.wait()
+        await asyncio.sleep(0)
+        doc = session_manager.get_document(session_id, document_id)
+        state = "error" if doc.content == "fail" else "completed"
+        session_manager.update_document(session_id, document_id, state=state)
+        self.running -= 1
+
+
+@pytest.fixture()
+def session():
+    session = session_manager.get_or_create_local_session()
+    created: list[str] = []
+
+    def add(project_id: str, count: int, content: str = "texto") -> list[str]:
+        docs = [
+            session_manager.add_document(
+                session.id, "doc.txt", 1, project_id=project_id, content=content
+            ).id
+            for _ in range(count)
+        ]
+        created.extend(docs)
+        return docs
+
+    yield session.id, add
+    for doc_id in created:
+        session.documents.pop(doc_id, None)
+
+
+async def _drain(scheduler: DocumentJobScheduler, *jobs) -> None:
+    for _ in range(1000):
+        if all(job.is_completed for job in jobs):
+            break
+        await asyncio.sleep(0)
+    await scheduler.close()
+
+
+class TestDocumentJobScheduler:
+    async def test_interactive_first_then_projects_take_turns(self, session):
+        session_id, add = session
+        project_a, project_b = str(uuid4()), str(uuid4())
+        bulk_a, bulk_b, single = add(project_a, 3), add(project_b, 2), add(project_b, 1)
+        pipeline = FakePipeline()
+        pipeline.gate.clear()
+        scheduler = DocumentJobScheduler(pipeline, workers=1)
+
+        job_a = scheduler.submit(session_id, project_a, bulk_a)
+        await asyncio.sleep(0)  # the worker takes bulk_a[0] and blocks
+        job_b = scheduler.submit(session_id, project_b, bulk_b)
+        job_single = scheduler.submit(session_id, project_b, single, JobPriority.INTERACTIVE)
+        pipeline.gate.set()
+        await _drain(scheduler, job_a, job_b, job_single)
+
+        assert pipeline.order == [
+            bulk_a[0],
+            single[0],
+            bulk_a[1],
+            bulk_b[0],
+            bulk_a[2],
+            bulk_b[1],
+        ]
+        assert job_a.status == BatchJobStatus.COMPLETED
+        assert job_a.processed_documents == 3
+
+    async def test_workers_bound_concurrency(self, session):
+        session_id, add = session
+        project = str(uuid4())
+        pipeline = FakePipeline()
+        scheduler = DocumentJobScheduler(pipeline, workers=2)
+
+        job = scheduler.submit(session_id, project, add(project, 6))
+        await _drain(scheduler, job)
+
+        assert pipeline.max_running == 2
+        assert len(pipeline.order) == 6
+
+    async def test_full_queue_rejects_submission(self, session):
+        session_id, add = session
+        project = str(uuid4())
+        pipeline = FakePipeline()
+        pipeline.gate.clear()
+        scheduler = DocumentJobScheduler(pipeline, workers=1, max_queued=3)
+
+        scheduler.submit(session_id, project, add(project, 3))
+        with pytest.raises(QueueFullError):
+            scheduler.submit(session_id, project, add(project, 1))
+
+        await asyncio.sleep(0)  # one document leaves the queue
+        scheduler.submit(session_id, project, add(project, 1))
+        await scheduler.close()
+
+    async def test_failures_are_recorded_on_the_job(self, session):
+        session_id, add = session
+        project = str(uuid4())
+        scheduler = DocumentJobScheduler(FakePipeline(), workers=1)
+
+        job = scheduler.submit(session_id, project, add(project, 1) + add(project, 1, "fail"))
+        await _drain(scheduler, job)
+
+        assert job.status == BatchJobStatus.COMPLETED
+        assert job.failed_documents == 1
+
+    async def test_pause_resume_and_cancel(self, session):
+        session_id, add = session
+        project = str(uuid4())
+        pipeline = FakePipeline()
+        scheduler = DocumentJobScheduler(pipeline, workers=1)
+        paused, cancelled = add(project, 2), add(project, 2)
+
+        job = scheduler.submit(session_id, project, paused)
+        scheduler.pause(str(job.id))
+        other = scheduler.submit(session_id, project, cancelled)
+        scheduler.cancel(str(other.id))
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        assert pipeline.order == []
+        assert job.status == BatchJobStatus.PAUSED
+        assert other.status == BatchJobStatus.CANCELLED
+        assert session_manager.get_document(session_id, cancelled[0]).state == "pending"
+        assert scheduler.queued == 2
+
+        scheduler.resume(str(job.id))
+        await _drain(scheduler, job)
+
+        assert pipeline.order == paused
+        assert job.status == BatchJobStatus.COMPLETED
@@ -0,0 +1,54 @@
+"""
+Tests for the container's NER configuration.
+
+The composite NER service is built from one config, and the detection
+cache fingerprint is derived from the same values.
+"""
+import copy
+
+from contextsafe.api.dependencies.container import Container
+from contextsafe.application.compute_mode import ComputeMode
+
+
+class TestNerConfig:
+    def test_service_is_built_from_the_config(self):
+        config = Container._composite_ner_config(ComputeMode.CPU)
+        config["composite"]["tie_threshold"] = 0.25
+        config["spacy"]["confidence_default"] = 0.8
+        config["validator"]["margin_threshold"] = 0.2
+
+        service = Container._create_composite_ner_service(config)
+
+        assert service._tie_threshold == 0.25
+        assert service._adapters[1]._confidence_default == 0.8
+        assert service._type_validator.margin_threshold == 0.2
+
+    def test_fingerprint_follows_every_detection_setting(self, tmp_path):
+        config = Container._composite_ner_config(ComputeMode.CPU)
+        base = Container._ner_fingerprint(config)
+
+        changed = []
+        for section, key, value in [
+            ("roberta", "min_score", 0.9),
+            ("spacy", "confidence_default", 0.8),
+            ("composite", "tie_threshold", 0.25),
+            ("composite", "enable_type_validation", False),
+            ("validator", "model_name", "other-model"),
+            ("validator", "centroids_path", tmp_path / "centroids.json"),
+        ]:
+            variant = copy.deepcopy(config)
+            variant[section][key] = value
+            changed.append(Container._ner_fingerprint(variant))
+
+        assert base == Container._ner_fingerprint(copy.deepcopy(config))
+        assert len(set(changed) | {base}) == len(changed) + 1
+
+    def test_fingerprint_tracks_centroid_file_changes(self, tmp_path):
+        config = Container._composite_ner_config(ComputeMode.CPU)
+        centroids = tmp_path / "centroids.json"
+        config["validator"]["centroids_path"] = centroids
+
+        missing = Container._ner_fingerprint(config)
+        centroids.write_text("{}")
+
+        assert Container._ner_fingerprint(config) != missing
@@ -0,0 +1,162 @@
+"""
+Tests for the progress WebSocket handler.
+
+Progress updates are coalesced per document (latest wins), stage changes
+and terminal messages go out right away, and a slow client does not hold
+back the sender. Project channels send a snapshot, then merged deltas.
+"""
+import asyncio
+import json
+import time
+from uuid import uuid4
+
+from fastapi import WebSocketDisconnect
+
+from contextsafe.api.websocket.progress_handler import ProgressWebSocketHandler
+
+
+class FakeWebSocket:
+    """Collects sent messages; disconnects when closed."""
+
+    def __init__(self, send_delay: float = 0.0) -> None:
+        self.sent: list[dict] = []
+        self.send_delay = send_delay
+        self.closed = asyncio.Event()
+
+    async def accept(self) -> None:
+        pass
+
+    async def receive_text(self) -> str:
+        await self.closed.wait()
+        raise WebSocketDisconnect()
+
+    async def send_text(self, message: str) -> None:
+        if self.send_delay:
+            await asyncio.sleep(self.send_delay)
+        self.sent.append(json.loads(message))
+
+    def types(self) -> list[str]:
+        return [message["type"] for message in self.sent]
+
+
+async def _connect(handler: ProgressWebSocketHandler, document_id, websocket: FakeWebSocket):
+    task = asyncio.create_task(handler.connect(websocket, document_id))
+    await asyncio.sleep(0)
+    return task
+
+
+async def _disconnect(websocket: FakeWebSocket, task: asyncio.Task) -> None:
+    websocket.closed.set()
+    await task
+
+
+class TestProgressWebSocketHandler:
+    async def test_updates_are_coalesced_to_the_latest(self):
+        handler = ProgressWebSocketHandler(max_rate_hz=20)
+        document_id = uuid4()
+        websocket = FakeWebSocket()
+        task = await _connect(handler, document_id, websocket)
+
+        for i in range(100):
+            await handler.send_progress(document_id, "detecting", i / 100)
+        await asyncio.sleep(0.1)
+        await handler.send_complete(document_id)
+        await asyncio.sleep(0.01)
+        await _disconnect(websocket, task)
+
+        progress = [m["progress"] for m in websocket.sent if m["type"] == "progress"]
+        assert progress == [0.0, 0.99]
+        assert websocket.types()[0] == "connected"
+        assert websocket.types()[-1] == "complete"
+
+    async def test_stage_changes_and_completion_are_not_delayed(self):
+        handler = ProgressWebSocketHandler(max_rate_hz=1)
+        document_id = uuid4()
+        websocket = FakeWebSocket()
+        task = await _connect(handler, document_id, websocket)
+
+        await handler.send_progress(document_id, "ingesting", 0.0)
+        await handler.send_progress(document_id, "ingesting", 0.05)
+        await handler.send_progress(document_id, "detecting", 0.1)
+        await handler.send_complete(document_id)
+        await asyncio.sleep(0.01)
+        await _disconnect(websocket, task)
+
+        assert [(m["type"], m.get("stage")) for m in websocket.sent[1:]] == [
+            ("progress", "ingesting"),
+            ("progress", "detecting"),
+            ("complete", None),
+        ]
+
+    async def test_slow_client_does_not_block_publishers(self):
+        handler = ProgressWebSocketHandler(max_rate_hz=0)
+        document_id = uuid4()
+        slow, fast = FakeWebSocket(send_delay=0.5), FakeWebSocket()
+        slow_task = await _connect(handler, document_id, slow)
+        fast_task = await _connect(handler, document_id, fast)
+
+        started = time.monotonic()
+        for i in range(5):
+            await handler.send_progress(document_id, "detecting", i / 10)
+        await handler.send_error(document_id, "fallo")
+        elapsed = time.monotonic() - started
+        await asyncio.sleep(0.01)
+
+        assert elapsed < 0.1
+        assert fast.types() == ["connected"] + ["progress"] * 5 + ["error"]
+        assert handler.get_document_connections(document_id) == 2
+        await _disconnect(slow, slow_task)
+        await _disconnect(fast, fast_task)
+        assert handler.get_active_count() == 0
+
+
+class TestProjectChannel:
+    async def test_snapshot_then_deltas_with_counters(self):
+        handler = ProgressWebSocketHandler(max_rate_hz=0)
+        project_id = str(uuid4())
+        first, second = uuid4(), uuid4()
+        handler.bind_document(first, project_id)
+        handler.bind_document(second, project_id)
+        await handler.send_progress(first, "detecting", 0.25)
+
+        websocket = FakeWebSocket()
+        task = asyncio.create_task(handler.connect_project(websocket, project_id))
+        await asyncio.sleep(0.01)
+        await handler.send_complete(first)
+        await asyncio.sleep(0.01)
+        await handler.send_error(second, "fallo")
+        await asyncio.sleep(0.01)
+        await _disconnect(websocket, task)
+
+        snapshot, completed, failed = websocket.sent
+        assert snapshot["snapshot"] is True
+        assert snapshot["documents"] == {
+            str(first): {"s": "detecting", "p": 25},
+            str(second): {"s": "queued", "p": 0},
+        }
+        assert completed["documents"] == {str(first): {"s": "completed", "p": 100}}
+        assert (completed["active"], completed["completed"], completed["total"]) == (1, 1, 2)
+        assert failed["documents"] == {str(second): {"s": "error", "p": 0, "m": "fallo"}}
+        assert (failed["active"], failed["failed"]) == (0, 1)
+
+    async def test_slow_subscriber_gets_merged_latest_state(self):
+        handler = ProgressWebSocketHandler(max_rate_hz=0)
+        project_id = str(uuid4())
+        documents = [uuid4() for _ in range(3)]
+        for document_id in documents:
+            handler.bind_document(document_id, project_id)
+
+        websocket = FakeWebSocket(send_delay=0.05)
+        task = asyncio.create_task(handler.connect_project(websocket, project_id))
+        await asyncio.sleep(0.01)  # snapshot is being sent
+        for i in range(50):
+            for document_id in documents:
+                await handler.send_progress(document_id, "anonymizing", i / 100)
+        await asyncio.sleep(0.15)
+        await _disconnect(websocket, task)
+
+        assert len(websocket.sent) == 2
+        assert websocket.sent[1]["documents"] == {
+            str(document_id): {"s": "anonymizing", "p": 49} for document_id in documents
+        }
+        assert handler.get_active_count() == 0
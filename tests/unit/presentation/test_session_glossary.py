@@ -0,0 +1,57 @@
+"""
+Tests for glossary occurrence accounting in the session manager.
+
+A document's alias counts are merged in one pass through the alias index;
+the glossary list keeps its order.
+"""
+from collections import Counter
+
+from contextsafe.api.session_manager import SessionManager
+
+
+def _new_entry(alias: str, count: int) -> dict:
+    return {"alias": alias, "original_text": alias.lower(), "occurrences": count}
+
+
+class TestMergeGlossaryOccurrences:
+    def test_bumps_existing_and_appends_new_aliases(self):
+        manager = SessionManager()
+        session = manager.get_or_create_local_session()
+        manager.set_glossary(session.id, "p", [_new_entry("Persona_001", 2)])
+
+        manager.merge_glossary_occurrences(
+            session.id, "p", Counter({"Persona_001": 3, "Org_001": 1}), _new_entry
+        )
+        manager.merge_glossary_occurrences(session.id, "p", Counter({"Org_001": 4}), _new_entry)
+
+        glossary = manager.get_glossary(session.id, "p")
+        assert [(e["alias"], e["occurrences"]) for e in glossary] == [
+            ("Persona_001", 5),
+            ("Org_001", 5),
+        ]
+
+    def test_first_entry_of_duplicated_alias_gets_the_count(self):
+        manager = SessionManager()
+        session = manager.get_or_create_local_session()
+        manager.add_glossary_entry(session.id, "p", _new_entry("Persona_001", 1))
+        manager.add_glossary_entry(session.id, "p", _new_entry("Persona_001", 1))
+
+        manager.merge_glossary_occurrences(session.id, "p", Counter({"Persona_001": 2}), _new_entry)
+
+        assert [e["occurrences"] for e in manager.get_glossary(session.id, "p")] == [3, 1]
+
+    def test_alias_renamed_in_place_is_reindexed(self):
+        manager = SessionManager()
+        session = manager.get_or_create_local_session()
+        manager.set_glossary(session.id, "p", [_new_entry("Persona_001", 1)])
+        manager.get_glossary(session.id, "p")[0]["alias"] = "Ana"
+
+        manager.merge_glossary_occurrences(
+            session.id, "p", Counter({"Persona_001": 1, "Ana": 1}), _new_entry
+        )
+
+        glossary = manager.get_glossary(session.id, "p")
+        assert [(e["alias"], e["occurrences"]) for e in glossary] == [
+            ("Ana", 2),
+            ("Persona_001", 1),
+        ]